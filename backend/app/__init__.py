@@ -1,5 +1,16 @@
 """OpenCampus backend application package."""
 
-from app.main import app, create_app
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # Importing ``app.main`` builds the whole application; defer it so CLIs and workers
+    # importing ``app.core`` or ``app.database`` modules do not pay for routes and models.
+    if name in ("app", "create_app"):
+        from app import main
+
+        return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["app", "create_app"]
@@ -1,9 +1,64 @@
-"""Authentication dependency placeholders."""
+"""Authentication dependencies resolving bearer tokens to principals."""
 
+from typing import Optional
 
-def get_current_user():
-    """Placeholder for retrieving the current authenticated user."""
-    raise NotImplementedError
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlmodel import Session
 
+from app.auth.principals import load_principal, resolve_principal
+from app.auth.tokens import ACCESS_TOKEN, Principal, TokenError, decode_token
+from app.core.config import settings
+from app.database.session import get_write_session
+from app.models.enums import UserRole
 
-__all__ = ["get_current_user"]
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    session: Session = Depends(get_write_session),
+) -> Principal:
+    """Resolve the bearer access token, touching the database only when claims are stale."""
+    if credentials is None:
+        raise _unauthorized("Not authenticated.")
+    try:
+        claims = decode_token(credentials.credentials, ACCESS_TOKEN, settings)
+    except TokenError as exc:
+        raise _unauthorized(str(exc)) from exc
+    if settings.auth_resolve_from_db:
+        principal = load_principal(session, claims.principal.id)
+    else:
+        principal = resolve_principal(session, claims)
+    if principal is None:
+        raise _unauthorized("User no longer exists.")
+    return principal
+
+
+def require_moderator(user: Principal = Depends(get_current_user)) -> Principal:
+    """Allow only moderators through."""
+    if user.role != UserRole.MODERATOR:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Moderator role required."
+        )
+    return user
+
+
+def require_validated(user: Principal = Depends(get_current_user)) -> Principal:
+    """Allow only users whose enrolment has been validated through."""
+    if not user.validated:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Validated account required."
+        )
+    return user
+
+
+__all__ = ["bearer_scheme", "get_current_user", "require_moderator", "require_validated"]
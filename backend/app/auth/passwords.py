@@ -0,0 +1,144 @@
+"""Password hashing on a dedicated, bounded worker pool with admission control."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.core.config import Settings, settings
+
+HashPolicy = Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...]]
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the hashing pool already holds as much work as it may queue."""
+
+
+def hash_policy(settings: Settings) -> HashPolicy:
+    """Return the hashable CryptContext configuration selected by settings."""
+    options = {
+        "bcrypt__rounds": settings.password_bcrypt_rounds,
+        "argon2__time_cost": settings.password_argon2_time_cost,
+        "argon2__memory_cost": settings.password_argon2_memory_cost,
+        "argon2__parallelism": settings.password_argon2_parallelism,
+    }
+    schemes = tuple(settings.password_schemes)
+    used = {name: value for name, value in options.items() if name.split("__")[0] in schemes}
+    return schemes, tuple(sorted(used.items()))
+
+
+@lru_cache(maxsize=4)
+def crypt_context(policy: HashPolicy) -> CryptContext:
+    """Build (once per worker) the CryptContext for a policy.
+
+    The first scheme hashes new passwords; hashes in other schemes or with other
+    cost parameters still verify but are reported as needing a rehash.
+    """
+    schemes, options = policy
+    return CryptContext(schemes=list(schemes), deprecated="auto", **dict(options))
+
+
+def _hash(policy: HashPolicy, password: str) -> str:
+    return crypt_context(policy).hash(password)
+
+
+def _verify(policy: HashPolicy, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+    return crypt_context(policy).verify_and_update(password, password_hash)
+
+
+class PasswordHasher:
+    """Run hashing and verification off the event loop on a bounded pool.
+
+    At most ``workers`` jobs run at once and at most ``queue_limit`` more wait; further
+    submissions fail fast with :class:`PasswordHasherBusy` instead of piling up.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.policy = hash_policy(settings)
+        self.workers = settings.password_hash_workers or os.cpu_count() or 1
+        self.capacity = self.workers + settings.password_hash_queue_limit
+        self.use_processes = settings.password_hash_executor == "process"
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        # A real hash to verify against for unknown users, so their logins cost the same.
+        self._dummy_hash: Optional[str] = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="password-hash"
+                    )
+            return self._executor
+
+    def _submit(self, function: Callable[..., Any], *args: Any) -> Future:
+        executor = self._get_executor()
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise PasswordHasherBusy("Password hashing capacity exhausted; retry shortly.")
+            self._in_flight += 1
+        try:
+            future = executor.submit(function, self.policy, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the current policy."""
+        return await asyncio.wrap_future(self._submit(_hash, password))
+
+    async def verify(
+        self, password: str, password_hash: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """Check a password, returning ``(valid, replacement_hash_or_None)``.
+
+        A replacement hash is returned when the stored one uses outdated parameters.
+        Passing ``None`` as the hash spends the same work and returns ``(False, None)``.
+        """
+        if password_hash is None:
+            if self._dummy_hash is None:
+                self._dummy_hash = await self.hash("not-a-real-password")
+            await asyncio.wrap_future(self._submit(_verify, password, self._dummy_hash))
+            return False, None
+        return await asyncio.wrap_future(self._submit(_verify, password, password_hash))
+
+    def hash_blocking(self, password: str) -> str:
+        """Hash from synchronous code such as CLIs and data loaders."""
+        return self._submit(_hash, password).result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(settings)
+
+__all__ = [
+    "PasswordHasher",
+    "PasswordHasherBusy",
+    "crypt_context",
+    "hash_policy",
+    "password_hasher",
+]
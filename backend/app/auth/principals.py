@@ -0,0 +1,112 @@
+"""Resolve token claims to principals through a TTL cache invalidated on user changes."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import attributes
+from sqlmodel import Session
+
+from app.auth.tokens import Principal, TokenClaims
+from app.core.config import settings
+from app.models import User
+from app.services.cache import MISSING, build_cache_backend
+
+principal_cache = build_cache_backend(
+    settings,
+    "principals",
+    max_entries=settings.principal_cache_entries,
+    ttl_seconds=settings.access_token_ttl_seconds,
+)
+# Change markers must outlive every access token issued before the change. They live
+# apart from the LRU-bounded principals, which could otherwise push a marker out and let
+# a token from before a downgrade through again; only the token lifetime expires them.
+change_markers = build_cache_backend(
+    settings,
+    "principal_changes",
+    ttl_seconds=settings.access_token_ttl_seconds,
+    bounded=False,
+)
+
+AUTHORIZATION_FIELDS = ("role", "validated", "course_id")
+
+_PENDING_USERS = "principal_cache_pending_users"
+
+
+def _principal_key(user_id: int) -> str:
+    return f"principal:{user_id}"
+
+
+def _changed_key(user_id: int) -> str:
+    return f"changed:{user_id}"
+
+
+def load_principal(session: Session, user_id: int) -> Optional[Principal]:
+    """Read a principal from the database and cache it."""
+    user = session.get(User, user_id)
+    if user is None:
+        return None
+    principal = Principal.from_user(user)
+    principal_cache.set(_principal_key(user_id), principal.as_dict())
+    return principal
+
+
+def resolve_principal(session: Session, claims: TokenClaims) -> Optional[Principal]:
+    """Return the current principal behind verified access token claims.
+
+    Claims are trusted as-is unless the user's authorization fields changed after
+    the token was issued, in which case the database row (cached) wins.
+    """
+    user_id = claims.principal.id
+    cached = principal_cache.get(_principal_key(user_id))
+    if cached is not MISSING:
+        return Principal.from_dict(cached)
+    changed_at = change_markers.get(_changed_key(user_id))
+    if changed_at is MISSING or claims.issued_at > changed_at:
+        return claims.principal
+    return load_principal(session, user_id)
+
+
+def invalidate_principals(user_ids: Set[int]) -> None:
+    """Forget cached principals and distrust tokens issued before now."""
+    now = time.time()
+    for user_id in user_ids:
+        principal_cache.delete(_principal_key(user_id))
+        change_markers.set(_changed_key(user_id), now)
+
+
+def _collect_changed_users(session: Session, flush_context: Any) -> None:
+    """Remember users whose authorization fields changed or who were deleted."""
+    changed = {obj.id for obj in session.deleted if isinstance(obj, User)}
+    for obj in session.dirty:
+        if isinstance(obj, User) and any(
+            attributes.get_history(obj, name).has_changes() for name in AUTHORIZATION_FIELDS
+        ):
+            changed.add(obj.id)
+    if changed:
+        session.info.setdefault(_PENDING_USERS, set()).update(changed)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    invalidate_principals(session.info.pop(_PENDING_USERS, set()))
+
+
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_USERS, None)
+
+
+event.listen(Session, "after_flush", _collect_changed_users)
+event.listen(Session, "after_commit", _invalidate_after_commit)
+event.listen(Session, "after_rollback", _discard_after_rollback)
+
+
+__all__ = [
+    "AUTHORIZATION_FIELDS",
+    "change_markers",
+    "invalidate_principals",
+    "load_principal",
+    "principal_cache",
+    "resolve_principal",
+]
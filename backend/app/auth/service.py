@@ -0,0 +1,36 @@
+"""Credential checks for user login."""
+
+from typing import Optional
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.auth.passwords import PasswordHasher, password_hasher
+from app.models import User
+
+
+async def authenticate_user(
+    session: AsyncSession,
+    email: str,
+    password: str,
+    hasher: PasswordHasher = password_hasher,
+) -> Optional[User]:
+    """Return the user owning these credentials, or ``None``.
+
+    Unknown e-mails cost the same hashing work as wrong passwords. A correct password
+    stored with outdated hash parameters is rehashed and saved on the way through.
+    """
+    result = await session.exec(select(User).where(User.email == email))
+    user = result.first()
+    valid, replacement = await hasher.verify(password, user.password_hash if user else None)
+    if not valid or user is None:
+        return None
+    if replacement is not None:
+        user.password_hash = replacement
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+    return user
+
+
+__all__ = ["authenticate_user"]
@@ -0,0 +1,161 @@
+"""HMAC-signed access and refresh tokens carrying the caller's authorization claims."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from app.core.config import Settings
+from app.models import User
+from app.models.enums import UserRole
+
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+
+_HEADER = {"alg": "HS256", "typ": "JWT"}
+_EPHEMERAL_SECRET = secrets.token_urlsafe(32)
+
+
+class TokenError(ValueError):
+    """Raised when a token is malformed, forged, expired or of the wrong type."""
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authorization-relevant facts about an authenticated user."""
+
+    id: int
+    role: UserRole
+    validated: bool
+    course_id: Optional[int] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            role=UserRole(user.role),
+            validated=user.validated,
+            course_id=user.course_id,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Principal":
+        return cls(
+            id=int(data["id"]),
+            role=UserRole(data["role"]),
+            validated=bool(data["validated"]),
+            course_id=data.get("course_id"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["role"] = self.role.value
+        return data
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """Verified contents of a token."""
+
+    principal: Principal
+    token_type: str
+    issued_at: float
+    expires_at: float
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def signing_secret(settings: Settings) -> str:
+    """Return the token signing key, refusing to run without a shared one.
+
+    Tokens must verify on every worker and across restarts, so a key generated per
+    process is only used when ``auth_ephemeral_secret`` asks for it in development.
+    """
+    if settings.auth_secret_key:
+        return settings.auth_secret_key
+    if settings.auth_ephemeral_secret:
+        return _EPHEMERAL_SECRET
+    raise RuntimeError(
+        "auth_secret_key is not set. Configure one key shared by all workers, or set "
+        "auth_ephemeral_secret=true for local development."
+    )
+
+
+def _sign(secret: str, signing_input: bytes) -> str:
+    return _b64encode(hmac.new(secret.encode(), signing_input, hashlib.sha256).digest())
+
+
+def issue_token(
+    principal: Principal, token_type: str, settings: Settings, now: Optional[float] = None
+) -> str:
+    """Return a signed JWT (HS256) for ``principal``."""
+    now = time.time() if now is None else now
+    lifetime = (
+        settings.access_token_ttl_seconds
+        if token_type == ACCESS_TOKEN
+        else settings.refresh_token_ttl_seconds
+    )
+    payload = {
+        "sub": str(principal.id),
+        "role": principal.role.value,
+        "validated": principal.validated,
+        "course_id": principal.course_id,
+        "typ": token_type,
+        "iat": now,
+        "exp": now + lifetime,
+    }
+    segments = [
+        _b64encode(json.dumps(_HEADER, separators=(",", ":")).encode()),
+        _b64encode(json.dumps(payload, separators=(",", ":")).encode()),
+    ]
+    signing_input = ".".join(segments).encode()
+    return ".".join([*segments, _sign(signing_secret(settings), signing_input)])
+
+
+def decode_token(
+    token: str, expected_type: str, settings: Settings, now: Optional[float] = None
+) -> TokenClaims:
+    """Verify signature, expiry and type of ``token`` and return its claims."""
+    try:
+        header, payload, signature = token.split(".")
+    except ValueError as exc:
+        raise TokenError("Malformed token.") from exc
+    expected = _sign(signing_secret(settings), f"{header}.{payload}".encode())
+    if not hmac.compare_digest(signature, expected):
+        raise TokenError("Invalid token signature.")
+    try:
+        claims = json.loads(_b64decode(payload))
+        principal = Principal.from_dict({**claims, "id": claims["sub"]})
+        token_type = claims["typ"]
+        issued_at, expires_at = float(claims["iat"]), float(claims["exp"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise TokenError("Malformed token claims.") from exc
+    if token_type != expected_type:
+        raise TokenError(f"Expected a {expected_type} token.")
+    if (time.time() if now is None else now) >= expires_at:
+        raise TokenError("Token has expired.")
+    return TokenClaims(principal, token_type, issued_at, expires_at)
+
+
+__all__ = [
+    "ACCESS_TOKEN",
+    "Principal",
+    "REFRESH_TOKEN",
+    "TokenClaims",
+    "TokenError",
+    "decode_token",
+    "issue_token",
+    "signing_secret",
+]
@@ -2,6 +2,7 @@
 
 from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List, Optional
 
 from pydantic import BaseSettings
 
@@ -12,6 +13,96 @@ class Settings(BaseSettings):
     project_name: str = "OpenCampus API"
     api_v1_prefix: str = "/api/v1"
     sqlite_file: Path = Path("opencampus.db")
+    async_database_url: Optional[str] = None
+    async_session_routers: List[str] = []
+    read_database_url: Optional[str] = None
+    async_read_database_url: Optional[str] = None
+    replica_sync_seconds: float = 0.0
+    auto_migrate: bool = True
+    read_your_writes_seconds: float = 10.0
+    read_your_writes_cookie: str = "oc_recent_write"
+
+    sqlite_production_profile: bool = False
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 268_435_456
+    sqlite_cache_size: int = -65_536
+    sqlite_busy_timeout_ms: int = 5_000
+    sqlite_temp_store: str = "MEMORY"
+    database_pool_size: int = 20
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0
+
+    cache_backend: str = "memory"
+    cache_max_entries: int = 10_000
+    cache_ttl_seconds: float = 300.0
+    cache_directory: Path = Path(".cache/catalogue")
+
+    response_cache_enabled: bool = True
+    response_cache_max_bytes: int = 67_108_864
+    response_cache_max_entry_bytes: int = 1_048_576
+    response_cache_ttl_seconds: float = 300.0
+
+    fast_serialization: bool = False
+
+    moderation_claim_seconds: int = 900
+    enforce_query_budgets: bool = False
+
+    sql_instrumentation: bool = True
+    slow_query_threshold_ms: float = 200.0
+    slow_query_max_statement_length: int = 2_000
+    server_timing_statements: int = 3
+    slow_request_threshold_ms: float = 1_000.0
+    slow_query_log_file: Optional[Path] = None
+
+    password_schemes: List[str] = ["bcrypt"]
+    password_bcrypt_rounds: int = 12
+    password_argon2_time_cost: int = 3
+    password_argon2_memory_cost: int = 65_536
+    password_argon2_parallelism: int = 1
+    password_hash_executor: str = "thread"
+    password_hash_workers: Optional[int] = None
+    password_hash_queue_limit: int = 64
+
+    # Shared by every worker; startup fails without it unless the per-process development
+    # key is allowed explicitly.
+    auth_secret_key: Optional[str] = None
+    auth_ephemeral_secret: bool = False
+    access_token_ttl_seconds: int = 300
+    refresh_token_ttl_seconds: int = 86_400
+    principal_cache_entries: int = 50_000
+    auth_resolve_from_db: bool = False
+
+    job_workers: int = 2
+    job_poll_interval_seconds: float = 1.0
+    job_batch_size: int = 50
+    job_lease_seconds: float = 60.0
+    job_backoff_base_seconds: float = 2.0
+    job_backoff_max_seconds: float = 600.0
+    job_retention_seconds: float = 86_400.0
+
+    ranking_prior_weight: float = 10.0
+    ranking_refresh_seconds: float = 300.0
+
+    trend_semester_start_months: List[int] = [1, 7]
+
+    export_batch_size: int = 5_000
+    export_author_key: Optional[str] = None
+    export_roles: List[str] = ["MODERATOR", "INSTITUTION"]
+
+    rate_limit_enabled: bool = True
+    rate_limit_max_keys: int = 100_000
+    rate_limit_trust_forwarded_for: bool = False
+    rate_limits_per_user: Dict[str, str] = {
+        "reviews.create": "10/hour",
+        "comments.create": "60/hour",
+        "change_requests.create": "20/hour",
+    }
+    rate_limits_per_address: Dict[str, str] = {
+        "reviews.create": "100/hour",
+        "comments.create": "300/hour",
+        "change_requests.create": "100/hour",
+    }
 
     class Config:
         env_file = ".env"
@@ -25,9 +116,20 @@ class Settings(BaseSettings):
 
     @property
     def database_url_async(self) -> str:
-        """Return the async database URL (reserved for future use)."""
+        """Return the async database URL, defaulting to aiosqlite on the same file."""
+        if self.async_database_url:
+            return self.async_database_url
         return f"sqlite+aiosqlite:///{self.sqlite_file.resolve()}"
 
+    @property
+    def read_database_url_async(self) -> Optional[str]:
+        """Return the async reader URL, deriving aiosqlite from a SQLite ``read_database_url``."""
+        if self.async_read_database_url:
+            return self.async_read_database_url
+        if self.read_database_url and self.read_database_url.startswith("sqlite:"):
+            return "sqlite+aiosqlite:" + self.read_database_url[len("sqlite:") :]
+        return None
+
 
 @lru_cache
 
@@ -0,0 +1,176 @@
+"""In-process metrics registry rendered in the Prometheus text exposition format."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_labels(self.label_names, labels)} {_number(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label set."""
+
+    kind = "gauge"
+
+    def set(self, *label_values: str, value: float) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+
+class Summary:
+    """Sum, count and sliding-window quantiles of observations per label set."""
+
+    kind = "summary"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        window: int = 2048,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.quantiles = tuple(quantiles)
+        self.window = window
+        self._series: Dict[LabelValues, Tuple[Deque[float], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = (deque(maxlen=self.window), [0.0, 0.0])
+            recent, totals = series
+            recent.append(value)
+            totals[0] += value
+            totals[1] += 1
+
+    def quantile(self, q: float, *label_values: str) -> Optional[float]:
+        """Return the ``q`` quantile of the recent window, or ``None`` without data."""
+        with self._lock:
+            series = self._series.get(label_values)
+            ordered = sorted(series[0]) if series else []
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            snapshot = [
+                (labels, sorted(recent), totals[0], totals[1])
+                for labels, (recent, totals) in sorted(self._series.items())
+            ]
+        lines = []
+        for labels, ordered, total, count in snapshot:
+            for q in self.quantiles:
+                value = ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+                extra = f'quantile="{q}"'
+                lines.append(f"{self.name}{_labels(self.label_names, labels, extra)} {value!r}")
+            suffix = _labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{suffix} {total!r}")
+            lines.append(f"{self.name}_count{suffix} {_number(count)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics exposed together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def summary(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Summary:
+        return self._register(Summary(name, documentation, label_names))
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+__all__ = [
+    "Counter",
+    "DEFAULT_QUANTILES",
+    "Gauge",
+    "MetricsRegistry",
+    "PROMETHEUS_CONTENT_TYPE",
+    "Summary",
+    "registry",
+]
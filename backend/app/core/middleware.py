@@ -0,0 +1,149 @@
+"""ASGI middleware reporting per-request database work and latency."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping
+
+from app.core.config import Settings
+from app.core.metrics import MetricsRegistry
+from app.database.instrumentation import (
+    QueryStats,
+    collect_query_stats,
+    current_route,
+    slow_query_logger,
+)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+slow_request_logger = logging.getLogger("opencampus.http.slow")
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", UNMATCHED_ROUTE)
+
+
+def _describe(statement: str, limit: int = 60) -> str:
+    """Shorten a statement into a Server-Timing ``desc`` quoted-string."""
+    text = " ".join(statement.split())
+    if len(text) > limit:
+        text = text[: limit - 3] + "..."
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def server_timing(stats: QueryStats, total_ms: float) -> str:
+    """Format request and database timings as a ``Server-Timing`` header value."""
+    entries = [
+        f"app;dur={total_ms:.2f}",
+        f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries"',
+    ]
+    for index, (duration_ms, statement) in enumerate(stats.slowest_first(), 1):
+        entries.append(f'sql-{index};dur={duration_ms:.2f};desc="{_describe(statement)}"')
+    return ", ".join(entries)
+
+
+class RequestInstrumentationMiddleware:
+    """Collect query count, DB time and slowest statements for every HTTP request.
+
+    Results go to the ``Server-Timing`` response header, per-route latency summaries
+    in the metrics registry, and the slow-request log.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Settings, registry: MetricsRegistry) -> None:
+        self.app = app
+        self.settings = settings
+        labels = ("method", "route")
+        self.request_seconds = registry.summary(
+            "http_request_duration_seconds", "HTTP request latency by route.", labels
+        )
+        self.db_seconds = registry.summary(
+            "http_request_db_seconds", "Database time spent per HTTP request by route.", labels
+        )
+        self.db_queries = registry.summary(
+            "http_request_db_queries", "SQL statements issued per HTTP request by route.", labels
+        )
+        self.requests = registry.counter(
+            "http_requests_total", "HTTP requests by route and status.", labels + ("status",)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status: Dict[str, int] = {"code": 500}
+
+        with collect_query_stats(self.settings.server_timing_statements) as stats:
+            token = current_route.set(scope.get("path"))
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    status["code"] = message["status"]
+                    total_ms = (time.perf_counter() - started) * 1000
+                    headers: List[Any] = list(message.get("headers", []))
+                    headers.append((b"server-timing", server_timing(stats, total_ms).encode()))
+                    message["headers"] = headers
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                current_route.reset(token)
+                self._observe(scope, stats, status["code"], time.perf_counter() - started)
+
+    def _observe(self, scope: Scope, stats: QueryStats, status: int, seconds: float) -> None:
+        labels = (scope["method"], _route_template(scope))
+        self.request_seconds.observe(seconds, *labels)
+        self.db_seconds.observe(stats.total_ms / 1000, *labels)
+        self.db_queries.observe(stats.count, *labels)
+        self.requests.inc(*labels, str(status))
+        if seconds * 1000 >= self.settings.slow_request_threshold_ms:
+            slow_request_logger.warning(
+                json.dumps(
+                    {
+                        "event": "slow_request",
+                        "method": labels[0],
+                        "route": labels[1],
+                        "path": scope.get("path"),
+                        "status": status,
+                        "duration_ms": round(seconds * 1000, 3),
+                        "db_ms": round(stats.total_ms, 3),
+                        "queries": stats.count,
+                        "slowest": [
+                            {"duration_ms": round(duration, 3), "statement": statement}
+                            for duration, statement in stats.slowest_first()
+                        ],
+                    }
+                )
+            )
+
+
+def configure_slow_logs(settings: Settings) -> None:
+    """Write slow-query and slow-request records as JSON lines to the configured file."""
+    if settings.slow_query_log_file is None:
+        return
+    path = str(settings.slow_query_log_file.resolve())
+    for logger in (slow_query_logger, slow_request_logger):
+        if any(getattr(handler, "baseFilename", None) == path for handler in logger.handlers):
+            continue
+        handler = logging.FileHandler(path, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+
+
+__all__ = [
+    "RequestInstrumentationMiddleware",
+    "configure_slow_logs",
+    "server_timing",
+    "slow_request_logger",
+]
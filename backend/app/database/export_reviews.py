@@ -0,0 +1,52 @@
+"""Write the anonymized approved review export to a file or stdout."""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+from app.core.config import settings
+from app.database.session import engine
+from app.models.enums import ReviewTargetType
+from app.services.export import EXPORT_FORMATS, export_reviews, require_format
+
+
+def run(argv: Optional[Sequence[str]] = None) -> None:
+    """Stream the export chunk by chunk; memory use does not grow with the table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument("--output", type=Path, help="defaults to stdout")
+    parser.add_argument("--target-type", type=ReviewTargetType)
+    parser.add_argument("--since", type=datetime.fromisoformat)
+    parser.add_argument("--batch-size", type=int, default=settings.export_batch_size)
+    parser.add_argument(
+        "--author-key",
+        default=settings.export_author_key,
+        help="stable pseudonym key; a random key is used per export when omitted",
+    )
+    args = parser.parse_args(argv)
+    require_format(args.format)
+
+    chunks = export_reviews(
+        engine, args.format, args.batch_size, args.target_type, args.since, args.author_key
+    )
+    started = time.perf_counter()
+    written = 0
+    output = args.output.open("wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            output.write(chunk)
+            written += len(chunk)
+    finally:
+        if args.output:
+            output.close()
+    print(
+        f"Exported {written:,} bytes of {args.format} in {time.perf_counter() - started:.2f}s.",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,299 @@
+"""Stream institution, course, professor and subject records into the catalogue."""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy import Table, bindparam, select, tuple_
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+
+from app.database.search_index import deferred_catalogue_search
+from app.database.session import engine, init_db
+from app.models import Course, Institution, Professor, Subject
+from app.models.enums import ReviewTargetType
+from app.services.catalogue import catalogue_cache
+from app.services.versioning import INSTITUTION_LIST_KEY, bump_versions, resource_key
+
+DEFAULT_BATCH_SIZE = 25_000
+RECORD_FIELDS = ("institution", "course", "professor", "subject")
+
+_institution_table = Institution.__table__
+_course_table = Course.__table__
+_professor_table = Professor.__table__
+_subject_table = Subject.__table__
+
+
+@dataclass
+class ImportStats:
+    """Counters reported while an import runs."""
+
+    records: int = 0
+    inserted: Dict[str, int] = field(
+        default_factory=lambda: {name: 0 for name in RECORD_FIELDS}
+    )
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        inserted = ", ".join(f"{count} {name}" for name, count in self.inserted.items())
+        return (
+            f"{self.records} records in {self.elapsed:.2f}s ({self.rate:,.0f} rows/s); "
+            f"inserted {inserted}"
+        )
+
+
+class CatalogueRecord(NamedTuple):
+    """One denormalised import row; empty fields are ``None``."""
+
+    institution: str
+    course: Optional[str]
+    professor: Optional[str]
+    subject: Optional[str]
+
+
+def _field(value: Any) -> Optional[str]:
+    return None if value is None else str(value).strip() or None
+
+
+def _records(rows: Iterable[Tuple[int, Sequence[Any]]]) -> Iterator[CatalogueRecord]:
+    """Validate ``(line number, values)`` pairs; short rows end in empty fields."""
+    width = len(RECORD_FIELDS)
+    for line, row in rows:
+        values = [*row[:width], *[None] * (width - len(row))]
+        record = CatalogueRecord._make(map(_field, values))
+        if record.institution is None:
+            raise ValueError(f"Line {line}: record without institution: {row}")
+        if record.course is None and (record.professor or record.subject):
+            raise ValueError(f"Line {line}: professor or subject record without course: {row}")
+        yield record
+
+
+def _json_rows(lines: Iterable[str]) -> Iterator[Tuple[int, List[Any]]]:
+    for line, text in enumerate(lines, 1):
+        if not text.strip():
+            continue
+        try:
+            item = json.loads(text)
+        except ValueError as exc:
+            raise ValueError(f"Line {line}: invalid JSON: {exc}") from exc
+        if not isinstance(item, dict):
+            raise ValueError(f"Line {line}: expected a JSON object, got {text.strip()}")
+        yield line, [item.get(name) for name in RECORD_FIELDS]
+
+
+def _pick(values: Sequence[str], positions: Sequence[Optional[int]]) -> List[Optional[str]]:
+    """Reorder a CSV row into ``RECORD_FIELDS`` order; absent columns read as ``None``."""
+    return [
+        values[index] if index is not None and index < len(values) else None
+        for index in positions
+    ]
+
+
+def read_records(path: Path, file_format: Optional[str] = None) -> Iterator[CatalogueRecord]:
+    """Yield records from a CSV or JSON Lines file one line at a time.
+
+    Missing columns and trailing fields a CSV row leaves out read as empty. A malformed
+    line raises ``ValueError`` naming its line number before its batch is written.
+    """
+    file_format = file_format or ("jsonl" if path.suffix in (".jsonl", ".ndjson") else "csv")
+    if file_format not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported import format: {file_format}")
+    with path.open(newline="", encoding="utf-8") as handle:
+        if file_format == "jsonl":
+            yield from _records(_json_rows(handle))
+            return
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        missing = [name for name in RECORD_FIELDS[:2] if name not in header]
+        if missing:
+            raise ValueError(f"CSV header lacks columns: {', '.join(missing)}")
+        rows = ((reader.line_num, values) for values in reader if values)
+        if tuple(header) == RECORD_FIELDS:
+            yield from _records(rows)
+            return
+        positions = [header.index(name) if name in header else None for name in RECORD_FIELDS]
+        yield from _records((line, _pick(values, positions)) for line, values in rows)
+
+
+@lru_cache(maxsize=None)
+def _insert_ignore_sql(table: Table, columns: Tuple[str, ...]) -> str:
+    statement = sqlite_insert(table).values({name: bindparam(name) for name in columns})
+    compiled = statement.on_conflict_do_nothing().compile(dialect=sqlite.dialect())
+    if tuple(compiled.positiontup) != columns:
+        raise ValueError(f"Columns must follow table order: {tuple(compiled.positiontup)}")
+    return str(compiled)
+
+
+def _insert_ignore(
+    connection: Connection, table: Table, columns: Tuple[str, ...], rows: Sequence[Tuple]
+) -> int:
+    """Insert ``rows`` in one executemany, skipping those hitting a unique constraint.
+
+    The Core statement is compiled once and fed positional tuples, which avoids
+    building and processing a parameter dictionary for every row.
+    """
+    if not rows:
+        return 0
+    result = connection.exec_driver_sql(_insert_ignore_sql(table, columns), list(rows))
+    return max(result.rowcount, 0)
+
+
+class CatalogueImporter:
+    """Batch loader resolving parent names to ids through in-memory maps."""
+
+    def __init__(self, connection: Connection) -> None:
+        self.connection = connection
+        self.institution_ids: Dict[str, int] = {}
+        self.course_ids: Dict[Tuple[str, str], int] = {}
+        self.touched_keys: Set[str] = set()
+        self.stats = ImportStats()
+
+    def _resolve_institutions(self, names: Set[str]) -> None:
+        missing = sorted(names - self.institution_ids.keys())
+        if not missing:
+            return
+        inserted = _insert_ignore(
+            self.connection, _institution_table, ("name",), [(name,) for name in missing]
+        )
+        self.stats.inserted["institution"] += inserted
+        rows = self.connection.execute(
+            select(_institution_table.c.name, _institution_table.c.id).where(
+                _institution_table.c.name.in_(missing)
+            )
+        )
+        self.institution_ids.update((name, institution_id) for name, institution_id in rows)
+        if inserted:
+            self.touched_keys.add(INSTITUTION_LIST_KEY)
+
+    def _resolve_courses(self, keys: Set[Tuple[str, str]]) -> None:
+        missing = sorted(keys - self.course_ids.keys())
+        if not missing:
+            return
+        parents = {institution: self.institution_ids[institution] for institution, _ in missing}
+        inserted = _insert_ignore(
+            self.connection,
+            _course_table,
+            ("name", "institution_id"),
+            [(course, parents[institution]) for institution, course in missing],
+        )
+        self.stats.inserted["course"] += inserted
+        names = {parent_id: institution for institution, parent_id in parents.items()}
+        columns = (_course_table.c.institution_id, _course_table.c.name)
+        keys_by_id = [(parents[institution], course) for institution, course in missing]
+        rows = self.connection.execute(
+            select(*columns, _course_table.c.id).where(tuple_(*columns).in_(keys_by_id))
+        )
+        for institution_id, course, course_id in rows:
+            self.course_ids[(names[institution_id], course)] = course_id
+        if inserted:
+            self.touched_keys.update(
+                resource_key(ReviewTargetType.INSTITUTION, parent_id) for parent_id in names
+            )
+
+    def load_batch(self, records: Sequence[CatalogueRecord]) -> None:
+        """Insert one batch of records, parents first."""
+        self._resolve_institutions({record.institution for record in records})
+        self._resolve_courses(
+            {(record.institution, record.course) for record in records if record.course}
+        )
+
+        professors: Set[Tuple[str, int]] = set()
+        subjects: Set[Tuple[str, int]] = set()
+        for institution, course, professor, subject in records:
+            if course is None:
+                continue
+            course_id = self.course_ids[(institution, course)]
+            if professor:
+                professors.add((professor, course_id))
+            if subject:
+                subjects.add((subject, course_id))
+        for kind, table, rows in (
+            ("professor", _professor_table, professors),
+            ("subject", _subject_table, subjects),
+        ):
+            inserted = _insert_ignore(self.connection, table, ("name", "course_id"), list(rows))
+            self.stats.inserted[kind] += inserted
+            if inserted:
+                self.touched_keys.update(
+                    resource_key(ReviewTargetType.COURSE, course_id) for _, course_id in rows
+                )
+        self.stats.records += len(records)
+
+
+def _batches(records: Iterable[CatalogueRecord], size: int) -> Iterator[List[CatalogueRecord]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def import_catalogue(
+    bind: Engine,
+    records: Iterable[CatalogueRecord],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress_every: int = 100_000,
+) -> ImportStats:
+    """Load ``records`` in batches, committing once per batch, and return the counters."""
+    with bind.connect() as connection:
+        importer = CatalogueImporter(connection)
+        reported = 0
+        for batch in _batches(records, batch_size):
+            with connection.begin(), deferred_catalogue_search(connection):
+                importer.load_batch(batch)
+                bump_versions(connection, importer.touched_keys)
+            # Readers see each batch once it commits, so the cached lists must not wait
+            # for the whole import to finish.
+            if importer.touched_keys:
+                catalogue_cache.clear()
+            importer.touched_keys.clear()
+            if importer.stats.records - reported >= progress_every:
+                reported = importer.stats.records
+                print(
+                    f"... {reported} records ({importer.stats.rate:,.0f} rows/s)",
+                    file=sys.stderr,
+                    flush=True,
+                )
+    return importer.stats
+
+
+def run(argv: Optional[Sequence[str]] = None) -> None:
+    """Import a CSV or JSON Lines catalogue file given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path, help="CSV or JSON Lines file to import")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="override format detection")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    init_db()
+    stats = import_catalogue(engine, read_records(args.path, args.format), args.batch_size)
+    print(f"Imported {stats.summary()}.")
+
+
+if __name__ == "__main__":
+    run()
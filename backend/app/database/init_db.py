@@ -1,11 +1,16 @@
-"""Database initialization script placeholder."""
+"""Apply pending schema migrations; run once per deploy, before starting workers."""
 
-from app.database.session import init_db
+from app.database.migrations import migrate
+from app.database.session import get_engine
 
 
 def run() -> None:
     """Execute database initialization steps."""
-    init_db()
+    applied = migrate(get_engine())
+    if applied:
+        print("Applied migrations: " + ", ".join(f"{m.version} {m.name}" for m in applied))
+    else:
+        print("Schema is up to date.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""SQL statement counting, per-request query statistics and the slow-query log."""
+
+import heapq
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple, Union
+from weakref import WeakSet
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import Settings
+
+slow_query_logger = logging.getLogger("opencampus.sql.slow")
+
+_START_TIMES = "instrumentation_start_times"
+_instrumented_engines: "WeakSet[Engine]" = WeakSet()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block issues more SQL statements than its budget allows."""
+
+
+class QueryCounter:
+    """Record the statements executed on a connection or engine while attached."""
+
+    def __init__(self, target: Union[Connection, Engine]) -> None:
+        self.target = target
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.target, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(self.target, "before_cursor_execute", self._record)
+
+
+@contextmanager
+def query_budget(
+    target: Union[Connection, Engine], budget: int, label: str = "block"
+) -> Iterator[QueryCounter]:
+    """Fail with :class:`QueryBudgetExceeded` if the block runs more than ``budget`` queries."""
+    with QueryCounter(target) as counter:
+        yield counter
+    if counter.count > budget:
+        listing = "\n".join(f"  {index}. {sql}" for index, sql in enumerate(counter.statements, 1))
+        raise QueryBudgetExceeded(
+            f"{label} issued {counter.count} queries, budget is {budget}:\n{listing}"
+        )
+
+
+@dataclass
+class QueryStats:
+    """Statements run on behalf of one request."""
+
+    keep_slowest: int = 3
+    count: int = 0
+    total_ms: float = 0.0
+    slowest: List[Tuple[float, int, str]] = field(default_factory=list)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        entry = (duration_ms, self.count, statement)
+        if len(self.slowest) < self.keep_slowest:
+            heapq.heappush(self.slowest, entry)
+        elif duration_ms > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def slowest_first(self) -> List[Tuple[float, str]]:
+        return [(duration, sql) for duration, _, sql in sorted(self.slowest, reverse=True)]
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+
+@contextmanager
+def collect_query_stats(keep_slowest: int = 3) -> Iterator[QueryStats]:
+    """Attribute statements executed in this context (and threads it spawns) to one object."""
+    stats = QueryStats(keep_slowest=keep_slowest)
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+def install_query_instrumentation(engine: Engine, settings: Settings) -> Engine:
+    """Time every statement of ``engine`` into request stats and the slow-query log."""
+    if engine in _instrumented_engines:
+        return engine
+    _instrumented_engines.add(engine)
+    threshold_ms = settings.slow_query_threshold_ms
+
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+    def after_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        duration_ms = (time.perf_counter() - conn.info[_START_TIMES].pop()) * 1000
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record(statement, duration_ms)
+        if duration_ms >= threshold_ms:
+            slow_query_logger.warning(
+                json.dumps(
+                    {
+                        "event": "slow_query",
+                        "duration_ms": round(duration_ms, 3),
+                        "statement": statement[: settings.slow_query_max_statement_length],
+                        "executemany": executemany,
+                        "route": current_route.get(),
+                    }
+                )
+            )
+
+    def handle_error(exception_context: Any) -> None:
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(_START_TIMES):
+            connection.info[_START_TIMES].pop()
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
+    return engine
+
+
+__all__ = [
+    "QueryBudgetExceeded",
+    "QueryCounter",
+    "QueryStats",
+    "collect_query_stats",
+    "current_query_stats",
+    "current_route",
+    "install_query_instrumentation",
+    "query_budget",
+    "slow_query_logger",
+]
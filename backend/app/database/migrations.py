@@ -0,0 +1,239 @@
+"""Versioned schema migrations applied once per database under a write lock."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterator, List
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select
+from sqlalchemy.engine import Connection, Engine
+
+from app.database.sqlite import is_sqlite
+
+migration_table = Table(
+    "schema_migration",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(128), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema step; ``apply`` runs inside the migration transaction."""
+
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, name: str) -> Callable[[Callable[[Connection], None]], Callable]:
+    """Register ``function`` as migration ``version``; versions must be appended in order."""
+
+    def decorator(function: Callable[[Connection], None]) -> Callable[[Connection], None]:
+        if MIGRATIONS and MIGRATIONS[-1].version >= version:
+            raise ValueError(f"Migration {version} is not newer than {MIGRATIONS[-1].version}.")
+        MIGRATIONS.append(Migration(version, name, function))
+        return function
+
+    return decorator
+
+
+def _model_metadata() -> MetaData:
+    # Models are imported on demand so processes that never migrate do not pay for them.
+    import app.models  # noqa: F401
+    from sqlmodel import SQLModel
+
+    return SQLModel.metadata
+
+
+def _add_missing_columns(connection: Connection, table: Table, columns: List[str]) -> None:
+    existing = {column["name"] for column in inspect(connection).get_columns(table.name)}
+    for name in columns:
+        if name in existing:
+            continue
+        column = table.c[name]
+        column_type = column.type.compile(dialect=connection.dialect)
+        constraints = ""
+        if column.server_default is not None:
+            default = column.server_default.arg
+            constraints += f" DEFAULT {getattr(default, 'text', default)}"
+            if not column.nullable:
+                constraints += " NOT NULL"
+        for foreign_key in column.foreign_keys:
+            referenced = foreign_key.column
+            constraints += f" REFERENCES {referenced.table.name} ({referenced.name})"
+        connection.exec_driver_sql(
+            f'ALTER TABLE "{table.name}" ADD COLUMN "{name}" {column_type}{constraints}'
+        )
+
+
+def _backfill_ratings(connection: Connection) -> None:
+    """Recompute rating aggregates and every leaderboard from the approved reviews."""
+    from app.core.config import settings
+    from app.models.enums import ReviewTargetType
+    from app.services.rankings import compute_rankings
+    from app.services.ratings import rebuild_rating_aggregates
+
+    rebuild_rating_aggregates(connection)
+    for target_type in ReviewTargetType:
+        compute_rankings(connection, target_type, settings.ranking_prior_weight)
+
+
+@migration(1, "baseline")
+def _baseline(connection: Connection) -> None:
+    """Create every missing table with its indexes, and the FTS indexes.
+
+    Databases that predate the rating tables get them filled from their reviews.
+    """
+    from app.database.search_index import install_search_indexes
+
+    derived = ("rating_aggregate", "target_ranking")
+    missing = [name for name in derived if not inspect(connection).has_table(name)]
+    _model_metadata().create_all(connection)
+    install_search_indexes(connection)
+    if missing:
+        _backfill_ratings(connection)
+
+
+@migration(2, "moderation_claims")
+def _moderation_claims(connection: Connection) -> None:
+    """Add resolution and claim columns to databases created before the moderation queues."""
+    tables = _model_metadata().tables
+    _add_missing_columns(
+        connection, tables["review"], ["resolved_by", "resolved_at", "claimed_by", "claimed_until"]
+    )
+    _add_missing_columns(connection, tables["changerequest"], ["claimed_by", "claimed_until"])
+
+
+@migration(3, "feed_and_queue_indexes")
+def _feed_and_queue_indexes(connection: Connection) -> None:
+    """Create indexes declared on tables that predate them; drop the superseded comment index."""
+    for table in _model_metadata().sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_comment_review_id")
+
+
+@migration(4, "rating_rollups")
+def _rating_rollups(connection: Connection) -> None:
+    """Create the trend rollup table and backfill it from the approved reviews."""
+    from app.services.trends import rebuild_rating_rollups
+
+    _model_metadata().tables["rating_rollup"].create(connection, checkfirst=True)
+    rebuild_rating_rollups(connection)
+
+
+@migration(5, "catalogue_versions")
+def _catalogue_versions(connection: Connection) -> None:
+    """Add row versions to catalogue tables and the base version to change requests."""
+    tables = _model_metadata().tables
+    for name in ("institution", "course", "professor", "subject"):
+        _add_missing_columns(connection, tables[name], ["version"])
+    _add_missing_columns(connection, tables["changerequest"], ["base_version"])
+
+
+@migration(6, "catalogue_search_deferral")
+def _catalogue_search_deferral(connection: Connection) -> None:
+    """Gate catalogue insert triggers on a flag table and reindex rows they may have missed.
+
+    Earlier bulk loads dropped the triggers outside their transaction, so a failed batch
+    could leave them missing for good.
+    """
+    from app.database.search_index import reinstall_catalogue_search
+
+    reinstall_catalogue_search(connection)
+
+
+@migration(7, "catalogue_search_length_order")
+def _catalogue_search_length_order(connection: Connection) -> None:
+    """Re-key catalogue search rows so rowid order follows name length."""
+    from app.database.search_index import reinstall_catalogue_search
+
+    reinstall_catalogue_search(connection)
+
+
+@migration(8, "rating_aggregate_backfill")
+def _rating_aggregate_backfill(connection: Connection) -> None:
+    """Fill rating aggregates and rankings an earlier baseline created empty."""
+    aggregates = _model_metadata().tables["rating_aggregate"]
+    if connection.execute(select(aggregates.c.target_id).limit(1)).first() is None:
+        _backfill_ratings(connection)
+
+
+@migration(9, "overall_review_counts")
+def _overall_review_counts(connection: Connection) -> None:
+    """Add the per-target review count rows and rank ``overall`` by reviews, not scores."""
+    _backfill_ratings(connection)
+
+
+def current_version(connection: Connection) -> int:
+    """Return the newest applied migration, 0 for a database never migrated."""
+    if not inspect(connection).has_table(migration_table.name):
+        return 0
+    return connection.execute(select(func.max(migration_table.c.version))).scalar() or 0
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    """Return the migrations not yet applied, reading only the version table."""
+    with engine.connect() as connection:
+        applied = current_version(connection)
+    return [step for step in MIGRATIONS if step.version > applied]
+
+
+@contextmanager
+def _write_locked(engine: Engine) -> Iterator[Connection]:
+    with engine.connect() as connection:
+        if not is_sqlite(str(engine.url)):
+            with connection.begin():
+                yield connection
+            return
+        # pysqlite defers BEGIN until the first write; take the write lock up front instead.
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.exec_driver_sql("ROLLBACK")
+            raise
+        connection.exec_driver_sql("COMMIT")
+
+
+def migrate(engine: Engine) -> List[Migration]:
+    """Apply pending migrations and return them.
+
+    Up-to-date databases cost one read. Otherwise the run holds the database write lock
+    (``BEGIN IMMEDIATE`` on SQLite) and re-reads the version under it, so concurrent
+    processes apply each step exactly once and never interleave DDL.
+    """
+    if not pending_migrations(engine):
+        return []
+    with _write_locked(engine) as connection:
+        migration_table.create(connection, checkfirst=True)
+        applied = current_version(connection)
+        steps = [step for step in MIGRATIONS if step.version > applied]
+        for step in steps:
+            step.apply(connection)
+            connection.execute(
+                migration_table.insert().values(
+                    version=step.version, name=step.name, applied_at=datetime.utcnow()
+                )
+            )
+    return steps
+
+
+__all__ = [
+    "MIGRATIONS",
+    "Migration",
+    "current_version",
+    "migrate",
+    "migration",
+    "migration_table",
+    "pending_migrations",
+]
@@ -0,0 +1,16 @@
+"""Recompute the materialized leaderboards from the rating aggregates."""
+
+from app.core.config import settings
+from app.database.session import engine
+from app.models.enums import ReviewTargetType
+from app.services.rankings import RankingRefresher
+
+
+def run() -> None:
+    """Rebuild the rankings of every target type in a single transaction."""
+    written = RankingRefresher(engine, settings.ranking_prior_weight).refresh(ReviewTargetType)
+    print(f"Rebuilt {sum(written.values())} ranking rows.")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,18 @@
+"""Rebuild review rating aggregates from approved reviews."""
+
+from sqlmodel import Session
+
+from app.database.session import engine
+from app.services.ratings import rebuild_rating_aggregates
+
+
+def run() -> None:
+    """Recompute all rating aggregates in a single transaction."""
+    with Session(engine) as session:
+        written = rebuild_rating_aggregates(session)
+        session.commit()
+    print(f"Rebuilt {written} rating aggregate rows.")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,17 @@
+"""Rebuild the full-text search indexes from their source tables."""
+
+from app.database.search_index import rebuild_catalogue_search, rebuild_review_search
+from app.database.session import engine, init_db
+
+
+def run() -> None:
+    """Recreate missing index structures and repopulate every search index."""
+    init_db()
+    with engine.begin() as connection:
+        rebuild_catalogue_search(connection)
+    indexed = rebuild_review_search(engine)
+    print(f"Rebuilt catalogue search and {indexed} review search rows.")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,18 @@
+"""Rebuild time-bucketed rating trend rollups from approved reviews."""
+
+from sqlmodel import Session
+
+from app.database.session import engine
+from app.services.trends import rebuild_rating_rollups
+
+
+def run() -> None:
+    """Recompute every trend rollup bucket in a single transaction."""
+    with Session(engine) as session:
+        written = rebuild_rating_rollups(session)
+        session.commit()
+    print(f"Rebuilt {written} rating rollup rows.")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,118 @@
+"""Snapshot replication of the SQLite writer into a read replica file."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine, make_url
+
+from app.models import ResourceVersion
+
+logger = logging.getLogger(__name__)
+
+_version_table = ResourceVersion.__table__
+
+# Called before a snapshot is taken; the returned callback runs afterwards with
+# whether the copy succeeded.
+SyncListener = Callable[[], Callable[[bool], None]]
+
+
+def sqlite_file(url: str) -> Optional[Path]:
+    """Return the database file of a SQLite ``url``, or ``None`` for other backends."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or parsed.database in (None, "", ":memory:"):
+        return None
+    return Path(parsed.database)
+
+
+def copy_snapshot(source: Engine, replica_path: Path, timeout_seconds: float = 30.0) -> None:
+    """Copy a transactionally consistent image of ``source`` over ``replica_path``.
+
+    Uses SQLite's online backup API, so writers are not blocked and readers of the
+    replica see either the previous snapshot or the new one.
+    """
+    replica_path.parent.mkdir(parents=True, exist_ok=True)
+    source_connection = source.raw_connection()
+    try:
+        destination = sqlite3.connect(str(replica_path), timeout=timeout_seconds)
+        try:
+            source_connection.driver_connection.backup(destination)
+        finally:
+            destination.close()
+    finally:
+        source_connection.close()
+
+
+def version_fingerprint(source: Engine) -> Tuple[int, int]:
+    """Summarise the resource versions; every write visible to readers changes the tuple."""
+    with source.connect() as connection:
+        row = connection.execute(
+            select(func.count(), func.coalesce(func.sum(_version_table.c.version), 0))
+        ).one()
+    return row[0], row[1]
+
+
+class ReplicaSyncer:
+    """Refresh the replica file from the writer whenever resource versions moved."""
+
+    def __init__(self, source: Engine, replica_path: Path) -> None:
+        self.source = source
+        self.replica_path = replica_path
+        self._listeners: List[SyncListener] = []
+        self._fingerprint: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_listener(self, listener: SyncListener) -> None:
+        """Run ``listener`` around every snapshot, e.g. to drop caches filled from the replica."""
+        self._listeners.append(listener)
+
+    def sync(self, force: bool = False) -> bool:
+        """Copy the writer into the replica if anything changed; return whether it copied."""
+        with self._lock:
+            fingerprint = version_fingerprint(self.source)
+            if not force and fingerprint == self._fingerprint and self.replica_path.exists():
+                return False
+            callbacks = [listener() for listener in self._listeners]
+            copied = False
+            try:
+                copy_snapshot(self.source, self.replica_path)
+                copied = True
+            finally:
+                for callback in callbacks:
+                    callback(copied)
+            self._fingerprint = fingerprint
+            return True
+
+    def start(self, interval_seconds: float) -> None:
+        """Sync every ``interval_seconds`` on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval_seconds,), name="replica-syncer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, waiting for a copy in progress."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stop.wait(interval_seconds):
+            try:
+                self.sync()
+            except Exception:  # pragma: no cover - keep syncing after transient errors
+                logger.exception("Replica sync failed")
+
+
+__all__ = ["ReplicaSyncer", "SyncListener", "copy_snapshot", "sqlite_file", "version_fingerprint"]
@@ -0,0 +1,314 @@
+"""SQLite FTS5 indexes kept in sync with catalogue and review tables by triggers."""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.models.enums import ReviewTargetType
+
+CATALOGUE_SEARCH_TABLE = "catalogue_search"
+
+# Each catalogue row maps to FTS rowid ``words << CATALOGUE_KEY_BITS | id * CATALOGUE_SLOTS
+# + slot`` so that triggers and result decoding address index entries by primary key, and
+# a MATCH scanned in rowid order visits names with the fewest words, the best BM25
+# matches, first.
+CATALOGUE_SLOTS = 4
+CATALOGUE_KEY_BITS = 40
+CATALOGUE_MAX_WORDS = 63
+CATALOGUE_SOURCES: Dict[ReviewTargetType, str] = {
+    ReviewTargetType.INSTITUTION: "institution",
+    ReviewTargetType.COURSE: "course",
+    ReviewTargetType.PROFESSOR: "professor",
+    ReviewTargetType.SUBJECT: "subject",
+}
+CATALOGUE_SLOT_TYPES: Dict[int, ReviewTargetType] = dict(enumerate(CATALOGUE_SOURCES))
+CATALOGUE_TYPE_SLOTS: Dict[ReviewTargetType, int] = {
+    target_type: slot for slot, target_type in CATALOGUE_SLOT_TYPES.items()
+}
+
+# While a row exists here the catalogue insert triggers stand down; bulk loads insert it
+# inside their own transaction and index the new rows themselves before committing.
+CATALOGUE_SEARCH_DEFERRED_TABLE = "catalogue_search_deferred"
+_DEFERRED_TABLE_DDL = (
+    f"CREATE TABLE IF NOT EXISTS {CATALOGUE_SEARCH_DEFERRED_TABLE} (id INTEGER PRIMARY KEY)"
+)
+
+SEARCH_TOKENIZER = "unicode61 remove_diacritics 2"
+
+REVIEW_SEARCH_TABLE = "review_search"
+
+# Reviews use FTS rowid ``id * 2`` and comments ``id * 2 + 1``. Only text of approved
+# reviews, and comments on approved reviews, is ever present in the index.
+REVIEW_SEARCH_SLOTS = 2
+REVIEW_SLOT = 0
+COMMENT_SLOT = 1
+
+REVIEW_SEARCH_COLUMNS = f"{REVIEW_SEARCH_TABLE}(rowid, text, target_type, target_id, review_id)"
+
+_REVIEW_TARGET_ID = (
+    "coalesce({alias}.institution_id, {alias}.course_id, {alias}.professor_id, {alias}.subject_id)"
+)
+
+
+def _table_exists(connection: Connection, name: str) -> bool:
+    row = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": name}
+    ).first()
+    return row is not None
+
+
+def _catalogue_rowid(target_type: ReviewTargetType) -> str:
+    words = "length(trim({alias}.name)) - length(replace(trim({alias}.name), ' ', '')) + 1"
+    return (
+        f"(min({words}, {CATALOGUE_MAX_WORDS}) << {CATALOGUE_KEY_BITS}) "
+        f"+ {{alias}}.id * {CATALOGUE_SLOTS} + {CATALOGUE_TYPE_SLOTS[target_type]}"
+    )
+
+
+def _catalogue_triggers(target_type: ReviewTargetType) -> List[str]:
+    table = CATALOGUE_SOURCES[target_type]
+    new_rowid = _catalogue_rowid(target_type).format(alias="new")
+    old_rowid = _catalogue_rowid(target_type).format(alias="old")
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} "
+        f"WHEN NOT EXISTS (SELECT 1 FROM {CATALOGUE_SEARCH_DEFERRED_TABLE}) BEGIN "
+        f"INSERT INTO {CATALOGUE_SEARCH_TABLE}(rowid, name) VALUES ({new_rowid}, new.name); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE OF name ON {table} "
+        f"BEGIN DELETE FROM {CATALOGUE_SEARCH_TABLE} WHERE rowid = {old_rowid}; "
+        f"INSERT INTO {CATALOGUE_SEARCH_TABLE}(rowid, name) VALUES ({new_rowid}, new.name); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {CATALOGUE_SEARCH_TABLE} WHERE rowid = {old_rowid}; END",
+    ]
+
+
+def catalogue_search_ddl() -> List[str]:
+    """Return the statements creating the catalogue FTS table and its triggers."""
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {CATALOGUE_SEARCH_TABLE} USING fts5("
+        f"name, tokenize = '{SEARCH_TOKENIZER}', prefix = '2 3 4')",
+        _DEFERRED_TABLE_DDL,
+    ]
+    for target_type in CATALOGUE_SOURCES:
+        statements += _catalogue_triggers(target_type)
+    return statements
+
+
+def _approved_review_rows(condition: str) -> str:
+    """Select index rows for approved reviews matching ``condition`` on alias ``r``."""
+    return (
+        f"SELECT r.id * {REVIEW_SEARCH_SLOTS} + {REVIEW_SLOT} AS indexed_rowid, "
+        "r.text, r.target_type, "
+        f"{_REVIEW_TARGET_ID.format(alias='r')}, r.id FROM review AS r "
+        f"WHERE r.approved AND {condition}"
+    )
+
+
+def _approved_comment_rows(condition: str) -> str:
+    """Select index rows for comments on approved reviews matching ``condition``."""
+    return (
+        f"SELECT c.id * {REVIEW_SEARCH_SLOTS} + {COMMENT_SLOT} AS indexed_rowid, "
+        "c.text, r.target_type, "
+        f"{_REVIEW_TARGET_ID.format(alias='r')}, r.id "
+        f"FROM review AS r JOIN comment AS c ON c.review_id = r.id "
+        f"WHERE r.approved AND {condition}"
+    )
+
+
+def review_search_ddl() -> List[str]:
+    """Return the statements creating the review text FTS table and its triggers."""
+    table = REVIEW_SEARCH_TABLE
+    columns = REVIEW_SEARCH_COLUMNS
+    review_row = (
+        f"SELECT new.id * {REVIEW_SEARCH_SLOTS} + {REVIEW_SLOT}, new.text, new.target_type, "
+        f"{_REVIEW_TARGET_ID.format(alias='new')}, new.id WHERE new.approved"
+    )
+    review_comment_rows = (
+        f"SELECT c.id * {REVIEW_SEARCH_SLOTS} + {COMMENT_SLOT}, c.text, new.target_type, "
+        f"{_REVIEW_TARGET_ID.format(alias='new')}, new.id FROM comment AS c "
+        "WHERE c.review_id = new.id"
+    )
+    comment_row = _approved_comment_rows("c.id = new.id")
+    old_review_rowid = f"old.id * {REVIEW_SEARCH_SLOTS} + {REVIEW_SLOT}"
+    old_comment_rowids = (
+        f"SELECT c.id * {REVIEW_SEARCH_SLOTS} + {COMMENT_SLOT} FROM comment AS c "
+        "WHERE c.review_id = old.id"
+    )
+    target_columns = "target_type, institution_id, course_id, professor_id, subject_id"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+        "text, target_type UNINDEXED, target_id UNINDEXED, review_id UNINDEXED, "
+        f"tokenize = '{SEARCH_TOKENIZER}', prefix = '2 3 4')",
+        f"CREATE TRIGGER IF NOT EXISTS review_search_insert AFTER INSERT ON review "
+        f"WHEN new.approved BEGIN INSERT INTO {columns} {review_row}; END",
+        f"CREATE TRIGGER IF NOT EXISTS review_search_update "
+        f"AFTER UPDATE OF text, approved, {target_columns} ON review BEGIN "
+        f"DELETE FROM {table} WHERE rowid = {old_review_rowid}; "
+        f"INSERT INTO {columns} {review_row}; END",
+        f"CREATE TRIGGER IF NOT EXISTS review_search_approve AFTER UPDATE OF approved ON review "
+        f"WHEN new.approved AND NOT old.approved BEGIN "
+        f"INSERT OR REPLACE INTO {columns} {review_comment_rows}; END",
+        f"CREATE TRIGGER IF NOT EXISTS review_search_unapprove "
+        f"AFTER UPDATE OF approved ON review WHEN old.approved AND NOT new.approved BEGIN "
+        f"DELETE FROM {table} WHERE rowid IN ({old_comment_rowids}); END",
+        f"CREATE TRIGGER IF NOT EXISTS review_search_retarget "
+        f"AFTER UPDATE OF {target_columns} ON review WHEN old.approved AND new.approved BEGIN "
+        f"INSERT OR REPLACE INTO {columns} {review_comment_rows}; END",
+        f"CREATE TRIGGER IF NOT EXISTS review_search_delete AFTER DELETE ON review BEGIN "
+        f"DELETE FROM {table} WHERE rowid = {old_review_rowid}; "
+        f"DELETE FROM {table} WHERE rowid IN ({old_comment_rowids}); END",
+        f"CREATE TRIGGER IF NOT EXISTS comment_search_insert AFTER INSERT ON comment BEGIN "
+        f"INSERT INTO {columns} {comment_row}; END",
+        f"CREATE TRIGGER IF NOT EXISTS comment_search_update "
+        f"AFTER UPDATE OF text, review_id ON comment BEGIN "
+        f"DELETE FROM {table} WHERE rowid = old.id * {REVIEW_SEARCH_SLOTS} + {COMMENT_SLOT}; "
+        f"INSERT INTO {columns} {comment_row}; END",
+        f"CREATE TRIGGER IF NOT EXISTS comment_search_delete AFTER DELETE ON comment BEGIN "
+        f"DELETE FROM {table} WHERE rowid = old.id * {REVIEW_SEARCH_SLOTS} + {COMMENT_SLOT}; END",
+    ]
+
+
+def rebuild_catalogue_search(connection: Connection) -> None:
+    """Repopulate the catalogue FTS table from the source tables."""
+    connection.execute(text(f"DELETE FROM {CATALOGUE_SEARCH_TABLE}"))
+    for target_type, table in CATALOGUE_SOURCES.items():
+        rowid = _catalogue_rowid(target_type).format(alias=table)
+        connection.execute(
+            text(
+                f"INSERT INTO {CATALOGUE_SEARCH_TABLE}(rowid, name) "
+                f"SELECT {rowid}, name FROM {table}"
+            )
+        )
+    connection.execute(
+        text(f"INSERT INTO {CATALOGUE_SEARCH_TABLE}({CATALOGUE_SEARCH_TABLE}) VALUES ('optimize')")
+    )
+
+
+@contextmanager
+def deferred_catalogue_search(connection: Connection) -> Iterator[None]:
+    """Index catalogue rows inserted inside the block with one statement per table.
+
+    Must run inside the caller's transaction. The insert triggers are switched off by a
+    row in ``catalogue_search_deferred`` rather than dropped, so the switch commits or
+    rolls back with the caller's rows and other connections never see it.
+    """
+    if not connection.in_transaction():
+        raise RuntimeError("deferred_catalogue_search needs an open transaction.")
+    last_ids = {
+        target_type: connection.execute(text(f"SELECT coalesce(max(id), 0) FROM {table}")).scalar()
+        for target_type, table in CATALOGUE_SOURCES.items()
+    }
+    connection.execute(text(f"INSERT INTO {CATALOGUE_SEARCH_DEFERRED_TABLE} DEFAULT VALUES"))
+    try:
+        yield
+    finally:
+        connection.execute(text(f"DELETE FROM {CATALOGUE_SEARCH_DEFERRED_TABLE}"))
+    for target_type, table in CATALOGUE_SOURCES.items():
+        rowid = _catalogue_rowid(target_type).format(alias=table)
+        connection.execute(
+            text(
+                f"INSERT INTO {CATALOGUE_SEARCH_TABLE}(rowid, name) "
+                f"SELECT {rowid}, name FROM {table} WHERE id > :last_id"
+            ),
+            {"last_id": last_ids[target_type]},
+        )
+
+
+def reinstall_catalogue_search(connection: Connection) -> None:
+    """Replace the catalogue triggers with their current definitions and reindex."""
+    connection.execute(text(_DEFERRED_TABLE_DDL))
+    connection.execute(text(f"DELETE FROM {CATALOGUE_SEARCH_DEFERRED_TABLE}"))
+    for target_type, table in CATALOGUE_SOURCES.items():
+        for action in ("insert", "update", "delete"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {table}_search_{action}"))
+        for statement in _catalogue_triggers(target_type):
+            connection.execute(text(statement))
+    rebuild_catalogue_search(connection)
+
+
+def rebuild_review_search(engine: Engine, batch_size: int = 5_000) -> int:
+    """Re-sync the review text index in short transactions and return rows indexed.
+
+    Each batch of review or comment ids commits on its own: its index rows are replaced
+    and rows whose source is gone or unapproved are deleted, so searches keep seeing a
+    complete index and concurrent writers only ever wait for one batch.
+    """
+    sources = (
+        (REVIEW_SLOT, "review", "r.id", _approved_review_rows),
+        (COMMENT_SLOT, "comment", "c.id", _approved_comment_rows),
+    )
+    with engine.connect() as connection:
+        last_ids = {
+            slot: connection.execute(text(f"SELECT coalesce(max(id), 0) FROM {table}")).scalar()
+            for slot, table, _, _ in sources
+        }
+
+    indexed = 0
+    for slot, _, id_column, approved_rows in sources:
+        rows = approved_rows(f"{id_column} > :start AND {id_column} <= :end")
+        of_slot = f"rowid % {REVIEW_SEARCH_SLOTS} = {slot}"
+        for start in range(0, last_ids[slot], batch_size):
+            bounds = {
+                "start": start,
+                "end": start + batch_size,
+                "first": (start + 1) * REVIEW_SEARCH_SLOTS + slot,
+                "last": (start + batch_size) * REVIEW_SEARCH_SLOTS + slot,
+            }
+            with engine.begin() as connection:
+                connection.execute(
+                    text(
+                        f"DELETE FROM {REVIEW_SEARCH_TABLE} "
+                        f"WHERE rowid BETWEEN :first AND :last AND {of_slot} "
+                        f"AND rowid NOT IN (SELECT indexed_rowid FROM ({rows}))"
+                    ),
+                    bounds,
+                )
+                result = connection.execute(
+                    text(f"INSERT OR REPLACE INTO {REVIEW_SEARCH_COLUMNS} {rows}"), bounds
+                )
+            indexed += result.rowcount
+        with engine.begin() as connection:
+            connection.execute(
+                text(f"DELETE FROM {REVIEW_SEARCH_TABLE} WHERE rowid > :last AND {of_slot}"),
+                {"last": last_ids[slot] * REVIEW_SEARCH_SLOTS + slot},
+            )
+    return indexed
+
+
+def install_search_indexes(connection: Connection) -> None:
+    """Create missing FTS tables and triggers, backfilling newly created indexes."""
+    backfill_catalogue = not _table_exists(connection, CATALOGUE_SEARCH_TABLE)
+    backfill_reviews = not _table_exists(connection, REVIEW_SEARCH_TABLE)
+    for statement in catalogue_search_ddl() + review_search_ddl():
+        connection.execute(text(statement))
+    if backfill_catalogue:
+        rebuild_catalogue_search(connection)
+    if backfill_reviews:
+        connection.execute(
+            text(f"INSERT INTO {REVIEW_SEARCH_COLUMNS} {_approved_review_rows('1')}")
+        )
+        connection.execute(
+            text(f"INSERT INTO {REVIEW_SEARCH_COLUMNS} {_approved_comment_rows('1')}")
+        )
+
+__all__ = [
+    "CATALOGUE_KEY_BITS",
+    "CATALOGUE_MAX_WORDS",
+    "CATALOGUE_SEARCH_DEFERRED_TABLE",
+    "CATALOGUE_SEARCH_TABLE",
+    "CATALOGUE_SLOTS",
+    "CATALOGUE_SLOT_TYPES",
+    "CATALOGUE_TYPE_SLOTS",
+    "COMMENT_SLOT",
+    "REVIEW_SEARCH_SLOTS",
+    "REVIEW_SEARCH_TABLE",
+    "REVIEW_SLOT",
+    "catalogue_search_ddl",
+    "deferred_catalogue_search",
+    "install_search_indexes",
+    "rebuild_catalogue_search",
+    "rebuild_review_search",
+    "reinstall_catalogue_search",
+    "review_search_ddl",
+]
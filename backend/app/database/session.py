@@ -1,29 +1,179 @@
-"""Database session management utilities."""
+"""Database session management utilities.
 
-from collections.abc import Generator
+Engines are created on first use rather than at import, so importing this module (or
+anything that depends on it) opens nothing and stays cheap for every worker process.
+"""
 
-from sqlmodel import Session, SQLModel, create_engine
+import threading
+import time
+from collections.abc import AsyncGenerator, Generator
+from typing import Any, Callable, Dict, List
+
+from fastapi import Request, Response
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.database.sqlite import configure_engine, engine_options
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_engines: Dict[str, Any] = {}
+_engines_lock = threading.Lock()
+_engine_listeners: List[Callable[[Engine], None]] = []
+
+
+def _create_engine(url: str) -> Engine:
+    return configure_engine(create_engine(url, **engine_options(url, settings)), url, settings)
+
+
+def _create_async_engine(url: str) -> AsyncEngine:
+    async_engine = create_async_engine(url, **engine_options(url, settings))
+    configure_engine(async_engine.sync_engine, url, settings)
+    return async_engine
+
+
+def _cached(name: str, factory: Callable[[], Any]) -> Any:
+    created = _engines.get(name)
+    if created is not None:
+        return created
+    with _engines_lock:
+        if name not in _engines:
+            created = factory()
+            sync_engine = created.sync_engine if isinstance(created, AsyncEngine) else created
+            for listener in _engine_listeners:
+                listener(sync_engine)
+            _engines[name] = created
+        return _engines[name]
+
+
+def on_engine_created(listener: Callable[[Engine], None]) -> None:
+    """Run ``listener`` on every engine, including the (sync side of) async ones.
+
+    Engines that already exist are passed immediately.
+    """
+    with _engines_lock:
+        _engine_listeners.append(listener)
+        existing = list(_engines.values())
+    for created in existing:
+        listener(created.sync_engine if isinstance(created, AsyncEngine) else created)
+
+
+def get_engine() -> Engine:
+    """Return the writer engine."""
+    return _cached("engine", lambda: _create_engine(settings.database_url))
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the async writer engine."""
+    return _cached("async_engine", lambda: _create_async_engine(settings.database_url_async))
+
+
+def get_read_engine() -> Engine:
+    """Return the reader engine; the writer when no reader is configured."""
+    if not settings.read_database_url:
+        return get_engine()
+    return _cached("read_engine", lambda: _create_engine(settings.read_database_url))
+
 
+def get_async_read_engine() -> AsyncEngine:
+    """Return the async reader engine; the async writer when no reader is configured."""
+    url = settings.read_database_url_async
+    if not url:
+        return get_async_engine()
+    return _cached("async_read_engine", lambda: _create_async_engine(url))
 
-engine = create_engine(
-    settings.database_url,
-    echo=False,
-    future=True,
-    connect_args={"check_same_thread": False},
-)
+
+_ENGINE_ATTRIBUTES = {
+    "engine": get_engine,
+    "async_engine": get_async_engine,
+    "read_engine": get_read_engine,
+    "async_read_engine": get_async_read_engine,
+}
+
+
+def __getattr__(name: str) -> Any:
+    # ``from app.database.session import engine`` keeps working, creating it on demand.
+    if name in _ENGINE_ATTRIBUTES:
+        return _ENGINE_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_db() -> None:
-    """Initialize database tables."""
-    SQLModel.metadata.create_all(engine)
+    """Bring the schema up to date by applying pending migrations."""
+    from app.database.migrations import migrate
+
+    migrate(get_engine())
+
+
+def wrote_recently(request: Request) -> bool:
+    """Return whether the client wrote within the read-your-writes window."""
+    try:
+        return float(request.cookies.get(settings.read_your_writes_cookie, "")) > time.time()
+    except ValueError:
+        return False
+
+
+def get_write_session(request: Request, response: Response) -> Generator[Session, None, None]:
+    """Provide a session on the writer.
+
+    Unsafe requests mark the client so its reads stay on the writer until replicas
+    have had time to catch up.
+    """
+    if (
+        settings.read_database_url
+        and settings.read_your_writes_seconds > 0
+        and request.method not in SAFE_METHODS
+    ):
+        window = settings.read_your_writes_seconds
+        response.set_cookie(
+            settings.read_your_writes_cookie,
+            str(int(time.time() + window) + 1),
+            max_age=int(window) + 1,
+            httponly=True,
+            samesite="lax",
+        )
+    with Session(get_engine()) as session:
+        yield session
+
+
+def get_read_session(request: Request) -> Generator[Session, None, None]:
+    """Provide a session on the reader, or on the writer right after the client wrote."""
+    bind = get_engine() if wrote_recently(request) else get_read_engine()
+    with Session(bind) as session:
+        yield session
+
+
+# Kept for callers that predate the read/write split; sessions default to the writer.
+get_session = get_write_session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an asynchronous SQLModel session context on the writer."""
+    async with AsyncSession(get_async_engine()) as session:
+        yield session
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Provide a SQLModel session context."""
-    with Session(engine) as session:
+async def get_async_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Provide an asynchronous session on the reader, honouring read-your-writes."""
+    bind = get_async_engine() if wrote_recently(request) else get_async_read_engine()
+    async with AsyncSession(bind) as session:
         yield session
 
 
-__all__ = ["engine", "init_db", "get_session"]
+__all__ = [
+    "get_async_engine",
+    "get_async_read_engine",
+    "get_async_read_session",
+    "get_async_session",
+    "get_engine",
+    "get_read_engine",
+    "get_read_session",
+    "get_session",
+    "get_write_session",
+    "init_db",
+    "on_engine_created",
+    "wrote_recently",
+]
@@ -0,0 +1,63 @@
+"""SQLite connection tuning applied to every pooled connection."""
+
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+from app.core.config import Settings
+
+
+def is_sqlite(url: str) -> bool:
+    """Return whether ``url`` targets a SQLite database."""
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def sqlite_pragmas(settings: Settings) -> Dict[str, Any]:
+    """Return the PRAGMA values of the production SQLite profile."""
+    return {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "mmap_size": settings.sqlite_mmap_size,
+        "cache_size": settings.sqlite_cache_size,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        "temp_store": settings.sqlite_temp_store,
+    }
+
+
+def install_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """Run ``pragmas`` on each new DBAPI connection opened by ``engine``."""
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def engine_options(url: str, settings: Settings) -> Dict[str, Any]:
+    """Return ``create_engine`` keyword arguments for ``url`` under ``settings``."""
+    options: Dict[str, Any] = {"echo": False, "future": True}
+    if is_sqlite(url):
+        options["connect_args"] = {"check_same_thread": False}
+    if settings.sqlite_production_profile or not is_sqlite(url):
+        options.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_pre_ping=not is_sqlite(url),
+        )
+    return options
+
+
+def configure_engine(engine: Engine, url: str, settings: Settings) -> Engine:
+    """Attach the production PRAGMAs to ``engine`` when the profile is enabled."""
+    if settings.sqlite_production_profile and is_sqlite(url):
+        install_pragmas(engine, sqlite_pragmas(settings))
+    return engine
+
+
+__all__ = ["configure_engine", "engine_options", "install_pragmas", "is_sqlite", "sqlite_pragmas"]
@@ -0,0 +1,18 @@
+"""Copy a snapshot of the writer database into the configured SQLite read replica."""
+
+from app.core.config import settings
+from app.database.replica import copy_snapshot, sqlite_file
+from app.database.session import engine
+
+
+def run() -> None:
+    """Refresh the replica once, e.g. from cron when the app does not sync it itself."""
+    replica = sqlite_file(settings.read_database_url) if settings.read_database_url else None
+    if replica is None:
+        raise SystemExit("read_database_url must point at a SQLite file.")
+    copy_snapshot(engine, replica)
+    print(f"Copied {settings.sqlite_file} to {replica}.")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,26 +1,101 @@
 """FastAPI application factory for OpenCampus."""
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.auth.tokens import signing_secret
 from app.core.config import settings
-from app.database.session import init_db
-from app.routes import api_router
+from app.core.metrics import registry
+from app.core.middleware import RequestInstrumentationMiddleware, configure_slow_logs
+from app.database.instrumentation import install_query_instrumentation
+from app.database.replica import ReplicaSyncer, sqlite_file
+from app.database.session import get_engine, init_db, on_engine_created
+from app.routes import api_router, metrics
+from app.routes.caching import ResponseCacheMiddleware
+from app.routes.conditional import conditional_get
+from app.services import notifications  # noqa: F401  (registers notification jobs)
+from app.services.catalogue import invalidate_after_replica_sync
+from app.services.jobs import JobWorkerPool, job_handlers
+from app.services.rankings import RankingRefresher
+from app.services.response_cache import response_cache
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Bring the schema up to date and run background workers for the app's lifetime.
+
+    With ``auto_migrate`` off, run ``python -m app.database.init_db`` once per deploy
+    instead of from every worker.
+    """
+    signing_secret(settings)
+    engine = get_engine()
+    if settings.auto_migrate:
+        init_db()
+
+    replica = sqlite_file(settings.read_database_url) if settings.read_database_url else None
+    replica_syncer = None
+    if replica is not None and settings.replica_sync_seconds > 0:
+        replica_syncer = ReplicaSyncer(engine, replica)
+        replica_syncer.add_listener(invalidate_after_replica_sync)
+        replica_syncer.sync(force=True)
+        replica_syncer.start(settings.replica_sync_seconds)
+    ranking_refresher = RankingRefresher(engine, settings.ranking_prior_weight)
+    if settings.ranking_refresh_seconds > 0:
+        ranking_refresher.start(settings.ranking_refresh_seconds)
+    job_workers = JobWorkerPool(engine, job_handlers, settings)
+    if settings.job_workers > 0:
+        job_workers.start()
+
+    application.state.replica_syncer = replica_syncer
+    application.state.ranking_refresher = ranking_refresher
+    application.state.job_workers = job_workers
+    try:
+        yield
+    finally:
+        if replica_syncer is not None:
+            replica_syncer.stop()
+        job_workers.stop()
+        ranking_refresher.stop()
 
 
 def create_app() -> FastAPI:
     """Create and configure a FastAPI application instance."""
-    application = FastAPI(title=settings.project_name)
+    application = FastAPI(
+        title=settings.project_name,
+        default_response_class=ORJSONResponse if settings.fast_serialization else JSONResponse,
+        lifespan=lifespan,
+    )
 
-    @application.on_event("startup")
-    def on_startup() -> None:
-        """Initialize resources when the application starts."""
-        init_db()
+    application.include_router(
+        api_router,
+        prefix=settings.api_v1_prefix,
+        dependencies=[Depends(conditional_get)],
+    )
+    application.include_router(metrics.router)
+
+    # Added before instrumentation so that it stays outermost and still times cache hits.
+    if settings.response_cache_enabled:
+        application.add_middleware(
+            ResponseCacheMiddleware,
+            router=application.router,
+            cache=response_cache,
+            settings=settings,
+            registry=registry,
+        )
 
-    application.include_router(api_router, prefix=settings.api_v1_prefix)
+    if settings.sql_instrumentation:
+        on_engine_created(lambda engine: install_query_instrumentation(engine, settings))
+        configure_slow_logs(settings)
+        application.add_middleware(
+            RequestInstrumentationMiddleware, settings=settings, registry=registry
+        )
 
     return application
 
 
 app = create_app()
 
-__all__ = ["app", "create_app"]
+__all__ = ["app", "create_app", "lifespan"]
@@ -4,11 +4,22 @@ from .base import BaseModel
 from .change_request import ChangeRequest
 from .comment import Comment
 from .course import Course
-from .enums import ChangeRequestStatus, ReviewTargetType, UserRole
+from .enums import (
+    ChangeRequestStatus,
+    JobStatus,
+    ReviewTargetType,
+    TrendGranularity,
+    UserRole,
+)
 from .institution import Institution
+from .job import Job
 from .professor import Professor
-from .review import Review
+from .rating_aggregate import RatingAggregate
+from .rating_rollup import RatingRollup
+from .resource_version import ResourceVersion
+from .review import REVIEW_SCORE_FIELDS, REVIEW_TARGET_FIELDS, Review
 from .subject import Subject
+from .target_ranking import OVERALL_DIMENSION, TargetRanking
 from .user import User
 
 __all__ = [
@@ -18,10 +29,20 @@ __all__ = [
     "Comment",
     "Course",
     "Institution",
+    "Job",
+    "JobStatus",
+    "OVERALL_DIMENSION",
     "Professor",
+    "REVIEW_SCORE_FIELDS",
+    "REVIEW_TARGET_FIELDS",
+    "RatingAggregate",
+    "RatingRollup",
+    "ResourceVersion",
     "Review",
     "ReviewTargetType",
     "Subject",
+    "TargetRanking",
+    "TrendGranularity",
     "User",
     "UserRole",
 ]
@@ -1,6 +1,9 @@
 """Base models module placeholder."""
 
-from sqlmodel import SQLModel
+from typing import Any
+
+from sqlalchemy import Column, Integer, text
+from sqlmodel import Field, SQLModel
 
 
 class BaseModel(SQLModel):
@@ -8,3 +11,14 @@ class BaseModel(SQLModel):
 
     class Config:
         arbitrary_types_allowed = True
+
+
+def version_field() -> Any:
+    """Row version incremented by every applied change, for detecting stale suggestions.
+
+    The column default lives in the schema only: a Python-side one would make Core
+    inserts such as the bulk importer's precompiled statement bind it as a parameter.
+    """
+    return Field(
+        default=1, sa_column=Column(Integer, nullable=False, server_default=text("1"))
+    )
@@ -1,11 +1,19 @@
 """ChangeRequest SQLModel definition."""
 
-from __future__ import annotations
-
 from datetime import datetime
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
-from sqlalchemy import Boolean, CheckConstraint, Column, DateTime, Enum as SAEnum, JSON
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Enum as SAEnum,
+    Index,
+    Integer,
+    text,
+)
 from sqlmodel import Field, Relationship
 
 from .base import BaseModel
@@ -27,6 +35,7 @@ class ChangeRequest(BaseModel, table=True):
         sa_column=Column(SAEnum(ReviewTargetType, name="change_request_target"), nullable=False)
     )
     suggested_data: Dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+    base_version: Optional[int] = Field(default=None, sa_column=Column(Integer, nullable=True))
     status: ChangeRequestStatus = Field(
         default=ChangeRequestStatus.PENDING,
         sa_column=Column(SAEnum(ChangeRequestStatus, name="change_request_status"), nullable=False),
@@ -41,6 +50,11 @@ class ChangeRequest(BaseModel, table=True):
         default=None,
         sa_column=Column(DateTime(timezone=True), nullable=True),
     )
+    claimed_by: Optional[int] = Field(default=None, foreign_key="user.id")
+    claimed_until: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
     from_official_source: bool = Field(
         sa_column=Column(Boolean, nullable=False, default=False), default=False
     )
@@ -81,5 +95,11 @@ class ChangeRequest(BaseModel, table=True):
             ),
             name="ck_change_request_target_reference",
         ),
+        Index(
+            "ix_change_request_moderation_queue",
+            "created_at",
+            "id",
+            sqlite_where=text("status = 'PENDING'"),
+        ),
         {"sqlite_autoincrement": True},
     )
@@ -1,11 +1,9 @@
 """Comment SQLModel definition."""
 
-from __future__ import annotations
-
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, DateTime, Text
+from sqlalchemy import Boolean, Column, DateTime, Index, Text
 from sqlmodel import Field, Relationship
 
 from .base import BaseModel
@@ -20,7 +18,7 @@ class Comment(BaseModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id", index=True)
-    review_id: int = Field(foreign_key="review.id", index=True)
+    review_id: int = Field(foreign_key="review.id")
     text: str = Field(sa_column=Column(Text, nullable=False))
     is_official: bool = Field(sa_column=Column(Boolean, nullable=False, default=False), default=False)
     created_at: datetime = Field(
@@ -32,5 +30,6 @@ class Comment(BaseModel, table=True):
     review: "Review" = Relationship(back_populates="comments")
 
     __table_args__ = (
+        Index("ix_comment_review_thread", "review_id", "created_at", "id"),
         {"sqlite_autoincrement": True},
     )
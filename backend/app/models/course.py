@@ -1,13 +1,11 @@
 """Course SQLModel definition."""
 
-from __future__ import annotations
-
 from typing import List, Optional, TYPE_CHECKING
 
 from sqlalchemy import Column, String, UniqueConstraint
 from sqlmodel import Field, Relationship
 
-from .base import BaseModel
+from .base import BaseModel, version_field
 
 if TYPE_CHECKING:  # pragma: no cover - typing helpers only
     from .institution import Institution
@@ -24,6 +22,7 @@ class Course(BaseModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(sa_column=Column(String(255), index=True, nullable=False))
     institution_id: int = Field(foreign_key="institution.id")
+    version: int = version_field()
 
     institution: "Institution" = Relationship(back_populates="courses")
     professors: List["Professor"] = Relationship(back_populates="course")
@@ -29,3 +29,20 @@ class ChangeRequestStatus(str, Enum):
     PENDING = "PENDING"
     APPROVED = "APPROVED"
     REJECTED = "REJECTED"
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a background job."""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class TrendGranularity(str, Enum):
+    """Time buckets that review score trends are rolled up into."""
+
+    DAY = "DAY"
+    MONTH = "MONTH"
+    SEMESTER = "SEMESTER"
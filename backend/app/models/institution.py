@@ -1,13 +1,11 @@
 """Institution SQLModel definition."""
 
-from __future__ import annotations
-
 from typing import List, Optional, TYPE_CHECKING
 
 from sqlalchemy import Column, String, UniqueConstraint
 from sqlmodel import Field, Relationship
 
-from .base import BaseModel
+from .base import BaseModel, version_field
 
 if TYPE_CHECKING:  # pragma: no cover - imported for typing only
     from .course import Course
@@ -20,6 +18,7 @@ class Institution(BaseModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(sa_column=Column(String(255), unique=True, index=True, nullable=False))
+    version: int = version_field()
 
     courses: List["Course"] = Relationship(back_populates="institution")
     reviews: List["Review"] = Relationship(back_populates="institution")
@@ -0,0 +1,62 @@
+"""Job SQLModel definition."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Enum as SAEnum,
+    Index,
+    Integer,
+    String,
+    Text,
+    text as sql_text,
+)
+from sqlmodel import Field
+
+from .base import BaseModel
+from .enums import JobStatus
+
+
+class Job(BaseModel, table=True):
+    """Durable unit of deferred work run by the in-process worker pool."""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str = Field(sa_column=Column(String(64), nullable=False))
+    target_key: Optional[str] = Field(default=None, sa_column=Column(String(128), nullable=True))
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    idempotency_key: Optional[str] = Field(
+        default=None, sa_column=Column(String(255), unique=True, nullable=True)
+    )
+    status: JobStatus = Field(
+        default=JobStatus.PENDING,
+        sa_column=Column(SAEnum(JobStatus, name="job_status"), nullable=False),
+    )
+    attempts: int = Field(default=0, sa_column=Column(Integer, nullable=False, default=0))
+    max_attempts: int = Field(default=5, sa_column=Column(Integer, nullable=False, default=5))
+    run_after: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    locked_until: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    last_error: Optional[str] = Field(default=None, sa_column=Column(Text, nullable=True))
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    finished_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+
+    __table_args__ = (
+        Index("ix_job_due", "run_after", "id", sqlite_where=sql_text("status = 'PENDING'")),
+        Index("ix_job_leased", "locked_until", sqlite_where=sql_text("status = 'RUNNING'")),
+        Index("ix_job_finished", "finished_at", sqlite_where=sql_text("finished_at IS NOT NULL")),
+        {"sqlite_autoincrement": True},
+    )
@@ -1,13 +1,11 @@
 """Professor SQLModel definition."""
 
-from __future__ import annotations
-
 from typing import List, Optional, TYPE_CHECKING
 
 from sqlalchemy import Column, String, UniqueConstraint
 from sqlmodel import Field, Relationship
 
-from .base import BaseModel
+from .base import BaseModel, version_field
 
 if TYPE_CHECKING:  # pragma: no cover
     from .course import Course
@@ -21,6 +19,7 @@ class Professor(BaseModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(sa_column=Column(String(255), index=True, nullable=False))
     course_id: int = Field(foreign_key="course.id")
+    version: int = version_field()
 
     course: "Course" = Relationship(back_populates="professors")
     reviews: List["Review"] = Relationship(back_populates="professor")
@@ -0,0 +1,36 @@
+"""RatingAggregate SQLModel definition."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import BigInteger, Column, Enum as SAEnum, Integer, String, UniqueConstraint
+from sqlmodel import Field
+
+from .base import BaseModel
+from .enums import ReviewTargetType
+
+
+class RatingAggregate(BaseModel, table=True):
+    """Running score statistics of approved reviews for one target dimension."""
+
+    __tablename__ = "rating_aggregate"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    target_type: ReviewTargetType = Field(
+        sa_column=Column(SAEnum(ReviewTargetType, name="rating_aggregate_target"), nullable=False)
+    )
+    target_id: int = Field(sa_column=Column(Integer, nullable=False))
+    dimension: str = Field(sa_column=Column(String(64), nullable=False))
+    count: int = Field(default=0, sa_column=Column(Integer, nullable=False, default=0))
+    total: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    total_squares: int = Field(
+        default=0, sa_column=Column(BigInteger, nullable=False, default=0)
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "target_type", "target_id", "dimension", name="uq_rating_aggregate_target_dimension"
+        ),
+        {"sqlite_autoincrement": True},
+    )
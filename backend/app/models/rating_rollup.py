@@ -0,0 +1,55 @@
+"""RatingRollup SQLModel definition."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    Enum as SAEnum,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlmodel import Field
+
+from .base import BaseModel
+from .enums import ReviewTargetType, TrendGranularity
+
+
+class RatingRollup(BaseModel, table=True):
+    """Score statistics of approved reviews written within one time bucket."""
+
+    __tablename__ = "rating_rollup"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    target_type: ReviewTargetType = Field(
+        sa_column=Column(SAEnum(ReviewTargetType, name="rating_rollup_target"), nullable=False)
+    )
+    target_id: int = Field(sa_column=Column(Integer, nullable=False))
+    granularity: TrendGranularity = Field(
+        sa_column=Column(SAEnum(TrendGranularity, name="rating_rollup_granularity"), nullable=False)
+    )
+    dimension: str = Field(sa_column=Column(String(64), nullable=False))
+    bucket_start: date = Field(sa_column=Column(Date, nullable=False))
+    count: int = Field(default=0, sa_column=Column(Integer, nullable=False, default=0))
+    total: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, default=0))
+    total_squares: int = Field(
+        default=0, sa_column=Column(BigInteger, nullable=False, default=0)
+    )
+
+    # A trend is one range scan of this index: target, granularity, dimension, then time.
+    __table_args__ = (
+        UniqueConstraint(
+            "target_type",
+            "target_id",
+            "granularity",
+            "dimension",
+            "bucket_start",
+            name="uq_rating_rollup_bucket",
+        ),
+        {"sqlite_autoincrement": True},
+    )
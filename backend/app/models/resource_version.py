@@ -0,0 +1,29 @@
+"""ResourceVersion SQLModel definition."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlmodel import Field
+
+from .base import BaseModel
+
+
+class ResourceVersion(BaseModel, table=True):
+    """Monotonic change counter of a resource exposed through read endpoints."""
+
+    __tablename__ = "resource_version"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    key: str = Field(sa_column=Column(String(64), unique=True, nullable=False))
+    version: int = Field(default=0, sa_column=Column(Integer, nullable=False, default=0))
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+    __table_args__ = (
+        {"sqlite_autoincrement": True},
+    )
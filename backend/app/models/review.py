@@ -1,7 +1,5 @@
 """Review SQLModel definition."""
 
-from __future__ import annotations
-
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 
@@ -11,8 +9,10 @@ from sqlalchemy import (
     Column,
     DateTime,
     Enum as SAEnum,
+    Index,
     Text,
     UniqueConstraint,
+    text as sql_text,
 )
 from sqlmodel import Field, Relationship
 
@@ -28,6 +28,29 @@ if TYPE_CHECKING:  # pragma: no cover - typing only imports
     from .comment import Comment
 
 
+REVIEW_SCORE_FIELDS = (
+    "governance_score",
+    "infrastructure_score",
+    "support_score",
+    "curriculum_score",
+    "workload_score",
+    "employability_score",
+    "didactics_score",
+    "availability_score",
+    "fairness_score",
+    "content_relevance_score",
+    "assessment_fairness_score",
+    "workload_balance_score",
+)
+
+REVIEW_TARGET_FIELDS = {
+    ReviewTargetType.INSTITUTION: "institution_id",
+    ReviewTargetType.COURSE: "course_id",
+    ReviewTargetType.PROFESSOR: "professor_id",
+    ReviewTargetType.SUBJECT: "subject_id",
+}
+
+
 class Review(BaseModel, table=True):
     """Anonymous review emitted by students pending moderation."""
 
@@ -67,8 +90,21 @@ class Review(BaseModel, table=True):
         default_factory=datetime.utcnow,
         sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
     )
+    resolved_by: Optional[int] = Field(default=None, foreign_key="user.id")
+    resolved_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+    claimed_by: Optional[int] = Field(default=None, foreign_key="user.id")
+    claimed_until: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
 
-    author: "User" = Relationship(back_populates="reviews")
+    author: "User" = Relationship(
+        back_populates="reviews",
+        sa_relationship_kwargs={"foreign_keys": "Review.user_id"},
+    )
     institution: Optional["Institution"] = Relationship(back_populates="reviews")
     course: Optional["Course"] = Relationship(back_populates="reviews")
     professor: Optional["Professor"] = Relationship(back_populates="reviews")
@@ -97,5 +133,15 @@ class Review(BaseModel, table=True):
             ),
             name="ck_review_target_reference",
         ),
+        Index("ix_review_institution_feed", "institution_id", "approved", "created_at", "id"),
+        Index("ix_review_course_feed", "course_id", "approved", "created_at", "id"),
+        Index("ix_review_professor_feed", "professor_id", "approved", "created_at", "id"),
+        Index("ix_review_subject_feed", "subject_id", "approved", "created_at", "id"),
+        Index(
+            "ix_review_moderation_queue",
+            "created_at",
+            "id",
+            sqlite_where=sql_text("approved = 0 AND resolved_at IS NULL"),
+        ),
         {"sqlite_autoincrement": True},
     )
@@ -0,0 +1,77 @@
+"""TargetRanking SQLModel definition."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum as SAEnum,
+    Float,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text as sql_text,
+)
+from sqlmodel import Field
+
+from .base import BaseModel
+from .enums import ReviewTargetType
+
+OVERALL_DIMENSION = "overall"
+
+
+class TargetRanking(BaseModel, table=True):
+    """Materialized Bayesian-shrunk score of one target dimension, scoped for leaderboards."""
+
+    __tablename__ = "target_ranking"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    target_type: ReviewTargetType = Field(
+        sa_column=Column(SAEnum(ReviewTargetType, name="target_ranking_target"), nullable=False)
+    )
+    target_id: int = Field(sa_column=Column(Integer, nullable=False))
+    dimension: str = Field(sa_column=Column(String(64), nullable=False))
+    course_id: Optional[int] = Field(default=None, sa_column=Column(Integer, nullable=True))
+    institution_id: Optional[int] = Field(default=None, sa_column=Column(Integer, nullable=True))
+    review_count: int = Field(sa_column=Column(Integer, nullable=False))
+    mean: float = Field(sa_column=Column(Float, nullable=False))
+    score: float = Field(sa_column=Column(Float, nullable=False))
+    computed_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+    # Leaderboards read the first K entries of one of these indexes in order.
+    __table_args__ = (
+        UniqueConstraint(
+            "target_type", "target_id", "dimension", name="uq_target_ranking_target_dimension"
+        ),
+        Index(
+            "ix_target_ranking_global",
+            "target_type",
+            "dimension",
+            sql_text("score DESC"),
+            "target_id",
+        ),
+        Index(
+            "ix_target_ranking_course",
+            "target_type",
+            "dimension",
+            "course_id",
+            sql_text("score DESC"),
+            "target_id",
+        ),
+        Index(
+            "ix_target_ranking_institution",
+            "target_type",
+            "dimension",
+            "institution_id",
+            sql_text("score DESC"),
+            "target_id",
+        ),
+        {"sqlite_autoincrement": True},
+    )
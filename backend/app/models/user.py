@@ -1,7 +1,5 @@
 """User SQLModel definition."""
 
-from __future__ import annotations
-
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 
@@ -37,7 +35,10 @@ class User(BaseModel, table=True):
     )
 
     course: Optional["Course"] = Relationship(back_populates="students")
-    reviews: List["Review"] = Relationship(back_populates="author")
+    reviews: List["Review"] = Relationship(
+        back_populates="author",
+        sa_relationship_kwargs={"foreign_keys": "Review.user_id"},
+    )
     comments: List["Comment"] = Relationship(back_populates="author")
     created_change_requests: List["ChangeRequest"] = Relationship(
         back_populates="creator",
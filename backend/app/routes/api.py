@@ -1,7 +1,23 @@
 """Primary API router definition."""
 
+from types import ModuleType
+
 from fastapi import APIRouter
 
+from app.core.config import settings
+from app.routes import (
+    auth,
+    cache,
+    catalogue,
+    exports,
+    moderation,
+    rankings,
+    ratings,
+    reviews,
+    search,
+    submissions,
+)
+
 api_router = APIRouter()
 
 
@@ -11,4 +27,23 @@ def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+def _session_router(name: str, module: ModuleType) -> APIRouter:
+    """Pick the async or sync variant of a router according to settings."""
+    if name in settings.async_session_routers:
+        return module.async_router
+    return module.router
+
+
+api_router.include_router(auth.router)
+api_router.include_router(catalogue.router)
+api_router.include_router(_session_router("ratings", ratings))
+api_router.include_router(rankings.router)
+api_router.include_router(_session_router("reviews", reviews))
+api_router.include_router(search.router)
+api_router.include_router(cache.router)
+api_router.include_router(moderation.router)
+api_router.include_router(submissions.router)
+api_router.include_router(exports.router)
+
+
 __all__ = ["api_router"]
@@ -0,0 +1,79 @@
+"""Token issuing endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.auth.dependencies import get_current_user
+from app.auth.passwords import PasswordHasherBusy
+from app.auth.principals import load_principal
+from app.auth.service import authenticate_user
+from app.auth.tokens import (
+    ACCESS_TOKEN,
+    REFRESH_TOKEN,
+    Principal,
+    TokenError,
+    decode_token,
+    issue_token,
+)
+from app.core.config import settings
+from app.database.session import get_async_session, get_write_session
+from app.schemas.auth import LoginRequest, PrincipalRead, RefreshRequest, TokenPair
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+
+def _token_pair(principal: Principal) -> TokenPair:
+    return TokenPair(
+        access_token=issue_token(principal, ACCESS_TOKEN, settings),
+        refresh_token=issue_token(principal, REFRESH_TOKEN, settings),
+        expires_in=settings.access_token_ttl_seconds,
+    )
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+@router.post("/login", response_model=TokenPair, summary="Exchange credentials for tokens")
+async def login(
+    payload: LoginRequest, session: AsyncSession = Depends(get_async_session)
+) -> TokenPair:
+    """Verify credentials and issue an access/refresh token pair."""
+    try:
+        user = await authenticate_user(session, payload.email, payload.password)
+    except PasswordHasherBusy as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        ) from exc
+    if user is None:
+        raise _unauthorized("Incorrect e-mail or password.")
+    return _token_pair(Principal.from_user(user))
+
+
+@router.post("/refresh", response_model=TokenPair, summary="Renew an access token")
+def refresh(payload: RefreshRequest, session: Session = Depends(get_write_session)) -> TokenPair:
+    """Issue a new token pair with claims re-read from the database."""
+    try:
+        claims = decode_token(payload.refresh_token, REFRESH_TOKEN, settings)
+    except TokenError as exc:
+        raise _unauthorized(str(exc)) from exc
+    principal = load_principal(session, claims.principal.id)
+    if principal is None:
+        raise _unauthorized("User no longer exists.")
+    return _token_pair(principal)
+
+
+@router.get("/me", response_model=PrincipalRead, summary="Current principal")
+def read_me(principal: Principal = Depends(get_current_user)) -> PrincipalRead:
+    """Return the claims the API acts on for the caller."""
+    return PrincipalRead(**principal.as_dict())
+
+
+__all__ = ["router"]
@@ -0,0 +1,27 @@
+"""Cache observability endpoints."""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from app.services.catalogue import catalogue_cache
+from app.services.response_cache import response_cache
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/stats", summary="Cache hit, miss and eviction counters")
+def read_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return usage counters and current size of each application cache."""
+    return {
+        "catalogue": {**catalogue_cache.stats.as_dict(), "entries": len(catalogue_cache)},
+        "responses": {
+            **response_cache.stats.as_dict(),
+            "hit_ratio": response_cache.stats.hit_ratio,
+            "entries": len(response_cache),
+            "bytes": response_cache.bytes,
+        },
+    }
+
+
+__all__ = ["router"]
@@ -0,0 +1,171 @@
+"""Server-side response cache for anonymous, version-keyed GET requests."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match, Router
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings
+from app.core.metrics import MetricsRegistry
+from app.database.session import get_read_engine, wrote_recently
+from app.routes.conditional import request_version_keys, versioned_read
+from app.services.response_cache import CachedResponse, ResponseCache
+from app.services.versioning import load_versions
+
+CACHE_HEADER = b"x-cache"
+CONDITIONAL_HEADERS = (b"if-none-match", b"if-modified-since")
+
+
+def _versions(keys: List[str]) -> Dict[str, int]:
+    with Session(get_read_engine()) as session:
+        return {key: version for key, (version, _) in load_versions(session, keys).items()}
+
+
+class ResponseCacheMiddleware:
+    """Serve repeated anonymous GETs of versioned resources from memory.
+
+    Only routes declared with :func:`~app.routes.conditional.versioned` are cached (the
+    same ones ``conditional_get`` validates), keyed by path, query and the current
+    version of every key, so committed approvals and catalogue changes are never served
+    stale.
+    Concurrent misses for one key run the application once. Authenticated, conditional
+    and read-your-writes requests pass straight through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        router: Router,
+        cache: ResponseCache,
+        settings: Settings,
+        registry: MetricsRegistry,
+    ) -> None:
+        self.app = app
+        self.router = router
+        self.cache = cache
+        self.settings = settings
+        self.requests = registry.counter(
+            "response_cache_requests_total", "Cacheable GET requests by outcome.", ("outcome",)
+        )
+        self.hit_ratio = registry.gauge(
+            "response_cache_hit_ratio", "Share of cacheable GETs served without the handler."
+        )
+        self.bytes = registry.gauge("response_cache_bytes", "Bytes held by the response cache.")
+        self.entries = registry.gauge("response_cache_entries", "Responses held in the cache.")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        version_keys = self._version_keys(scope) if scope["type"] == "http" else []
+        if not version_keys:
+            await self.app(scope, receive, send)
+            return
+        if self._bypass(scope):
+            self.requests.inc("bypass")
+            await self.app(scope, receive, send)
+            return
+
+        versions = await run_in_threadpool(_versions, version_keys)
+        key = "|".join(
+            [scope["path"], scope.get("query_string", b"").decode("latin-1")]
+            + [f"{name}={versions.get(name, 0)}" for name in version_keys]
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._observe("hit")
+            await self._replay(cached, send)
+            return
+
+        async def produce() -> Optional[CachedResponse]:
+            return await self._capture(scope, receive, send, frozenset(version_keys))
+
+        response, produced = await self.cache.coalesce(key, produce)
+        if produced:
+            if response is not None and self._storable(response):
+                self.cache.put(key, response)
+            self._observe("miss")
+        elif response is not None:
+            self._observe("coalesced")
+            await self._replay(response, send)
+        else:
+            self._observe("miss")
+            await self.app(scope, receive, send)
+
+    def _version_keys(self, scope: Scope) -> List[str]:
+        if scope["method"] != "GET":
+            return []
+        for route in self.router.routes:
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                if versioned_read(route) is None:
+                    return []
+                try:
+                    return sorted(set(request_version_keys(Request({**scope, **child_scope}))))
+                except ValueError:
+                    return []
+        return []
+
+    def _bypass(self, scope: Scope) -> bool:
+        headers = dict(scope["headers"])
+        if b"authorization" in headers or any(name in headers for name in CONDITIONAL_HEADERS):
+            return True
+        return bool(self.settings.read_database_url) and wrote_recently(Request(scope))
+
+    @staticmethod
+    def _storable(response: CachedResponse) -> bool:
+        return response.status == 200 and all(
+            name.lower() != b"set-cookie" for name, _ in response.headers
+        )
+
+    async def _capture(
+        self, scope: Scope, receive: Receive, send: Send, resources: frozenset
+    ) -> Optional[CachedResponse]:
+        """Run the application for this client while recording what it sends."""
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+        state = {"size": 0, "complete": False}
+
+        async def recording_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+                message = {**message, "headers": [*message["headers"], (CACHE_HEADER, b"MISS")]}
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                state["size"] += len(body)
+                if state["size"] <= self.cache.max_entry_bytes:
+                    chunks.append(body)
+                state["complete"] = not message.get("more_body", False)
+            await send(message)
+
+        await self.app(scope, receive, recording_send)
+        if not start or not state["complete"] or state["size"] > self.cache.max_entry_bytes:
+            return None
+        return CachedResponse(
+            status=start["status"],
+            headers=tuple((bytes(name), bytes(value)) for name, value in start["headers"]),
+            body=b"".join(chunks),
+            resources=resources,
+        )
+
+    @staticmethod
+    async def _replay(response: CachedResponse, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [*response.headers, (CACHE_HEADER, b"HIT")],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.body})
+
+    def _observe(self, outcome: str) -> None:
+        self.requests.inc(outcome)
+        self.hit_ratio.set(value=self.cache.stats.hit_ratio)
+        self.bytes.set(value=self.cache.bytes)
+        self.entries.set(value=len(self.cache))
+
+
+__all__ = ["ResponseCacheMiddleware"]
@@ -0,0 +1,128 @@
+"""Catalogue browsing endpoints served through the catalogue cache."""
+
+from typing import Any, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlmodel import Session
+
+from app.database.session import get_read_session
+from app.routes.conditional import versioned
+from app.routes.rendering import render
+from app.schemas.course import CourseRead
+from app.schemas.institution import InstitutionRead
+from app.schemas.professor import ProfessorRead
+from app.schemas.subject import SubjectRead
+from app.services import catalogue
+from app.services.versioning import INSTITUTION_LIST_KEY
+
+router = APIRouter(tags=["catalogue"])
+
+
+def _found(entity: Optional[Any], label: str) -> Any:
+    if entity is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{label} not found.")
+    return entity
+
+
+@router.get("/institutions", response_model=List[InstitutionRead], summary="List institutions")
+@versioned(keys=[INSTITUTION_LIST_KEY])
+def read_institutions(response: Response, session: Session = Depends(get_read_session)) -> Any:
+    """Return every institution ordered by name."""
+    return render(catalogue.list_institutions(session), response)
+
+
+@router.get(
+    "/institutions/{institution_id}", response_model=InstitutionRead, summary="Read an institution"
+)
+@versioned()
+def read_institution(
+    institution_id: int,
+    response: Response,
+    session: Session = Depends(get_read_session),
+) -> Any:
+    """Return a single institution."""
+    return render(
+        _found(catalogue.get_institution(session, institution_id), "Institution"), response
+    )
+
+
+@router.get(
+    "/institutions/{institution_id}/courses",
+    response_model=List[CourseRead],
+    summary="List courses of an institution",
+)
+@versioned()
+def read_institution_courses(
+    institution_id: int,
+    response: Response,
+    session: Session = Depends(get_read_session),
+) -> Any:
+    """Return the courses offered by an institution."""
+    _found(catalogue.get_institution(session, institution_id), "Institution")
+    return render(catalogue.list_institution_courses(session, institution_id), response)
+
+
+@router.get("/courses/{course_id}", response_model=CourseRead, summary="Read a course")
+@versioned()
+def read_course(
+    course_id: int, response: Response, session: Session = Depends(get_read_session)
+) -> Any:
+    """Return a single course."""
+    return render(_found(catalogue.get_course(session, course_id), "Course"), response)
+
+
+@router.get(
+    "/courses/{course_id}/professors",
+    response_model=List[ProfessorRead],
+    summary="List professors of a course",
+)
+@versioned()
+def read_course_professors(
+    course_id: int,
+    response: Response,
+    session: Session = Depends(get_read_session),
+) -> Any:
+    """Return the professors of a course."""
+    _found(catalogue.get_course(session, course_id), "Course")
+    return render(catalogue.list_course_professors(session, course_id), response)
+
+
+@router.get(
+    "/courses/{course_id}/subjects",
+    response_model=List[SubjectRead],
+    summary="List subjects of a course",
+)
+@versioned()
+def read_course_subjects(
+    course_id: int,
+    response: Response,
+    session: Session = Depends(get_read_session),
+) -> Any:
+    """Return the subjects of a course."""
+    _found(catalogue.get_course(session, course_id), "Course")
+    return render(catalogue.list_course_subjects(session, course_id), response)
+
+
+@router.get("/professors/{professor_id}", response_model=ProfessorRead, summary="Read a professor")
+@versioned()
+def read_professor(
+    professor_id: int,
+    response: Response,
+    session: Session = Depends(get_read_session),
+) -> Any:
+    """Return a single professor."""
+    return render(_found(catalogue.get_professor(session, professor_id), "Professor"), response)
+
+
+@router.get("/subjects/{subject_id}", response_model=SubjectRead, summary="Read a subject")
+@versioned()
+def read_subject(
+    subject_id: int,
+    response: Response,
+    session: Session = Depends(get_read_session),
+) -> Any:
+    """Return a single subject."""
+    return render(_found(catalogue.get_subject(session, subject_id), "Subject"), response)
+
+
+__all__ = ["router"]
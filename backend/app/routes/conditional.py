@@ -0,0 +1,142 @@
+"""Conditional GET support driven by resource version counters."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from dataclasses import dataclass
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlmodel import Session
+
+from app.database.session import get_read_session
+from app.models.enums import ReviewTargetType
+from app.services.versioning import load_versions, resource_key, review_key
+
+PATH_PARAM_TARGETS = {
+    "institution_id": ReviewTargetType.INSTITUTION,
+    "course_id": ReviewTargetType.COURSE,
+    "professor_id": ReviewTargetType.PROFESSOR,
+    "subject_id": ReviewTargetType.SUBJECT,
+}
+
+_VERSIONED_READ = "__versioned_read__"
+
+Endpoint = TypeVar("Endpoint", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class VersionedRead:
+    """Where a read endpoint's version keys come from, besides its path parameters."""
+
+    target_query: bool = False
+    keys: Tuple[str, ...] = ()
+
+
+def versioned(
+    *, target_query: bool = False, keys: Sequence[str] = ()
+) -> Callable[[Endpoint], Endpoint]:
+    """Declare an endpoint's response a function of the resources it names.
+
+    Path parameters in :data:`PATH_PARAM_TARGETS`, ``review_id`` and the
+    ``target_type``/``target_id`` pair always count. Query parameters count only when
+    ``target_query`` asks for the ``target_type``/``target_id`` pair; ``keys`` adds
+    fixed list keys. Only declared endpoints get validators or reach the response cache.
+    """
+
+    def decorator(endpoint: Endpoint) -> Endpoint:
+        setattr(endpoint, _VERSIONED_READ, VersionedRead(target_query, tuple(keys)))
+        return endpoint
+
+    return decorator
+
+
+def versioned_read(route: Any) -> Optional[VersionedRead]:
+    """Return the declaration of a matched route's endpoint, if it is a versioned read."""
+    return getattr(getattr(route, "endpoint", None), _VERSIONED_READ, None)
+
+
+def _target_key(params: Mapping[str, Any]) -> Optional[str]:
+    if "target_type" not in params or "target_id" not in params:
+        return None
+    target_type = ReviewTargetType(str(params["target_type"]).upper())
+    return resource_key(target_type, int(params["target_id"]))
+
+
+def request_version_keys(request: Request) -> List[str]:
+    """Return the version keys a read request depends on, or an empty list.
+
+    Raises ``ValueError`` when a parameter the keys come from is malformed.
+    """
+    declared = versioned_read(request.scope.get("route"))
+    if declared is None:
+        return []
+    params = request.path_params
+    keys = [
+        resource_key(target_type, int(params[name]))
+        for name, target_type in PATH_PARAM_TARGETS.items()
+        if name in params
+    ]
+    if "review_id" in params:
+        keys.append(review_key(int(params["review_id"])))
+    sources = [params, request.query_params] if declared.target_query else [params]
+    keys.extend(key for key in map(_target_key, sources) if key is not None)
+    keys.extend(declared.keys)
+    return keys
+
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[str]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates or etag[2:] in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def conditional_get(
+    request: Request, response: Response, session: Session = Depends(get_read_session)
+) -> None:
+    """Attach validators to versioned reads and short-circuit unchanged ones with 304."""
+    if request.method not in ("GET", "HEAD"):
+        return
+    try:
+        keys = request_version_keys(request)
+    except ValueError:
+        return
+    if not keys:
+        return
+
+    versions = load_versions(session, keys)
+    digest = hashlib.sha1(request.url.path.encode())
+    digest.update(request.url.query.encode())
+    for key in sorted(keys):
+        version = versions[key][0] if key in versions else 0
+        digest.update(f"|{key}={version}".encode())
+    headers = {"ETag": f'W/"{digest.hexdigest()[:32]}"', "Cache-Control": "no-cache"}
+    if versions:
+        updated_at = max(updated for _, updated in versions.values())
+        headers["Last-Modified"] = format_datetime(
+            updated_at.replace(tzinfo=timezone.utc), usegmt=True
+        )
+
+    if _not_modified(request, headers["ETag"], headers.get("Last-Modified")):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+
+__all__ = [
+    "PATH_PARAM_TARGETS",
+    "VersionedRead",
+    "conditional_get",
+    "request_version_keys",
+    "versioned",
+    "versioned_read",
+]
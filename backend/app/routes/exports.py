@@ -0,0 +1,66 @@
+"""Streaming research exports of approved reviews."""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.auth.dependencies import get_current_user
+from app.auth.tokens import Principal
+from app.core.config import settings
+from app.database.session import get_read_engine
+from app.models.enums import ReviewTargetType
+from app.services.export import (
+    EXPORT_FORMATS,
+    MEDIA_TYPES,
+    ExportUnavailableError,
+    export_reviews,
+    require_format,
+)
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+def require_exporter(user: Principal = Depends(get_current_user)) -> Principal:
+    """Allow only the roles configured in ``settings.export_roles`` through."""
+    if user.role.value not in settings.export_roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Export access required."
+        )
+    return user
+
+
+@router.get(
+    "/reviews",
+    response_class=StreamingResponse,
+    summary="Export approved reviews",
+    dependencies=[Depends(require_exporter)],
+)
+def export_approved_reviews(
+    export_format: str = Query("csv", alias="format", regex=f"^({'|'.join(EXPORT_FORMATS)})$"),
+    target_type: Optional[ReviewTargetType] = None,
+    since: Optional[datetime] = None,
+) -> StreamingResponse:
+    """Stream every approved review with its author replaced by a per-export pseudonym."""
+    try:
+        require_format(export_format)
+    except ExportUnavailableError as exc:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc)) from exc
+    chunks = export_reviews(
+        get_read_engine(),
+        export_format,
+        settings.export_batch_size,
+        target_type,
+        since,
+        settings.export_author_key,
+    )
+    filename = f"reviews.{export_format}"
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+__all__ = ["router"]
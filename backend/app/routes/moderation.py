@@ -0,0 +1,140 @@
+"""Moderation queue endpoints for pending reviews and change requests."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import Session
+
+from app.auth.dependencies import require_moderator
+from app.auth.tokens import Principal
+from app.database.session import get_write_session
+from app.schemas.moderation import (
+    ModerationClaim,
+    ModerationDecision,
+    ModerationResult,
+    PendingChangeRequestPage,
+    PendingChangeRequestRead,
+    PendingReviewPage,
+    PendingReviewRead,
+)
+from app.services import moderation
+from app.services.change_requests import StaleTargetError
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+
+router = APIRouter(
+    prefix="/moderation", tags=["moderation"], dependencies=[Depends(require_moderator)]
+)
+
+
+def _invalid_cursor(exc: InvalidCursorError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.get("/reviews", response_model=PendingReviewPage, summary="Pending review queue")
+def read_review_queue(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: Session = Depends(get_write_session),
+) -> PendingReviewPage:
+    """Return pending reviews oldest first, paginated by an opaque cursor."""
+    try:
+        reviews, next_cursor = moderation.list_pending_reviews(session, cursor, limit)
+    except InvalidCursorError as exc:
+        raise _invalid_cursor(exc) from exc
+    return PendingReviewPage(
+        items=[PendingReviewRead.from_orm(review) for review in reviews], next_cursor=next_cursor
+    )
+
+
+@router.post(
+    "/reviews/claim", response_model=List[PendingReviewRead], summary="Claim pending reviews"
+)
+def claim_reviews(
+    claim: ModerationClaim,
+    moderator: Principal = Depends(require_moderator),
+    session: Session = Depends(get_write_session),
+) -> List[PendingReviewRead]:
+    """Claim the oldest pending reviews nobody else is working on."""
+    reviews = moderation.claim_reviews(session, moderator.id, claim.limit)
+    session.commit()
+    return [PendingReviewRead.from_orm(review) for review in reviews]
+
+
+@router.post(
+    "/reviews/decisions", response_model=ModerationResult, summary="Approve or reject reviews"
+)
+def decide_reviews(
+    decision: ModerationDecision,
+    moderator: Principal = Depends(require_moderator),
+    session: Session = Depends(get_write_session),
+) -> ModerationResult:
+    """Resolve a batch of pending reviews in a single transaction."""
+    resolved, skipped = moderation.resolve_reviews(
+        session, moderator.id, decision.ids, decision.approve
+    )
+    session.commit()
+    return ModerationResult(resolved=resolved, skipped=skipped)
+
+
+@router.get(
+    "/change-requests",
+    response_model=PendingChangeRequestPage,
+    summary="Pending change request queue",
+)
+def read_change_request_queue(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: Session = Depends(get_write_session),
+) -> PendingChangeRequestPage:
+    """Return pending change requests oldest first, paginated by an opaque cursor."""
+    try:
+        items, next_cursor = moderation.list_pending_change_requests(session, cursor, limit)
+    except InvalidCursorError as exc:
+        raise _invalid_cursor(exc) from exc
+    return PendingChangeRequestPage(
+        items=[PendingChangeRequestRead.from_orm(item) for item in items],
+        next_cursor=next_cursor,
+    )
+
+
+@router.post(
+    "/change-requests/claim",
+    response_model=List[PendingChangeRequestRead],
+    summary="Claim pending change requests",
+)
+def claim_change_requests(
+    claim: ModerationClaim,
+    moderator: Principal = Depends(require_moderator),
+    session: Session = Depends(get_write_session),
+) -> List[PendingChangeRequestRead]:
+    """Claim the oldest pending change requests nobody else is working on."""
+    items = moderation.claim_change_requests(session, moderator.id, claim.limit)
+    session.commit()
+    return [PendingChangeRequestRead.from_orm(item) for item in items]
+
+
+@router.post(
+    "/change-requests/decisions",
+    response_model=ModerationResult,
+    summary="Approve or reject change requests",
+)
+def decide_change_requests(
+    decision: ModerationDecision,
+    moderator: Principal = Depends(require_moderator),
+    session: Session = Depends(get_write_session),
+) -> ModerationResult:
+    """Resolve a batch of pending change requests, applying approved ones in one transaction.
+
+    Approved requests the apply engine refuses stay pending and are listed in ``refused``.
+    """
+    try:
+        resolved, skipped, refused = moderation.resolve_change_requests(
+            session, moderator.id, decision.ids, decision.approve
+        )
+    except StaleTargetError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    session.commit()
+    return ModerationResult(resolved=resolved, skipped=skipped, refused=refused)
+
+
+__all__ = ["router"]
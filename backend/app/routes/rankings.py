@@ -0,0 +1,53 @@
+"""Leaderboard endpoints served from materialized rankings."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import Session
+
+from app.database.session import get_read_session
+from app.models import OVERALL_DIMENSION
+from app.models.enums import ReviewTargetType
+from app.routes.conditional import versioned
+from app.schemas.ranking import LeaderboardRead, RankingEntry
+from app.services.rankings import RANKING_DIMENSIONS, RANKINGS_KEY, leaderboard_statement
+
+router = APIRouter(prefix="/rankings", tags=["rankings"])
+
+MAX_LEADERBOARD_SIZE = 100
+
+
+@router.get("/{target_type}", response_model=LeaderboardRead, summary="Top-rated targets")
+@versioned(keys=[RANKINGS_KEY])
+def read_leaderboard(
+    target_type: ReviewTargetType,
+    dimension: str = OVERALL_DIMENSION,
+    course_id: Optional[int] = None,
+    institution_id: Optional[int] = None,
+    min_reviews: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=MAX_LEADERBOARD_SIZE),
+    session: Session = Depends(get_read_session),
+) -> LeaderboardRead:
+    """Return targets ordered by Bayesian-shrunk score within an optional scope."""
+    if dimension not in RANKING_DIMENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown dimension {dimension!r}."
+        )
+    statement = leaderboard_statement(
+        target_type, dimension, limit, course_id, institution_id, min_reviews
+    )
+    rows = session.execute(statement).mappings().all()
+    return LeaderboardRead(
+        target_type=target_type,
+        dimension=dimension,
+        course_id=course_id,
+        institution_id=institution_id,
+        computed_at=max((row["computed_at"] for row in rows), default=None),
+        items=[
+            RankingEntry(position=position, **row)
+            for position, row in enumerate(rows, start=1)
+        ],
+    )
+
+
+__all__ = ["router"]
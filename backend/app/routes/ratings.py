@@ -0,0 +1,145 @@
+"""Rating aggregate endpoints."""
+
+from datetime import date
+from itertools import groupby
+from typing import Iterable, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database.session import get_async_read_session, get_read_session
+from app.models import REVIEW_SCORE_FIELDS, RatingAggregate, RatingRollup
+from app.models.enums import ReviewTargetType, TrendGranularity
+from app.routes.conditional import versioned
+from app.schemas.rating import (
+    RatingDimensionRead,
+    RatingSummaryRead,
+    RatingTrendPoint,
+    RatingTrendRead,
+    RatingTrendSeries,
+)
+from app.services.ratings import get_rating_aggregates, rating_aggregates_statement
+from app.services.trends import get_rating_trend, rating_trend_statement
+
+router = APIRouter(prefix="/ratings", tags=["ratings"])
+async_router = APIRouter(prefix="/ratings", tags=["ratings"])
+
+SUMMARY_PATH = "/{target_type}/{target_id}"
+SUMMARY_DESCRIPTION = "Aggregated review scores for a target"
+TREND_PATH = "/{target_type}/{target_id}/trends"
+TREND_DESCRIPTION = "Review score trends of a target over time"
+
+
+def _summary(
+    target_type: ReviewTargetType, target_id: int, aggregates: Iterable[RatingAggregate]
+) -> RatingSummaryRead:
+    """Convert aggregate rows into the public summary schema."""
+    return RatingSummaryRead(
+        target_type=target_type,
+        target_id=target_id,
+        dimensions=[
+            RatingDimensionRead.from_totals(
+                aggregate.dimension, aggregate.count, aggregate.total, aggregate.total_squares
+            )
+            for aggregate in aggregates
+        ],
+    )
+
+
+def _trend(
+    target_type: ReviewTargetType,
+    target_id: int,
+    granularity: TrendGranularity,
+    rollups: Iterable[RatingRollup],
+) -> RatingTrendRead:
+    """Group rollup rows, already ordered by dimension and time, into series."""
+    return RatingTrendRead(
+        target_type=target_type,
+        target_id=target_id,
+        granularity=granularity,
+        dimensions=[
+            RatingTrendSeries(
+                dimension=dimension,
+                points=[
+                    RatingTrendPoint.from_totals(
+                        rollup.bucket_start, rollup.count, rollup.total, rollup.total_squares
+                    )
+                    for rollup in rows
+                ],
+            )
+            for dimension, rows in groupby(rollups, key=lambda rollup: rollup.dimension)
+        ],
+    )
+
+
+def _check_dimension(dimension: Optional[str]) -> None:
+    if dimension is not None and dimension not in REVIEW_SCORE_FIELDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown dimension {dimension!r}."
+        )
+
+
+@router.get(SUMMARY_PATH, response_model=RatingSummaryRead, summary=SUMMARY_DESCRIPTION)
+@versioned()
+def read_rating_summary(
+    target_type: ReviewTargetType,
+    target_id: int,
+    session: Session = Depends(get_read_session),
+) -> RatingSummaryRead:
+    """Return precomputed score statistics without scanning reviews."""
+    return _summary(target_type, target_id, get_rating_aggregates(session, target_type, target_id))
+
+
+@async_router.get(SUMMARY_PATH, response_model=RatingSummaryRead, summary=SUMMARY_DESCRIPTION)
+@versioned()
+async def read_rating_summary_async(
+    target_type: ReviewTargetType,
+    target_id: int,
+    session: AsyncSession = Depends(get_async_read_session),
+) -> RatingSummaryRead:
+    """Return precomputed score statistics using the async engine."""
+    result = await session.execute(rating_aggregates_statement(target_type, target_id))
+    return _summary(target_type, target_id, result.scalars())
+
+
+@router.get(TREND_PATH, response_model=RatingTrendRead, summary=TREND_DESCRIPTION)
+@versioned()
+def read_rating_trend(
+    target_type: ReviewTargetType,
+    target_id: int,
+    granularity: TrendGranularity = TrendGranularity.MONTH,
+    dimension: Optional[str] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    session: Session = Depends(get_read_session),
+) -> RatingTrendRead:
+    """Return per-bucket score statistics from the rollup table without scanning reviews."""
+    _check_dimension(dimension)
+    rollups = get_rating_trend(
+        session, target_type, target_id, granularity, dimension, since, until
+    )
+    return _trend(target_type, target_id, granularity, rollups)
+
+
+@async_router.get(TREND_PATH, response_model=RatingTrendRead, summary=TREND_DESCRIPTION)
+@versioned()
+async def read_rating_trend_async(
+    target_type: ReviewTargetType,
+    target_id: int,
+    granularity: TrendGranularity = TrendGranularity.MONTH,
+    dimension: Optional[str] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    session: AsyncSession = Depends(get_async_read_session),
+) -> RatingTrendRead:
+    """Return per-bucket score statistics using the async engine."""
+    _check_dimension(dimension)
+    statement = rating_trend_statement(
+        target_type, target_id, granularity, dimension, since, until
+    )
+    result = await session.execute(statement)
+    return _trend(target_type, target_id, granularity, result.scalars())
+
+
+__all__ = ["async_router", "router"]
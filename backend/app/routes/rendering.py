@@ -0,0 +1,26 @@
+"""Opt-in response rendering that bypasses FastAPI's validate-and-encode step."""
+
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+from app.core.config import settings
+
+
+def render(content: Any, response: Response) -> Any:
+    """Return ``content`` for ``response_model`` handling, or pre-rendered JSON in fast mode.
+
+    With ``settings.fast_serialization`` the plain dicts/lists are dumped straight to
+    bytes with orjson. Only pass content built from slim schemas, whose rows already
+    match the route's ``response_model``. Headers that dependencies put on the shared
+    ``response`` (ETag, Cache-Control) are carried over.
+    """
+    if not settings.fast_serialization:
+        return content
+    rendered = ORJSONResponse(content, status_code=response.status_code or 200)
+    rendered.headers.raw.extend(response.headers.raw)
+    return rendered
+
+
+__all__ = ["render"]
@@ -0,0 +1,149 @@
+"""Review feed and comment thread endpoints."""
+
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database.session import get_async_read_session, get_read_session
+from app.models import Review
+from app.models.enums import ReviewTargetType
+from app.routes.conditional import versioned
+from app.routes.rendering import render
+from app.schemas.comment import CommentPage
+from app.schemas.review import ReviewPage, ReviewThreadRead
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+from app.services.reviews import (
+    approved_review_rows_statement,
+    comment_page,
+    get_approved_review,
+    get_review_thread,
+    list_approved_review_rows,
+    list_review_comment_rows,
+    review_comment_rows_statement,
+    review_page,
+)
+
+router = APIRouter(prefix="/reviews", tags=["reviews"])
+async_router = APIRouter(prefix="/reviews", tags=["reviews"])
+
+FEED_SUMMARY = "Approved reviews of a target"
+THREAD_SUMMARY = "Comment thread of a review"
+REVIEW_SUMMARY = "Approved review with its comment thread"
+
+
+def _invalid_cursor(exc: InvalidCursorError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+def _review_not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found.")
+
+
+@router.get("", response_model=ReviewPage, summary=FEED_SUMMARY)
+@versioned(target_query=True)
+def read_review_feed(
+    target_type: ReviewTargetType,
+    target_id: int,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: Session = Depends(get_read_session),
+) -> Any:
+    """Return approved reviews newest first, paginated by an opaque cursor."""
+    try:
+        items, next_cursor = list_approved_review_rows(
+            session, target_type, target_id, cursor, limit
+        )
+    except InvalidCursorError as exc:
+        raise _invalid_cursor(exc) from exc
+    return render({"items": items, "next_cursor": next_cursor}, response)
+
+
+@router.get("/{review_id}", response_model=ReviewThreadRead, summary=REVIEW_SUMMARY)
+@versioned()
+def read_review(
+    review_id: int, response: Response, session: Session = Depends(get_read_session)
+) -> Any:
+    """Return an approved review and every comment on it, oldest first."""
+    thread = get_review_thread(session, review_id)
+    if thread is None:
+        raise _review_not_found()
+    return render(thread, response)
+
+
+@router.get("/{review_id}/comments", response_model=CommentPage, summary=THREAD_SUMMARY)
+@versioned()
+def read_review_comments(
+    review_id: int,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: Session = Depends(get_read_session),
+) -> Any:
+    """Return comments of an approved review oldest first, paginated by cursor."""
+    if get_approved_review(session, review_id) is None:
+        raise _review_not_found()
+    try:
+        items, next_cursor = list_review_comment_rows(session, review_id, cursor, limit)
+    except InvalidCursorError as exc:
+        raise _invalid_cursor(exc) from exc
+    return render({"items": items, "next_cursor": next_cursor}, response)
+
+
+@async_router.get("", response_model=ReviewPage, summary=FEED_SUMMARY)
+@versioned(target_query=True)
+async def read_review_feed_async(
+    target_type: ReviewTargetType,
+    target_id: int,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Any:
+    """Return approved reviews newest first using the async engine."""
+    try:
+        statement = approved_review_rows_statement(target_type, target_id, cursor, limit)
+    except InvalidCursorError as exc:
+        raise _invalid_cursor(exc) from exc
+    items, next_cursor = review_page((await session.execute(statement)).all(), limit)
+    return render({"items": items, "next_cursor": next_cursor}, response)
+
+
+@async_router.get("/{review_id}", response_model=ReviewThreadRead, summary=REVIEW_SUMMARY)
+@versioned()
+async def read_review_async(
+    review_id: int,
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Any:
+    """Return an approved review and its comment thread using the async engine."""
+    thread = await session.run_sync(get_review_thread, review_id)
+    if thread is None:
+        raise _review_not_found()
+    return render(thread, response)
+
+
+@async_router.get("/{review_id}/comments", response_model=CommentPage, summary=THREAD_SUMMARY)
+@versioned()
+async def read_review_comments_async(
+    review_id: int,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_async_read_session),
+) -> Any:
+    """Return comments of an approved review using the async engine."""
+    review = await session.get(Review, review_id)
+    if review is None or not review.approved:
+        raise _review_not_found()
+    try:
+        statement = review_comment_rows_statement(review_id, cursor, limit)
+    except InvalidCursorError as exc:
+        raise _invalid_cursor(exc) from exc
+    items, next_cursor = comment_page((await session.execute(statement)).all(), limit)
+    return render({"items": items, "next_cursor": next_cursor}, response)
+
+
+__all__ = ["async_router", "router"]
@@ -0,0 +1,70 @@
+"""Full-text search endpoints."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+
+from app.database.session import get_read_session
+from app.models.enums import ReviewTargetType
+from app.schemas.search import (
+    CatalogueSearchHit,
+    CatalogueSearchResults,
+    ReviewTextSearchHit,
+    ReviewTextSearchResults,
+)
+from app.services.search import search_catalogue, search_review_text
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_model=CatalogueSearchResults, summary="Search the catalogue")
+def read_catalogue_search(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[List[ReviewTargetType]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    session: Session = Depends(get_read_session),
+) -> CatalogueSearchResults:
+    """Rank institutions, courses, professors and subjects by name relevance."""
+    hits = search_catalogue(session, q, types, limit)
+    return CatalogueSearchResults(
+        query=q,
+        results=[
+            CatalogueSearchHit(
+                entity_type=hit.entity_type,
+                entity_id=hit.entity_id,
+                name=hit.name,
+                score=hit.score,
+            )
+            for hit in hits
+        ],
+    )
+
+
+@router.get("/reviews", response_model=ReviewTextSearchResults, summary="Search review text")
+def read_review_text_search(
+    q: str = Query(..., min_length=1, max_length=200),
+    target_type: Optional[ReviewTargetType] = None,
+    target_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=100),
+    session: Session = Depends(get_read_session),
+) -> ReviewTextSearchResults:
+    """Rank approved reviews and their comments by text relevance."""
+    hits = search_review_text(session, q, target_type, target_id, limit)
+    return ReviewTextSearchResults(
+        query=q,
+        results=[
+            ReviewTextSearchHit(
+                review_id=hit.review_id,
+                comment_id=hit.comment_id,
+                target_type=hit.target_type,
+                target_id=hit.target_id,
+                snippet=hit.snippet,
+                score=hit.score,
+            )
+            for hit in hits
+        ],
+    )
+
+
+__all__ = ["router"]
@@ -0,0 +1,109 @@
+"""Write endpoints for reviews, comments and change requests, behind rate limits."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel import Session
+
+from app.auth.dependencies import require_validated
+from app.auth.tokens import Principal
+from app.database.session import get_write_session
+from app.models.enums import UserRole
+from app.routes.throttling import rate_limited
+from app.schemas.change_request import ChangeRequestCreate, ChangeRequestRead
+from app.schemas.comment import CommentCreate, CommentRead
+from app.schemas.review import ReviewCreate, ReviewSubmitted
+from app.services.change_requests import InvalidSuggestionError
+from app.services.submissions import (
+    DuplicateReviewError,
+    TargetNotFoundError,
+    create_change_request,
+    create_comment,
+    create_review,
+)
+
+router = APIRouter(tags=["submissions"])
+
+
+def _not_found(exc: TargetNotFoundError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+
+
+@router.post(
+    "/reviews",
+    response_model=ReviewSubmitted,
+    status_code=status.HTTP_201_CREATED,
+    summary="Submit a review",
+    dependencies=[Depends(rate_limited("reviews.create"))],
+)
+def submit_review(
+    payload: ReviewCreate,
+    user: Principal = Depends(require_validated),
+    session: Session = Depends(get_write_session),
+) -> ReviewSubmitted:
+    """Store a review that becomes public once a moderator approves it."""
+    values = payload.dict(exclude={"target_type", "target_id"})
+    try:
+        review = create_review(session, user.id, payload.target_type, payload.target_id, values)
+    except TargetNotFoundError as exc:
+        raise _not_found(exc) from exc
+    except DuplicateReviewError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    session.commit()
+    return ReviewSubmitted.from_orm(review)
+
+
+@router.post(
+    "/reviews/{review_id}/comments",
+    response_model=CommentRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Comment on a review",
+    dependencies=[Depends(rate_limited("comments.create"))],
+)
+def submit_comment(
+    review_id: int,
+    payload: CommentCreate,
+    user: Principal = Depends(require_validated),
+    session: Session = Depends(get_write_session),
+) -> CommentRead:
+    """Append a comment to an approved review."""
+    try:
+        comment = create_comment(session, user.id, user.role, review_id, payload.text)
+    except TargetNotFoundError as exc:
+        raise _not_found(exc) from exc
+    session.commit()
+    return CommentRead.from_orm(comment)
+
+
+@router.post(
+    "/change-requests",
+    response_model=ChangeRequestRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Suggest a catalogue correction",
+    dependencies=[Depends(rate_limited("change_requests.create"))],
+)
+def submit_change_request(
+    payload: ChangeRequestCreate,
+    user: Principal = Depends(require_validated),
+    session: Session = Depends(get_write_session),
+) -> ChangeRequestRead:
+    """Queue a correction of a catalogue entry for moderation."""
+    try:
+        change_request = create_change_request(
+            session,
+            user.id,
+            payload.target_type,
+            payload.target_id,
+            payload.suggested_data,
+            from_official_source=user.role == UserRole.INSTITUTION,
+            base_version=payload.base_version,
+        )
+    except TargetNotFoundError as exc:
+        raise _not_found(exc) from exc
+    except InvalidSuggestionError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    session.commit()
+    return ChangeRequestRead.from_orm(change_request)
+
+
+__all__ = ["router"]
@@ -0,0 +1,47 @@
+"""Rate-limiting dependencies for write routes."""
+
+from typing import Callable, Optional
+
+from fastapi import Depends, HTTPException, Request, status
+
+from app.auth.dependencies import get_current_user
+from app.auth.tokens import Principal
+from app.core.config import settings
+from app.core.metrics import registry
+from app.services.rate_limit import rate_limiter, retry_after_header
+
+throttled_requests = registry.counter(
+    "rate_limited_requests_total", "Write requests rejected by rate limiting.", ["route"]
+)
+
+
+def client_address(request: Request) -> Optional[str]:
+    """Return the caller's address, honouring X-Forwarded-For only when configured."""
+    if settings.rate_limit_trust_forwarded_for:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else None
+
+
+def rate_limited(route: str) -> Callable[..., None]:
+    """Build a dependency charging the caller's buckets for ``route``.
+
+    Declare it in the route's ``dependencies`` so it runs before the endpoint's own
+    dependencies; a throttled request never reaches a database transaction.
+    """
+
+    def dependency(request: Request, principal: Principal = Depends(get_current_user)) -> None:
+        wait = rate_limiter.check(route, principal.id, client_address(request))
+        if wait:
+            throttled_requests.inc(route)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded.",
+                headers={"Retry-After": retry_after_header(wait)},
+            )
+
+    return dependency
+
+
+__all__ = ["client_address", "rate_limited", "throttled_requests"]
@@ -1,9 +1,100 @@
 """Pydantic schemas package."""
 
-from .institution import InstitutionCreate, InstitutionRead, InstitutionUpdate
+from .auth import LoginRequest, PrincipalRead, RefreshRequest, TokenPair
+from .base import SlimSchema
+from .change_request import ChangeRequestCreate, ChangeRequestRead
+from .comment import CommentCreate, CommentPage, CommentRead, CommentReadSlim
+from .course import CourseCreate, CourseRead, CourseReadSlim, CourseUpdate
+from .institution import (
+    InstitutionCreate,
+    InstitutionRead,
+    InstitutionReadSlim,
+    InstitutionUpdate,
+)
+from .moderation import (
+    ModerationClaim,
+    ModerationDecision,
+    ModerationResult,
+    PendingChangeRequestPage,
+    PendingChangeRequestRead,
+    PendingReviewPage,
+    PendingReviewRead,
+)
+from .professor import ProfessorCreate, ProfessorRead, ProfessorReadSlim, ProfessorUpdate
+from .ranking import LeaderboardRead, RankingEntry
+from .rating import (
+    RatingDimensionRead,
+    RatingSummaryRead,
+    RatingTrendPoint,
+    RatingTrendRead,
+    RatingTrendSeries,
+)
+from .review import (
+    ReviewCreate,
+    ReviewPage,
+    ReviewRead,
+    ReviewReadSlim,
+    ReviewSubmitted,
+    ReviewThreadRead,
+)
+from .search import (
+    CatalogueSearchHit,
+    CatalogueSearchResults,
+    ReviewTextSearchHit,
+    ReviewTextSearchResults,
+)
+from .subject import SubjectCreate, SubjectRead, SubjectReadSlim, SubjectUpdate
 
 __all__ = [
+    "CatalogueSearchHit",
+    "CatalogueSearchResults",
+    "ChangeRequestCreate",
+    "ChangeRequestRead",
+    "CommentCreate",
+    "CommentPage",
+    "CommentRead",
+    "CommentReadSlim",
+    "CourseCreate",
+    "CourseRead",
+    "CourseReadSlim",
+    "CourseUpdate",
     "InstitutionCreate",
     "InstitutionRead",
+    "InstitutionReadSlim",
     "InstitutionUpdate",
+    "LeaderboardRead",
+    "LoginRequest",
+    "ModerationClaim",
+    "ModerationDecision",
+    "ModerationResult",
+    "PendingChangeRequestPage",
+    "PendingChangeRequestRead",
+    "PendingReviewPage",
+    "PendingReviewRead",
+    "PrincipalRead",
+    "ProfessorCreate",
+    "ProfessorRead",
+    "ProfessorReadSlim",
+    "ProfessorUpdate",
+    "RankingEntry",
+    "RatingDimensionRead",
+    "RatingSummaryRead",
+    "RatingTrendPoint",
+    "RatingTrendRead",
+    "RatingTrendSeries",
+    "RefreshRequest",
+    "ReviewCreate",
+    "ReviewPage",
+    "ReviewRead",
+    "ReviewReadSlim",
+    "ReviewSubmitted",
+    "ReviewThreadRead",
+    "ReviewTextSearchHit",
+    "ReviewTextSearchResults",
+    "SlimSchema",
+    "SubjectCreate",
+    "SubjectRead",
+    "SubjectReadSlim",
+    "SubjectUpdate",
+    "TokenPair",
 ]
@@ -0,0 +1,40 @@
+"""Pydantic schemas for token authentication."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from app.models.enums import UserRole
+
+from .base import SchemaBase
+
+
+class LoginRequest(SchemaBase):
+    """Credentials exchanged for a token pair."""
+
+    email: str
+    password: str
+
+
+class RefreshRequest(SchemaBase):
+    """Refresh token exchanged for a new token pair."""
+
+    refresh_token: str
+
+
+class TokenPair(SchemaBase):
+    """Short-lived access token and long-lived refresh token."""
+
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+    expires_in: int
+
+
+class PrincipalRead(SchemaBase):
+    """Authorization claims of the authenticated user."""
+
+    id: int
+    role: UserRole
+    validated: bool
+    course_id: Optional[int] = None
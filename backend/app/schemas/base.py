@@ -1,6 +1,10 @@
 """Base schema module placeholder."""
 
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
 from pydantic import BaseModel as PydanticBaseModel
+from sqlalchemy import Table, select
+from sqlalchemy.sql import Select
 
 
 class SchemaBase(PydanticBaseModel):
@@ -8,3 +12,27 @@ class SchemaBase(PydanticBaseModel):
 
     class Config:
         orm_mode = True
+
+
+class SlimSchema:
+    """Tuple-row twin of a read schema.
+
+    Selects exactly the schema's fields as plain columns and turns rows into dicts,
+    skipping ORM instantiation, ``orm_mode`` attribute access and validation. Only
+    use it for rows the database already constrains the way the schema would.
+    """
+
+    def __init__(self, schema: Type[PydanticBaseModel]) -> None:
+        self.schema = schema
+        self.fields: Tuple[str, ...] = tuple(schema.__fields__)
+
+    def select(self, table: Table) -> Select:
+        """Select the schema's columns from ``table`` in field order."""
+        return select(*(table.c[name] for name in self.fields))
+
+    def dict(self, row: Iterable[Any]) -> Dict[str, Any]:
+        return dict(zip(self.fields, row))
+
+    def dicts(self, rows: Iterable[Iterable[Any]]) -> List[Dict[str, Any]]:
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in rows]
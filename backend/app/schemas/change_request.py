@@ -0,0 +1,46 @@
+"""Pydantic schemas for ChangeRequest use cases."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import Field, validator
+
+from app.models.enums import ChangeRequestStatus, ReviewTargetType
+
+from .base import SchemaBase
+
+
+class ChangeRequestRead(SchemaBase):
+    """Schema for reading a ChangeRequest."""
+
+    id: int
+    target_type: ReviewTargetType
+    institution_id: Optional[int] = None
+    course_id: Optional[int] = None
+    professor_id: Optional[int] = None
+    subject_id: Optional[int] = None
+    suggested_data: Dict[str, Any]
+    base_version: Optional[int] = None
+    status: ChangeRequestStatus
+    from_official_source: bool
+    created_by: int
+    created_at: datetime
+    resolved_by: Optional[int] = None
+    resolved_at: Optional[datetime] = None
+
+
+class ChangeRequestCreate(SchemaBase):
+    """Schema for suggesting a correction to a catalogue entry."""
+
+    target_type: ReviewTargetType
+    target_id: int
+    suggested_data: Dict[str, Any]
+    base_version: Optional[int] = Field(None, ge=1)
+
+    @validator("suggested_data")
+    def _not_empty(cls, value: Dict[str, Any]) -> Dict[str, Any]:
+        if not value:
+            raise ValueError("suggested_data must not be empty")
+        return value
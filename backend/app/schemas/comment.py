@@ -0,0 +1,36 @@
+"""Pydantic schemas for Comment use cases."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import constr
+
+from .base import SchemaBase, SlimSchema
+
+
+class CommentRead(SchemaBase):
+    """Schema for reading a Comment without its author."""
+
+    id: int
+    review_id: int
+    text: str
+    is_official: bool
+    created_at: datetime
+
+
+CommentReadSlim = SlimSchema(CommentRead)
+
+
+class CommentCreate(SchemaBase):
+    """Schema for posting a Comment on an approved Review."""
+
+    text: constr(strip_whitespace=True, min_length=1, max_length=2_000)
+
+
+class CommentPage(SchemaBase):
+    """A keyset-paginated slice of a comment thread."""
+
+    items: List[CommentRead]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,37 @@
+"""Pydantic schemas for Course use cases."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from .base import SchemaBase, SlimSchema
+from .institution import NameStr
+
+
+class CourseBase(SchemaBase):
+    """Shared attributes for Course schemas."""
+
+    name: NameStr
+
+
+class CourseCreate(CourseBase):
+    """Schema for creating a Course."""
+
+    institution_id: int
+
+
+class CourseUpdate(SchemaBase):
+    """Schema for updating a Course."""
+
+    name: Optional[NameStr] = None
+
+
+class CourseRead(CourseBase):
+    """Schema for reading Course data."""
+
+    id: int
+    institution_id: int
+    version: int = 1
+
+
+CourseReadSlim = SlimSchema(CourseRead)
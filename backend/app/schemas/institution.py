@@ -6,7 +6,7 @@ from typing import Optional
 
 from pydantic import constr
 
-from .base import SchemaBase
+from .base import SchemaBase, SlimSchema
 
 
 NameStr = constr(strip_whitespace=True, min_length=1, max_length=255)
@@ -32,3 +32,7 @@ class InstitutionRead(InstitutionBase):
     """Schema for reading Institution data."""
 
     id: int
+    version: int = 1
+
+
+InstitutionReadSlim = SlimSchema(InstitutionRead)
@@ -0,0 +1,63 @@
+"""Pydantic schemas for the moderation queues."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import Field, conlist
+
+from .base import SchemaBase
+from .change_request import ChangeRequestRead
+from .review import ReviewRead
+
+MAX_MODERATION_BATCH = 500
+
+
+class PendingReviewRead(ReviewRead):
+    """A review awaiting moderation together with its claim."""
+
+    claimed_by: Optional[int] = None
+    claimed_until: Optional[datetime] = None
+
+
+class PendingChangeRequestRead(ChangeRequestRead):
+    """A change request awaiting moderation together with its claim."""
+
+    claimed_by: Optional[int] = None
+    claimed_until: Optional[datetime] = None
+
+
+class PendingReviewPage(SchemaBase):
+    """A keyset-paginated slice of the review moderation queue."""
+
+    items: List[PendingReviewRead]
+    next_cursor: Optional[str] = None
+
+
+class PendingChangeRequestPage(SchemaBase):
+    """A keyset-paginated slice of the change request moderation queue."""
+
+    items: List[PendingChangeRequestRead]
+    next_cursor: Optional[str] = None
+
+
+class ModerationClaim(SchemaBase):
+    """Request to claim the oldest unclaimed items of a queue."""
+
+    limit: int = Field(100, ge=1, le=MAX_MODERATION_BATCH)
+
+
+class ModerationDecision(SchemaBase):
+    """Approve or reject a batch of queue items at once."""
+
+    ids: conlist(int, min_items=1, max_items=MAX_MODERATION_BATCH)  # type: ignore[valid-type]
+    approve: bool
+
+
+class ModerationResult(SchemaBase):
+    """Outcome of a batch decision."""
+
+    resolved: List[int]
+    skipped: List[int]
+    refused: Dict[int, str] = {}
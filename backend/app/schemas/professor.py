@@ -0,0 +1,37 @@
+"""Pydantic schemas for Professor use cases."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from .base import SchemaBase, SlimSchema
+from .institution import NameStr
+
+
+class ProfessorBase(SchemaBase):
+    """Shared attributes for Professor schemas."""
+
+    name: NameStr
+
+
+class ProfessorCreate(ProfessorBase):
+    """Schema for creating a Professor."""
+
+    course_id: int
+
+
+class ProfessorUpdate(SchemaBase):
+    """Schema for updating a Professor."""
+
+    name: Optional[NameStr] = None
+
+
+class ProfessorRead(ProfessorBase):
+    """Schema for reading Professor data."""
+
+    id: int
+    course_id: int
+    version: int = 1
+
+
+ProfessorReadSlim = SlimSchema(ProfessorRead)
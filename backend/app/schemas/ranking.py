@@ -0,0 +1,32 @@
+"""Pydantic schemas for leaderboards."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from app.models.enums import ReviewTargetType
+
+from .base import SchemaBase
+
+
+class RankingEntry(SchemaBase):
+    """One target's place on a leaderboard."""
+
+    position: int
+    target_id: int
+    name: str
+    review_count: int
+    mean: float
+    score: float
+
+
+class LeaderboardRead(SchemaBase):
+    """Top targets of a dimension within an optional course or institution scope."""
+
+    target_type: ReviewTargetType
+    dimension: str
+    course_id: Optional[int] = None
+    institution_id: Optional[int] = None
+    computed_at: Optional[datetime] = None
+    items: List[RankingEntry] = []
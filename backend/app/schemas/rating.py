@@ -0,0 +1,77 @@
+"""Pydantic schemas for review rating aggregates."""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from typing import List, Optional, Tuple
+
+from app.models.enums import ReviewTargetType, TrendGranularity
+
+from .base import SchemaBase
+
+
+def _moments(count: int, total: int, total_squares: int) -> Tuple[float, float]:
+    """Return the mean and population standard deviation of running totals."""
+    mean = total / count
+    variance = max(total_squares / count - mean * mean, 0.0)
+    return mean, math.sqrt(variance)
+
+
+class RatingDimensionRead(SchemaBase):
+    """Score statistics of one review dimension."""
+
+    dimension: str
+    count: int
+    mean: Optional[float] = None
+    stddev: Optional[float] = None
+
+    @classmethod
+    def from_totals(
+        cls, dimension: str, count: int, total: int, total_squares: int
+    ) -> "RatingDimensionRead":
+        """Derive mean and population standard deviation from running totals."""
+        if count <= 0:
+            return cls(dimension=dimension, count=0)
+        mean, stddev = _moments(count, total, total_squares)
+        return cls(dimension=dimension, count=count, mean=mean, stddev=stddev)
+
+
+class RatingSummaryRead(SchemaBase):
+    """Aggregated scores of approved reviews for a target."""
+
+    target_type: ReviewTargetType
+    target_id: int
+    dimensions: List[RatingDimensionRead] = []
+
+
+class RatingTrendPoint(SchemaBase):
+    """Score statistics of the reviews written within one time bucket."""
+
+    bucket_start: date
+    count: int
+    mean: float
+    stddev: float
+
+    @classmethod
+    def from_totals(
+        cls, bucket_start: date, count: int, total: int, total_squares: int
+    ) -> "RatingTrendPoint":
+        mean, stddev = _moments(count, total, total_squares)
+        return cls(bucket_start=bucket_start, count=count, mean=mean, stddev=stddev)
+
+
+class RatingTrendSeries(SchemaBase):
+    """Chronological buckets of one review dimension; empty buckets are omitted."""
+
+    dimension: str
+    points: List[RatingTrendPoint] = []
+
+
+class RatingTrendRead(SchemaBase):
+    """Time series of approved review scores for a target."""
+
+    target_type: ReviewTargetType
+    target_id: int
+    granularity: TrendGranularity
+    dimensions: List[RatingTrendSeries] = []
@@ -0,0 +1,90 @@
+"""Pydantic schemas for Review use cases."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import conint, constr
+
+from app.models.enums import ReviewTargetType
+
+from .base import SchemaBase, SlimSchema
+from .comment import CommentRead
+
+Score = conint(ge=1, le=5)
+ReviewText = constr(strip_whitespace=True, min_length=1, max_length=5_000)
+
+
+class ReviewRead(SchemaBase):
+    """Schema for reading an approved Review without its author."""
+
+    id: int
+    target_type: ReviewTargetType
+    institution_id: Optional[int] = None
+    course_id: Optional[int] = None
+    professor_id: Optional[int] = None
+    subject_id: Optional[int] = None
+
+    governance_score: Optional[int] = None
+    infrastructure_score: Optional[int] = None
+    support_score: Optional[int] = None
+    curriculum_score: Optional[int] = None
+    workload_score: Optional[int] = None
+    employability_score: Optional[int] = None
+    didactics_score: Optional[int] = None
+    availability_score: Optional[int] = None
+    fairness_score: Optional[int] = None
+    content_relevance_score: Optional[int] = None
+    assessment_fairness_score: Optional[int] = None
+    workload_balance_score: Optional[int] = None
+
+    text: str
+    created_at: datetime
+
+
+ReviewReadSlim = SlimSchema(ReviewRead)
+
+
+class ReviewPage(SchemaBase):
+    """A keyset-paginated slice of the review feed."""
+
+    items: List[ReviewRead]
+    next_cursor: Optional[str] = None
+
+
+class ReviewThreadRead(ReviewRead):
+    """An approved Review with its whole comment thread, oldest comment first."""
+
+    comments: List[CommentRead]
+
+
+class ReviewCreate(SchemaBase):
+    """Schema for submitting a Review for moderation."""
+
+    target_type: ReviewTargetType
+    target_id: int
+
+    governance_score: Optional[Score] = None
+    infrastructure_score: Optional[Score] = None
+    support_score: Optional[Score] = None
+    curriculum_score: Optional[Score] = None
+    workload_score: Optional[Score] = None
+    employability_score: Optional[Score] = None
+    didactics_score: Optional[Score] = None
+    availability_score: Optional[Score] = None
+    fairness_score: Optional[Score] = None
+    content_relevance_score: Optional[Score] = None
+    assessment_fairness_score: Optional[Score] = None
+    workload_balance_score: Optional[Score] = None
+
+    text: ReviewText
+
+
+class ReviewSubmitted(SchemaBase):
+    """Acknowledgement of a Review waiting for moderation."""
+
+    id: int
+    target_type: ReviewTargetType
+    approved: bool
+    created_at: datetime
@@ -0,0 +1,43 @@
+"""Pydantic schemas for search results."""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from app.models.enums import ReviewTargetType
+
+from .base import SchemaBase
+
+
+class CatalogueSearchHit(SchemaBase):
+    """A ranked catalogue entity matching a query."""
+
+    entity_type: ReviewTargetType
+    entity_id: int
+    name: str
+    score: float
+
+
+class CatalogueSearchResults(SchemaBase):
+    """Ranked catalogue matches for a query."""
+
+    query: str
+    results: List[CatalogueSearchHit]
+
+
+class ReviewTextSearchHit(SchemaBase):
+    """An approved review or comment matching a text query."""
+
+    review_id: int
+    comment_id: Optional[int] = None
+    target_type: ReviewTargetType
+    target_id: int
+    snippet: str
+    score: float
+
+
+class ReviewTextSearchResults(SchemaBase):
+    """Ranked review and comment matches for a query."""
+
+    query: str
+    results: List[ReviewTextSearchHit]
@@ -0,0 +1,37 @@
+"""Pydantic schemas for Subject use cases."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from .base import SchemaBase, SlimSchema
+from .institution import NameStr
+
+
+class SubjectBase(SchemaBase):
+    """Shared attributes for Subject schemas."""
+
+    name: NameStr
+
+
+class SubjectCreate(SubjectBase):
+    """Schema for creating a Subject."""
+
+    course_id: int
+
+
+class SubjectUpdate(SchemaBase):
+    """Schema for updating a Subject."""
+
+    name: Optional[NameStr] = None
+
+
+class SubjectRead(SubjectBase):
+    """Schema for reading Subject data."""
+
+    id: int
+    course_id: int
+    version: int = 1
+
+
+SubjectReadSlim = SlimSchema(SubjectRead)
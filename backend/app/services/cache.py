@@ -0,0 +1,245 @@
+"""Key-value cache backends with LRU/TTL eviction and usage counters."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol, Tuple
+
+from app.core.config import Settings
+
+MISSING: Any = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a plain mapping."""
+        return asdict(self)
+
+
+class CacheBackend(Protocol):
+    """Storage interface shared by cache implementations."""
+
+    stats: CacheStats
+
+    def get(self, key: str) -> Any:
+        """Return the cached value or :data:`MISSING`."""
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``."""
+
+    def delete(self, key: str) -> None:
+        """Drop ``key`` if present."""
+
+    def clear(self) -> None:
+        """Drop every entry."""
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache whose entries also expire after ``ttl_seconds``.
+
+    Without ``max_entries`` nothing is evicted early: entries only leave once expired.
+    """
+
+    def __init__(self, max_entries: Optional[int], ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                self.stats.evictions += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return MISSING
+            if self.max_entries is not None:
+                self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if self.max_entries is None:
+                self._drop_expired()
+                return
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _drop_expired(self) -> None:
+        # Unbounded entries stay in insertion order, so the expired ones lead.
+        now = time.monotonic()
+        while self._entries and next(iter(self._entries.values()))[0] < now:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileCacheBackend:
+    """JSON-file cache shared by processes on one host, evicting least recently used.
+
+    Without ``max_entries`` nothing is evicted early: entries only leave once expired.
+    """
+
+    def __init__(self, directory: Path, max_entries: Optional[int], ttl_seconds: float) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            if path.stat().st_mtime + self.ttl_seconds < time.time():
+                path.unlink(missing_ok=True)
+                with self._lock:
+                    self.stats.evictions += 1
+                    self.stats.misses += 1
+                return MISSING
+            value = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            with self._lock:
+                self.stats.misses += 1
+            return MISSING
+        # Reading does not touch mtime, so refresh access time for LRU ordering.
+        os.utime(path, (time.time(), path.stat().st_mtime))
+        with self._lock:
+            self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        temporary = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_text(json.dumps(value, default=str), encoding="utf-8")
+        os.replace(temporary, path)
+        if self.max_entries is None:
+            self._evict_expired()
+        else:
+            self._evict_overflow(self.max_entries)
+
+    def _evict_expired(self) -> None:
+        deadline = time.time() - self.ttl_seconds
+        expired = 0
+        for entry in self.directory.glob("*.json"):
+            try:
+                if entry.stat().st_mtime < deadline:
+                    entry.unlink()
+                    expired += 1
+            except FileNotFoundError:
+                continue
+        with self._lock:
+            self.stats.evictions += expired
+
+    def _evict_overflow(self, max_entries: int) -> None:
+        entries = list(self.directory.glob("*.json"))
+        overflow = len(entries) - max_entries
+        if overflow <= 0:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_atime)
+        for entry in entries[:overflow]:
+            entry.unlink(missing_ok=True)
+        with self._lock:
+            self.stats.evictions += overflow
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for entry in self.directory.glob("*.json"):
+            entry.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.json")) if self.directory.exists() else 0
+
+
+def build_cache_backend(
+    settings: Settings,
+    namespace: str,
+    max_entries: Optional[int] = None,
+    ttl_seconds: Optional[float] = None,
+    bounded: bool = True,
+) -> CacheBackend:
+    """Instantiate the backend selected by ``settings.cache_backend``.
+
+    ``max_entries`` and ``ttl_seconds`` override the global cache limits for this namespace.
+    An unbounded namespace keeps every entry for its full TTL, for data that must not be
+    evicted early; only store what the TTL alone keeps small.
+    """
+    max_entries = (max_entries or settings.cache_max_entries) if bounded else None
+    ttl_seconds = ttl_seconds or settings.cache_ttl_seconds
+    if settings.cache_backend == "memory":
+        return MemoryCacheBackend(max_entries, ttl_seconds)
+    if settings.cache_backend == "file":
+        return FileCacheBackend(settings.cache_directory / namespace, max_entries, ttl_seconds)
+    raise ValueError(f"Unknown cache backend: {settings.cache_backend!r}")
+
+
+def get_or_load(backend: CacheBackend, key: str, loader: Callable[[], Any]) -> Any:
+    """Return the cached value for ``key``, computing and storing it on a miss.
+
+    A ``None`` result (nothing found) is returned but not stored: nothing invalidates
+    an entry for a row that does not exist yet, so a cached miss would outlive its insert.
+    """
+    value = backend.get(key)
+    if value is MISSING:
+        value = loader()
+        if value is not None:
+            backend.set(key, value)
+    return value
+
+
+def delete_many(backend: CacheBackend, keys: Iterable[str]) -> None:
+    """Drop every key in ``keys``."""
+    for key in keys:
+        backend.delete(key)
+
+
+__all__ = [
+    "MISSING",
+    "CacheBackend",
+    "CacheStats",
+    "FileCacheBackend",
+    "MemoryCacheBackend",
+    "build_cache_backend",
+    "delete_many",
+    "get_or_load",
+]
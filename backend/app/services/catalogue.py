@@ -0,0 +1,263 @@
+"""Read-through cache over the institution, course, professor and subject hierarchy."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import attributes
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models import REVIEW_TARGET_FIELDS, ChangeRequest, Course, Institution, Professor, Subject
+from app.models.enums import ChangeRequestStatus, ReviewTargetType
+from app.schemas.base import SlimSchema
+from app.schemas.course import CourseReadSlim
+from app.schemas.institution import InstitutionReadSlim
+from app.schemas.professor import ProfessorReadSlim
+from app.schemas.subject import SubjectReadSlim
+from app.services.cache import build_cache_backend, delete_many, get_or_load
+
+catalogue_cache = build_cache_backend(settings, "catalogue")
+
+CatalogueTarget = Tuple[ReviewTargetType, int]
+
+_PENDING_KEYS = "catalogue_cache_pending_keys"
+
+# Keys dropped on commit that a reader may refill from a replica that has not caught up.
+_unreplicated_keys: Set[str] = set()
+_unreplicated_lock = threading.Lock()
+
+
+def _load_one(
+    session: Session, model: Any, schema: SlimSchema, entity_id: int
+) -> Optional[Dict[str, Any]]:
+    table = model.__table__
+    row = session.execute(schema.select(table).where(table.c.id == entity_id)).first()
+    return None if row is None else schema.dict(row)
+
+
+def _load_children(
+    session: Session, model: Any, schema: SlimSchema, parent_column: str, parent_id: int
+) -> List[Dict[str, Any]]:
+    table = model.__table__
+    statement = (
+        schema.select(table)
+        .where(table.c[parent_column] == parent_id)
+        .order_by(table.c.name, table.c.id)
+    )
+    return schema.dicts(session.execute(statement))
+
+
+def list_institutions(session: Session) -> List[Dict[str, Any]]:
+    """Return every institution ordered by name."""
+
+    def load() -> List[Dict[str, Any]]:
+        table = Institution.__table__
+        statement = InstitutionReadSlim.select(table).order_by(table.c.name)
+        return InstitutionReadSlim.dicts(session.execute(statement))
+
+    return get_or_load(catalogue_cache, "institutions", load)
+
+
+def get_institution(session: Session, institution_id: int) -> Optional[Dict[str, Any]]:
+    """Return an institution or ``None``."""
+    return get_or_load(
+        catalogue_cache,
+        f"institution:{institution_id}",
+        lambda: _load_one(session, Institution, InstitutionReadSlim, institution_id),
+    )
+
+
+def list_institution_courses(session: Session, institution_id: int) -> List[Dict[str, Any]]:
+    """Return the courses offered by an institution."""
+    return get_or_load(
+        catalogue_cache,
+        f"institution:{institution_id}:courses",
+        lambda: _load_children(session, Course, CourseReadSlim, "institution_id", institution_id),
+    )
+
+
+def get_course(session: Session, course_id: int) -> Optional[Dict[str, Any]]:
+    """Return a course or ``None``."""
+    return get_or_load(
+        catalogue_cache,
+        f"course:{course_id}",
+        lambda: _load_one(session, Course, CourseReadSlim, course_id),
+    )
+
+
+def list_course_professors(session: Session, course_id: int) -> List[Dict[str, Any]]:
+    """Return the professors of a course."""
+    return get_or_load(
+        catalogue_cache,
+        f"course:{course_id}:professors",
+        lambda: _load_children(session, Professor, ProfessorReadSlim, "course_id", course_id),
+    )
+
+
+def list_course_subjects(session: Session, course_id: int) -> List[Dict[str, Any]]:
+    """Return the subjects of a course."""
+    return get_or_load(
+        catalogue_cache,
+        f"course:{course_id}:subjects",
+        lambda: _load_children(session, Subject, SubjectReadSlim, "course_id", course_id),
+    )
+
+
+def get_professor(session: Session, professor_id: int) -> Optional[Dict[str, Any]]:
+    """Return a professor or ``None``."""
+    return get_or_load(
+        catalogue_cache,
+        f"professor:{professor_id}",
+        lambda: _load_one(session, Professor, ProfessorReadSlim, professor_id),
+    )
+
+
+def get_subject(session: Session, subject_id: int) -> Optional[Dict[str, Any]]:
+    """Return a subject or ``None``."""
+    return get_or_load(
+        catalogue_cache,
+        f"subject:{subject_id}",
+        lambda: _load_one(session, Subject, SubjectReadSlim, subject_id),
+    )
+
+
+_PARENT_COLUMNS = {
+    ReviewTargetType.COURSE: (Course.id, Course.institution_id, "institution:{}:courses"),
+    ReviewTargetType.PROFESSOR: (Professor.id, Professor.course_id, "course:{}:professors"),
+    ReviewTargetType.SUBJECT: (Subject.id, Subject.course_id, "course:{}:subjects"),
+}
+
+
+def catalogue_keys(session: Session, targets: Iterable[CatalogueTarget]) -> Set[str]:
+    """Return the cache keys whose content depends on any of ``targets``."""
+    keys: Set[str] = set()
+    children: Dict[ReviewTargetType, Set[int]] = {}
+    for target_type, target_id in targets:
+        keys.add(f"{target_type.value.lower()}:{target_id}")
+        if target_type is ReviewTargetType.INSTITUTION:
+            keys.add("institutions")
+        else:
+            children.setdefault(target_type, set()).add(target_id)
+
+    for target_type, ids in children.items():
+        id_column, parent_column, template = _PARENT_COLUMNS[target_type]
+        parents = session.execute(select(parent_column).where(id_column.in_(ids))).scalars()
+        keys.update(template.format(parent_id) for parent_id in parents)
+    return keys
+
+
+def invalidate_catalogue(session: Session, targets: Iterable[CatalogueTarget]) -> None:
+    """Immediately drop cached entries affected by ``targets``."""
+    delete_many(catalogue_cache, catalogue_keys(session, targets))
+
+
+def invalidate_catalogue_on_commit(session: Session, targets: Iterable[CatalogueTarget]) -> None:
+    """Drop cached entries affected by ``targets`` once the session commits."""
+    keys = catalogue_keys(session, targets)
+    if keys:
+        session.info.setdefault(_PENDING_KEYS, set()).update(keys)
+
+
+def change_request_target(change_request: ChangeRequest) -> Optional[CatalogueTarget]:
+    """Return the catalogue entity a change request refers to."""
+    target_type = ReviewTargetType(change_request.target_type)
+    target_id = getattr(change_request, REVIEW_TARGET_FIELDS[target_type])
+    return None if target_id is None else (target_type, target_id)
+
+
+_MODEL_TARGETS = {
+    Institution: ReviewTargetType.INSTITUTION,
+    Course: ReviewTargetType.COURSE,
+    Professor: ReviewTargetType.PROFESSOR,
+    Subject: ReviewTargetType.SUBJECT,
+}
+
+
+def _entity_keys(obj: Any) -> Set[str]:
+    """Return the cache keys showing a catalogue entity, under its old and new parents."""
+    target_type = _MODEL_TARGETS[type(obj)]
+    keys = {f"{target_type.value.lower()}:{obj.id}"}
+    if target_type is ReviewTargetType.INSTITUTION:
+        keys.add("institutions")
+        return keys
+    _, parent_column, template = _PARENT_COLUMNS[target_type]
+    history = attributes.get_history(obj, parent_column.key)
+    parents = {*history.added, *history.unchanged, *history.deleted}
+    keys.update(template.format(parent_id) for parent_id in parents if parent_id is not None)
+    return keys
+
+
+def _collect_catalogue_changes(session: Session, flush_context: Any) -> None:
+    """Remember catalogue keys of rows flushed and of change requests approved in this flush."""
+    keys: Set[str] = set()
+    targets = []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if type(obj) in _MODEL_TARGETS:
+            if obj in session.new or obj in session.deleted or session.is_modified(obj):
+                keys |= _entity_keys(obj)
+        elif isinstance(obj, ChangeRequest) and obj not in session.deleted:
+            if ChangeRequestStatus.APPROVED in attributes.get_history(obj, "status").added:
+                target = change_request_target(obj)
+                if target is not None:
+                    targets.append(target)
+    if targets:
+        keys |= catalogue_keys(session, targets)
+    if keys:
+        session.info.setdefault(_PENDING_KEYS, set()).update(keys)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    keys = session.info.pop(_PENDING_KEYS, ())
+    delete_many(catalogue_cache, keys)
+    if keys and settings.read_database_url:
+        with _unreplicated_lock:
+            _unreplicated_keys.update(keys)
+
+
+def invalidate_after_replica_sync() -> Callable[[bool], None]:
+    """Replica sync listener: drop again the keys committed before the snapshot.
+
+    Commits that land while the copy runs stay queued for the next snapshot.
+    """
+    with _unreplicated_lock:
+        keys = set(_unreplicated_keys)
+        _unreplicated_keys.clear()
+
+    def finish(copied: bool) -> None:
+        if copied:
+            delete_many(catalogue_cache, keys)
+        else:
+            with _unreplicated_lock:
+                _unreplicated_keys.update(keys)
+
+    return finish
+
+
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEYS, None)
+
+
+event.listen(Session, "after_flush", _collect_catalogue_changes)
+event.listen(Session, "after_commit", _invalidate_after_commit)
+event.listen(Session, "after_rollback", _discard_after_rollback)
+
+
+__all__ = [
+    "catalogue_cache",
+    "catalogue_keys",
+    "change_request_target",
+    "get_course",
+    "get_institution",
+    "get_professor",
+    "get_subject",
+    "invalidate_after_replica_sync",
+    "invalidate_catalogue",
+    "invalidate_catalogue_on_commit",
+    "list_course_professors",
+    "list_course_subjects",
+    "list_institution_courses",
+    "list_institutions",
+]
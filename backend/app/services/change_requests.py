@@ -0,0 +1,264 @@
+"""Validated, deduplicated, set-based application of approved change requests."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Type
+
+from pydantic import ValidationError
+from sqlalchemy import Table, bindparam, select, tuple_, update
+from sqlmodel import Session
+
+from app.models import REVIEW_TARGET_FIELDS, Course, Institution, Professor, Subject
+from app.models.enums import ReviewTargetType
+from app.schemas.base import SchemaBase
+from app.schemas.course import CourseUpdate
+from app.schemas.institution import InstitutionUpdate
+from app.schemas.professor import ProfessorUpdate
+from app.schemas.subject import SubjectUpdate
+from app.services.catalogue import CatalogueTarget
+
+CHANGE_SCHEMAS: Dict[ReviewTargetType, Type[SchemaBase]] = {
+    ReviewTargetType.INSTITUTION: InstitutionUpdate,
+    ReviewTargetType.COURSE: CourseUpdate,
+    ReviewTargetType.PROFESSOR: ProfessorUpdate,
+    ReviewTargetType.SUBJECT: SubjectUpdate,
+}
+
+TARGET_TABLES: Dict[ReviewTargetType, Table] = {
+    ReviewTargetType.INSTITUTION: Institution.__table__,
+    ReviewTargetType.COURSE: Course.__table__,
+    ReviewTargetType.PROFESSOR: Professor.__table__,
+    ReviewTargetType.SUBJECT: Subject.__table__,
+}
+
+# Column that scopes each table's unique name (uq_course_institution_name and friends).
+NAME_SCOPES: Dict[ReviewTargetType, Optional[str]] = {
+    ReviewTargetType.INSTITUTION: None,
+    ReviewTargetType.COURSE: "institution_id",
+    ReviewTargetType.PROFESSOR: "course_id",
+    ReviewTargetType.SUBJECT: "course_id",
+}
+
+
+class InvalidSuggestionError(ValueError):
+    """Raised when suggested data does not validate against the target's update schema."""
+
+
+class StaleTargetError(RuntimeError):
+    """Raised when a target row changed between planning and applying a batch."""
+
+
+def validate_suggestion(target_type: ReviewTargetType, data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the cleaned field values of a suggestion for ``target_type``."""
+    schema = CHANGE_SCHEMAS[target_type]
+    unknown = sorted(set(data) - set(schema.__fields__))
+    if unknown:
+        raise InvalidSuggestionError(
+            f"Unknown {target_type.value.lower()} fields: {', '.join(unknown)}."
+        )
+    try:
+        values = schema.parse_obj(data).dict(exclude_unset=True)
+    except ValidationError as exc:
+        raise InvalidSuggestionError(str(exc)) from exc
+    table = TARGET_TABLES[target_type]
+    cleared = sorted(name for name, value in values.items() if value is None)
+    if any(not table.c[name].nullable for name in cleared):
+        raise InvalidSuggestionError(f"Fields cannot be cleared: {', '.join(cleared)}.")
+    if not values:
+        raise InvalidSuggestionError("Suggestion changes nothing.")
+    return values
+
+
+@dataclass
+class ChangePlan:
+    """What a batch of change requests does to the catalogue."""
+
+    applied: List[int] = field(default_factory=list)
+    rejected: Dict[int, str] = field(default_factory=dict)
+    # target -> (expected version, merged field values that differ from the stored row)
+    updates: Dict[CatalogueTarget, Tuple[int, Dict[str, Any]]] = field(default_factory=dict)
+
+    @property
+    def targets(self) -> List[CatalogueTarget]:
+        return list(self.updates)
+
+
+def _load_targets(
+    session: Session, targets: Iterable[CatalogueTarget]
+) -> Dict[CatalogueTarget, Mapping[str, Any]]:
+    """Fetch the current rows of ``targets`` with one SELECT per target table."""
+    ids: Dict[ReviewTargetType, Set[int]] = defaultdict(set)
+    for target_type, target_id in targets:
+        ids[target_type].add(target_id)
+    current = {}
+    for target_type, target_ids in ids.items():
+        table = TARGET_TABLES[target_type]
+        rows = session.execute(select(table).where(table.c.id.in_(target_ids))).mappings()
+        current.update({(target_type, row["id"]): row for row in rows})
+    return current
+
+
+def _taken_names(
+    session: Session, target_type: ReviewTargetType, names: Dict[int, Tuple[Any, str]]
+) -> Dict[Tuple[Any, str], int]:
+    """Return the owners of the proposed ``(scope, name)`` pairs already stored."""
+    table = TARGET_TABLES[target_type]
+    scope = NAME_SCOPES[target_type]
+    wanted = set(names.values())
+    if scope is None:
+        condition = table.c.name.in_([name for _, name in wanted])
+        statement = select(table.c.id, table.c.name).where(condition)
+        return {(None, name): owner for owner, name in session.execute(statement)}
+    condition = tuple_(table.c[scope], table.c.name).in_(list(wanted))
+    statement = select(table.c.id, table.c[scope], table.c.name).where(condition)
+    return {(parent, name): owner for owner, parent, name in session.execute(statement)}
+
+
+def plan_changes(session: Session, rows: Iterable[Mapping[str, Any]]) -> ChangePlan:
+    """Validate and merge change request rows into one update per target.
+
+    A request is rejected, together with every other request it conflicts with, when
+    its data is invalid, its target is gone or changed since ``base_version``, another
+    request in the batch suggests a different value for the same field, or a new name
+    would break the target table's unique name constraint. Requests agreeing on a
+    value are deduplicated into a single write.
+    """
+    plan = ChangePlan()
+    suggestions: Dict[int, Tuple[CatalogueTarget, Optional[int], Dict[str, Any]]] = {}
+    for row in rows:
+        target_type = ReviewTargetType(row["target_type"])
+        target = (target_type, row[REVIEW_TARGET_FIELDS[target_type]])
+        try:
+            values = validate_suggestion(target_type, row["suggested_data"])
+        except InvalidSuggestionError as exc:
+            plan.rejected[row["id"]] = f"Invalid suggestion: {exc}"
+            continue
+        suggestions[row["id"]] = (target, row.get("base_version"), values)
+
+    current = _load_targets(session, (target for target, _, _ in suggestions.values()))
+    votes: Dict[Tuple[CatalogueTarget, str], Dict[Any, List[int]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    for request_id, (target, base_version, values) in suggestions.items():
+        stored = current.get(target)
+        if stored is None:
+            plan.rejected[request_id] = "Target no longer exists."
+        elif base_version is not None and base_version != stored["version"]:
+            plan.rejected[request_id] = (
+                f"Stale suggestion: target is at version {stored['version']}, "
+                f"suggestion was made against version {base_version}."
+            )
+        else:
+            for name, value in values.items():
+                votes[(target, name)][value].append(request_id)
+
+    for (target, name), by_value in votes.items():
+        if len(by_value) > 1:
+            for request_ids in by_value.values():
+                for request_id in request_ids:
+                    plan.rejected.setdefault(request_id, f"Conflicting suggestions for {name!r}.")
+    _reject_duplicate_names(session, plan, suggestions, current, _merge(votes, plan.rejected))
+    merged = _merge(votes, plan.rejected)
+
+    for request_id, (target, _, _) in suggestions.items():
+        if request_id in plan.rejected:
+            continue
+        plan.applied.append(request_id)
+        stored = current[target]
+        changes = {
+            name: value for name, value in merged[target].items() if stored[name] != value
+        }
+        if changes:
+            plan.updates[target] = (stored["version"], changes)
+    return plan
+
+
+def _merge(
+    votes: Mapping[Tuple[CatalogueTarget, str], Mapping[Any, List[int]]],
+    rejected: Mapping[int, str],
+) -> Dict[CatalogueTarget, Dict[str, Any]]:
+    """Return the field values each target ends up with from requests still accepted."""
+    merged: Dict[CatalogueTarget, Dict[str, Any]] = defaultdict(dict)
+    for (target, name), by_value in votes.items():
+        if len(by_value) != 1:
+            continue
+        value, request_ids = next(iter(by_value.items()))
+        if any(request_id not in rejected for request_id in request_ids):
+            merged[target][name] = value
+    return merged
+
+
+def _reject_duplicate_names(
+    session: Session,
+    plan: ChangePlan,
+    suggestions: Mapping[int, Tuple[CatalogueTarget, Optional[int], Dict[str, Any]]],
+    current: Mapping[CatalogueTarget, Mapping[str, Any]],
+    merged: Mapping[CatalogueTarget, Mapping[str, Any]],
+) -> None:
+    """Reject renames that would collide with a stored or another proposed name."""
+    renamed: Dict[ReviewTargetType, Dict[int, Tuple[Any, str]]] = defaultdict(dict)
+    for target, values in merged.items():
+        if "name" in values and values["name"] != current[target]["name"]:
+            scope = NAME_SCOPES[target[0]]
+            renamed[target[0]][target[1]] = (
+                None if scope is None else current[target][scope],
+                values["name"],
+            )
+
+    for target_type, names in renamed.items():
+        owners: Dict[Tuple[Any, str], Set[int]] = defaultdict(set)
+        for target_id, key in names.items():
+            owners[key].add(target_id)
+        for key, owner in _taken_names(session, target_type, names).items():
+            owners[key].add(owner)
+        colliding = {target_id for target_id, key in names.items() if len(owners[key]) > 1}
+        for request_id, (target, _, values) in suggestions.items():
+            if target[0] == target_type and target[1] in colliding and "name" in values:
+                plan.rejected.setdefault(request_id, f"Name {values['name']!r} is already taken.")
+
+
+def apply_plan(session: Session, plan: ChangePlan) -> None:
+    """Write a plan with one executemany UPDATE per target table and changed field set.
+
+    Each row is matched on its planned version and has it incremented, so a row
+    changed concurrently fails the whole batch with :class:`StaleTargetError`.
+    """
+    groups: Dict[Tuple[ReviewTargetType, Tuple[str, ...]], List[Dict[str, Any]]] = defaultdict(
+        list
+    )
+    for (target_type, target_id), (version, changes) in plan.updates.items():
+        params = {"target_id": target_id, "expected_version": version}
+        params.update({f"new_{name}": value for name, value in changes.items()})
+        groups[(target_type, tuple(sorted(changes)))].append(params)
+
+    for (target_type, names), params in groups.items():
+        table = TARGET_TABLES[target_type]
+        statement = (
+            update(table)
+            .where(
+                table.c.id == bindparam("target_id"),
+                table.c.version == bindparam("expected_version"),
+            )
+            .values({name: bindparam(f"new_{name}") for name in names})
+            .values(version=table.c.version + 1)
+        )
+        result = session.execute(statement, params)
+        if result.rowcount != len(params):
+            raise StaleTargetError(
+                f"{target_type.value.title()} rows changed while applying change requests."
+            )
+
+
+__all__ = [
+    "CHANGE_SCHEMAS",
+    "ChangePlan",
+    "InvalidSuggestionError",
+    "NAME_SCOPES",
+    "StaleTargetError",
+    "TARGET_TABLES",
+    "apply_plan",
+    "plan_changes",
+    "validate_suggestion",
+]
@@ -0,0 +1,226 @@
+"""Streaming export of approved reviews with pseudonymous authors."""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import hmac
+import io
+import json
+import secrets
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Table, select
+from sqlalchemy.engine import Engine
+
+from app.models import REVIEW_SCORE_FIELDS, REVIEW_TARGET_FIELDS, Review
+from app.models.enums import ReviewTargetType
+
+_review_table: Table = Review.__table__
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+SOURCE_COLUMNS = (
+    "id",
+    "user_id",
+    "target_type",
+    *REVIEW_TARGET_FIELDS.values(),
+    *REVIEW_SCORE_FIELDS,
+    "text",
+    "created_at",
+)
+# ``user_id`` never leaves the database; ``author`` replaces it with a keyed hash.
+EXPORT_COLUMNS = tuple("author" if name == "user_id" else name for name in SOURCE_COLUMNS)
+
+Row = Tuple[Any, ...]
+
+
+class ExportUnavailableError(RuntimeError):
+    """Raised when a requested format needs an optional dependency that is missing."""
+
+
+def author_pseudonymizer(key: Optional[str] = None) -> Callable[[int], str]:
+    """Map user ids to opaque tokens.
+
+    Without ``key`` a random one is drawn, so tokens link reviews of the same author
+    within one export but not across exports.
+    """
+    secret = (key or secrets.token_urlsafe(32)).encode()
+    return lambda user_id: hmac.new(secret, str(user_id).encode(), hashlib.sha256).hexdigest()[:20]
+
+
+def iter_review_batches(
+    engine: Engine,
+    batch_size: int,
+    target_type: Optional[ReviewTargetType] = None,
+    since: Optional[datetime] = None,
+    author_key: Optional[str] = None,
+) -> Iterator[List[Row]]:
+    """Yield approved reviews in primary-key order, ``batch_size`` anonymized rows at a time.
+
+    Rows come off a streaming cursor, so memory is bounded by one batch no matter how
+    many reviews match.
+    """
+    statement = (
+        select(*(_review_table.c[name] for name in SOURCE_COLUMNS))
+        .where(_review_table.c.approved.is_(True))
+        .order_by(_review_table.c.id)
+    )
+    if target_type is not None:
+        statement = statement.where(_review_table.c.target_type == target_type)
+    if since is not None:
+        statement = statement.where(_review_table.c.created_at >= since)
+
+    pseudonym = author_pseudonymizer(author_key)
+    author_index = SOURCE_COLUMNS.index("user_id")
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(
+            statement
+        )
+        for partition in result.partitions():
+            batch = []
+            for row in partition:
+                values = list(row)
+                values[author_index] = pseudonym(values[author_index])
+                batch.append(tuple(values))
+            yield batch
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ReviewTargetType):
+        return value.value
+    return value
+
+
+def csv_chunks(batches: Iterator[List[Row]]) -> Iterator[bytes]:
+    """Encode batches as CSV with a header row, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for batch in batches:
+        writer.writerows([_plain(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def jsonl_chunks(batches: Iterator[List[Row]]) -> Iterator[bytes]:
+    """Encode batches as JSON Lines, one chunk per batch."""
+    for batch in batches:
+        lines = (
+            json.dumps(dict(zip(EXPORT_COLUMNS, map(_plain, row))), ensure_ascii=False)
+            for row in batch
+        )
+        yield ("\n".join(lines) + "\n").encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out whatever was written since the last drain."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def parquet_chunks(batches: Iterator[List[Row]]) -> Iterator[bytes]:
+    """Encode batches as a Parquet file with one row group per batch."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ExportUnavailableError("Parquet export requires the 'pyarrow' package.") from exc
+
+    schema = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("author", pa.string()),
+            ("target_type", pa.string()),
+            *((name, pa.int64()) for name in REVIEW_TARGET_FIELDS.values()),
+            *((name, pa.int8()) for name in REVIEW_SCORE_FIELDS),
+            ("text", pa.string()),
+            ("created_at", pa.timestamp("us")),
+        ]
+    )
+    target_types = EXPORT_COLUMNS.index("target_type")
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for batch in batches:
+            columns = [list(column) for column in zip(*batch)]
+            columns[target_types] = [_plain(value) for value in columns[target_types]]
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+ENCODERS: Dict[str, Callable[[Iterator[List[Row]]], Iterator[bytes]]] = {
+    "csv": csv_chunks,
+    "jsonl": jsonl_chunks,
+    "parquet": parquet_chunks,
+}
+
+
+def export_reviews(
+    engine: Engine,
+    export_format: str,
+    batch_size: int,
+    target_type: Optional[ReviewTargetType] = None,
+    since: Optional[datetime] = None,
+    author_key: Optional[str] = None,
+) -> Iterator[bytes]:
+    """Return an iterator of encoded chunks for the approved review export."""
+    batches = iter_review_batches(engine, batch_size, target_type, since, author_key)
+    return ENCODERS[export_format](batches)
+
+
+def require_format(export_format: str) -> None:
+    """Fail early when ``export_format`` is unknown or its encoder cannot be loaded."""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {export_format!r}.")
+    if export_format == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise ExportUnavailableError(
+                "Parquet export requires the 'pyarrow' package."
+            ) from exc
+
+
+__all__ = [
+    "EXPORT_COLUMNS",
+    "EXPORT_FORMATS",
+    "ExportUnavailableError",
+    "MEDIA_TYPES",
+    "author_pseudonymizer",
+    "csv_chunks",
+    "export_reviews",
+    "iter_review_batches",
+    "jsonl_chunks",
+    "parquet_chunks",
+    "require_format",
+]
@@ -0,0 +1,345 @@
+"""Durable SQLite-backed job queue with an in-process worker pool."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+import traceback
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
+
+from sqlalchemy import Table, event, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import Session
+
+from app.core.config import Settings
+from app.core.metrics import registry
+from app.models import Job
+from app.models.enums import JobStatus
+
+logger = logging.getLogger("opencampus.jobs")
+
+_job_table: Table = Job.__table__
+
+# Repeat the WHERE clauses of the partial job indexes verbatim so SQLite uses them.
+JOB_PENDING = _job_table.c.status == JobStatus.PENDING
+JOB_RUNNING = _job_table.c.status == JobStatus.RUNNING
+
+JobHandler = Callable[[Session, Optional[str], List[Dict[str, Any]]], None]
+GroupKey = Tuple[str, Optional[str]]
+
+_WAKE_WORKERS = "job_queue_wake_workers"
+
+jobs_available = threading.Event()
+
+queue_depth = registry.gauge("job_queue_depth", "Pending jobs by kind.", ["kind"])
+queue_lag = registry.gauge(
+    "job_queue_lag_seconds", "Age of the oldest due pending job by kind.", ["kind"]
+)
+jobs_processed = registry.counter(
+    "jobs_processed_total", "Jobs finished by kind and outcome.", ["kind", "outcome"]
+)
+job_duration = registry.summary(
+    "job_batch_duration_seconds", "Handler run time per batch by kind.", ["kind"]
+)
+
+
+@dataclass(frozen=True)
+class HandlerSpec:
+    """A registered handler and the most jobs it accepts per call."""
+
+    kind: str
+    function: JobHandler
+    batch_size: int
+
+
+class JobRegistry:
+    """Map job kinds to handlers.
+
+    A handler receives a session, the shared ``target_key`` and the payloads of every
+    job claimed together for that kind and target, and commits nothing itself.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[str, HandlerSpec] = {}
+
+    def register(self, kind: str, batch_size: int = 100) -> Callable[[JobHandler], JobHandler]:
+        def decorator(function: JobHandler) -> JobHandler:
+            self._handlers[kind] = HandlerSpec(kind, function, batch_size)
+            return function
+
+        return decorator
+
+    def get(self, kind: str) -> Optional[HandlerSpec]:
+        return self._handlers.get(kind)
+
+    def kinds(self) -> Set[str]:
+        return set(self._handlers)
+
+
+job_handlers = JobRegistry()
+
+
+def enqueue(
+    session: Union[Session, Connection],
+    kind: str,
+    payload: Optional[Mapping[str, Any]] = None,
+    target_key: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+    delay_seconds: float = 0.0,
+    max_attempts: int = 5,
+) -> None:
+    """Insert a job in the caller's transaction; it runs only if that transaction commits.
+
+    A second job with the same ``idempotency_key`` is dropped for as long as the first
+    one is kept in the table.
+    """
+    now = datetime.utcnow()
+    statement = (
+        sqlite_insert(_job_table)
+        .values(
+            kind=kind,
+            target_key=target_key,
+            payload=dict(payload or {}),
+            idempotency_key=idempotency_key,
+            status=JobStatus.PENDING,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_after=now + timedelta(seconds=delay_seconds),
+            created_at=now,
+        )
+        .on_conflict_do_nothing(index_elements=["idempotency_key"])
+    )
+    session.execute(statement)
+    if isinstance(session, Session):
+        session.info[_WAKE_WORKERS] = True
+
+
+def _wake_after_commit(session: Session) -> None:
+    if session.info.pop(_WAKE_WORKERS, False):
+        jobs_available.set()
+
+
+def _forget_after_rollback(session: Session) -> None:
+    session.info.pop(_WAKE_WORKERS, None)
+
+
+event.listen(Session, "after_commit", _wake_after_commit)
+event.listen(Session, "after_rollback", _forget_after_rollback)
+
+
+def backoff_seconds(attempts: int, base: float, cap: float) -> float:
+    """Exponential backoff with jitter for a job that has failed ``attempts`` times."""
+    delay = min(cap, base * 2 ** max(attempts - 1, 0))
+    return delay * random.uniform(0.5, 1.0)
+
+
+class JobWorkerPool:
+    """Threads that claim due jobs in batches, run their handlers and record the outcome."""
+
+    def __init__(self, engine: Engine, handlers: JobRegistry, settings: Settings) -> None:
+        self.engine = engine
+        self.handlers = handlers
+        self.settings = settings
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._maintenance_lock = threading.Lock()
+        self._last_maintenance = 0.0
+
+    def start(self) -> None:
+        """Start ``settings.job_workers`` daemon threads."""
+        if self._threads:
+            return
+        self._stop.clear()
+        for index in range(self.settings.job_workers):
+            thread = threading.Thread(target=self._run, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Ask the workers to finish their current batch and exit."""
+        self._stop.set()
+        jobs_available.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once()
+                self.maintain()
+            except Exception:  # pragma: no cover - keep the worker alive
+                logger.exception("Job worker iteration failed")
+                processed = 0
+            if not processed:
+                jobs_available.wait(self.settings.job_poll_interval_seconds)
+                jobs_available.clear()
+
+    def _claim(self, now: datetime) -> List[Mapping[str, Any]]:
+        due = (
+            select(_job_table.c.id)
+            .where(JOB_PENDING, _job_table.c.run_after <= now)
+            .order_by(_job_table.c.run_after, _job_table.c.id)
+            .limit(self.settings.job_batch_size)
+            .scalar_subquery()
+        )
+        statement = (
+            update(_job_table)
+            .where(_job_table.c.id.in_(due))
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=_job_table.c.attempts + 1,
+                locked_until=now + timedelta(seconds=self.settings.job_lease_seconds),
+            )
+            .returning(
+                _job_table.c.id,
+                _job_table.c.kind,
+                _job_table.c.target_key,
+                _job_table.c.payload,
+                _job_table.c.attempts,
+                _job_table.c.max_attempts,
+            )
+        )
+        with self.engine.begin() as connection:
+            return list(connection.execute(statement).mappings())
+
+    def run_once(self, now: Optional[datetime] = None) -> int:
+        """Claim one batch of due jobs, run it grouped by kind and target, return its size."""
+        jobs = self._claim(now or datetime.utcnow())
+        groups: Dict[GroupKey, List[Mapping[str, Any]]] = defaultdict(list)
+        for job in jobs:
+            groups[(job["kind"], job["target_key"])].append(job)
+        for (kind, target_key), members in groups.items():
+            spec = self.handlers.get(kind)
+            if spec is None:
+                self._fail(members, f"No handler registered for job kind {kind!r}.")
+                continue
+            for start in range(0, len(members), spec.batch_size):
+                self._execute(spec, target_key, members[start : start + spec.batch_size])
+        return len(jobs)
+
+    def drain(self, max_batches: int = 1_000) -> int:
+        """Run batches until nothing is due; return the number of jobs processed."""
+        total = 0
+        for _ in range(max_batches):
+            processed = self.run_once()
+            if not processed:
+                break
+            total += processed
+        return total
+
+    def _execute(
+        self, spec: HandlerSpec, target_key: Optional[str], members: List[Mapping[str, Any]]
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            with Session(self.engine) as session:
+                spec.function(session, target_key, [dict(job["payload"]) for job in members])
+                session.commit()
+        except Exception:
+            logger.warning("Job batch %s/%s failed", spec.kind, target_key, exc_info=True)
+            self._fail(members, traceback.format_exc(limit=5))
+        else:
+            self._finish(members)
+        finally:
+            job_duration.observe(time.perf_counter() - started, spec.kind)
+
+    def _finish(self, members: List[Mapping[str, Any]]) -> None:
+        now = datetime.utcnow()
+        with self.engine.begin() as connection:
+            connection.execute(
+                update(_job_table)
+                .where(_job_table.c.id.in_([job["id"] for job in members]))
+                .values(status=JobStatus.DONE, locked_until=None, finished_at=now)
+            )
+        jobs_processed.inc(members[0]["kind"], "done", amount=len(members))
+
+    def _fail(self, members: List[Mapping[str, Any]], error: str) -> None:
+        now = datetime.utcnow()
+        with self.engine.begin() as connection:
+            for job in members:
+                if job["attempts"] < job["max_attempts"]:
+                    delay = backoff_seconds(
+                        job["attempts"],
+                        self.settings.job_backoff_base_seconds,
+                        self.settings.job_backoff_max_seconds,
+                    )
+                    values = dict(
+                        status=JobStatus.PENDING,
+                        run_after=now + timedelta(seconds=delay),
+                        locked_until=None,
+                        last_error=error,
+                    )
+                    outcome = "retried"
+                else:
+                    values = dict(
+                        status=JobStatus.FAILED, locked_until=None, last_error=error, finished_at=now
+                    )
+                    outcome = "failed"
+                connection.execute(
+                    update(_job_table).where(_job_table.c.id == job["id"]).values(**values)
+                )
+                jobs_processed.inc(job["kind"], outcome)
+
+    def maintain(self, now: Optional[datetime] = None) -> None:
+        """Requeue expired leases, purge old finished jobs and refresh queue metrics.
+
+        Runs at most once per poll interval across all workers.
+        """
+        if not self._maintenance_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() - self._last_maintenance < self.settings.job_poll_interval_seconds:
+                return
+            self._last_maintenance = time.monotonic()
+            now = now or datetime.utcnow()
+            retention = timedelta(seconds=self.settings.job_retention_seconds)
+            with self.engine.begin() as connection:
+                connection.execute(
+                    update(_job_table)
+                    .where(JOB_RUNNING, _job_table.c.locked_until < now)
+                    .values(status=JobStatus.PENDING, locked_until=None)
+                )
+                connection.execute(
+                    _job_table.delete().where(
+                        _job_table.c.finished_at.isnot(None),
+                        _job_table.c.finished_at < now - retention,
+                    )
+                )
+                self.refresh_metrics(connection, now)
+        finally:
+            self._maintenance_lock.release()
+
+    def refresh_metrics(self, connection: Connection, now: datetime) -> None:
+        """Publish queue depth and lag per kind."""
+        statement = (
+            select(_job_table.c.kind, func.count(), func.min(_job_table.c.run_after))
+            .where(JOB_PENDING)
+            .group_by(_job_table.c.kind)
+        )
+        seen = set()
+        for kind, depth, oldest in connection.execute(statement):
+            seen.add(kind)
+            queue_depth.set(kind, value=depth)
+            queue_lag.set(kind, value=max((now - oldest).total_seconds(), 0.0))
+        for kind in self.handlers.kinds() - seen:
+            queue_depth.set(kind, value=0)
+            queue_lag.set(kind, value=0)
+
+
+__all__ = [
+    "HandlerSpec",
+    "JobHandler",
+    "JobRegistry",
+    "JobWorkerPool",
+    "backoff_seconds",
+    "enqueue",
+    "job_handlers",
+    "jobs_available",
+]
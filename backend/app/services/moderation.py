@@ -0,0 +1,279 @@
+"""Batched moderation queues for pending reviews and change requests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Table, and_, false, or_, select, update
+from sqlalchemy.sql import ColumnElement
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models import REVIEW_TARGET_FIELDS, ChangeRequest, Review
+from app.models.enums import ChangeRequestStatus, ReviewTargetType
+from app.services.catalogue import CatalogueTarget, invalidate_catalogue_on_commit
+from app.services.change_requests import apply_plan, plan_changes
+from app.services.jobs import enqueue
+from app.services.notifications import REVIEW_APPROVED_JOB, target_key
+from app.services.pagination import keyset_page, split_page
+from app.services.rankings import RANKINGS_REFRESH_JOB
+from app.services.ratings import apply_review_rows, load_review_rows
+from app.services.versioning import (
+    bump_versions,
+    catalogue_version_keys,
+    resource_key,
+    review_key,
+)
+
+_review_table: Table = Review.__table__
+_change_request_table: Table = ChangeRequest.__table__
+
+# These predicates repeat the WHERE clauses of the partial queue indexes verbatim so
+# SQLite can prove the index covers the query.
+REVIEW_PENDING = and_(_review_table.c.approved == false(), _review_table.c.resolved_at.is_(None))
+CHANGE_REQUEST_PENDING = _change_request_table.c.status == ChangeRequestStatus.PENDING
+
+
+def _available_to(table: Table, moderator_id: int, now: datetime) -> ColumnElement[bool]:
+    """Items nobody else holds a live claim on."""
+    return or_(
+        table.c.claimed_until.is_(None),
+        table.c.claimed_until < now,
+        table.c.claimed_by == moderator_id,
+    )
+
+
+def _targets(rows: Iterable[Mapping[str, Any]]) -> List[CatalogueTarget]:
+    targets = []
+    for row in rows:
+        target_type = ReviewTargetType(row["target_type"])
+        target_id = row[REVIEW_TARGET_FIELDS[target_type]]
+        if target_id is not None:
+            targets.append((target_type, target_id))
+    return targets
+
+
+def _claim(
+    session: Session,
+    table: Table,
+    pending: ColumnElement[bool],
+    moderator_id: int,
+    limit: int,
+    now: Optional[datetime],
+) -> List[int]:
+    """Claim the oldest available pending items in one UPDATE and return their ids."""
+    now = now or datetime.utcnow()
+    candidates = (
+        select(table.c.id)
+        .where(pending, _available_to(table, moderator_id, now))
+        .order_by(table.c.created_at, table.c.id)
+        .limit(limit)
+    )
+    statement = (
+        update(table)
+        .where(table.c.id.in_(candidates.scalar_subquery()))
+        .values(
+            claimed_by=moderator_id,
+            claimed_until=now + timedelta(seconds=settings.moderation_claim_seconds),
+        )
+        .returning(table.c.id)
+    )
+    return list(session.execute(statement).scalars())
+
+
+def _enqueue_approval_jobs(session: Session, rows: Sequence[Mapping[str, Any]]) -> None:
+    for target_type in sorted({ReviewTargetType(row["target_type"]) for row in rows}):
+        enqueue(session, RANKINGS_REFRESH_JOB, target_key=target_type.value)
+    for row in rows:
+        target_type = ReviewTargetType(row["target_type"])
+        target_id = row[REVIEW_TARGET_FIELDS[target_type]]
+        enqueue(
+            session,
+            REVIEW_APPROVED_JOB,
+            {"review_id": row["id"]},
+            target_key=target_key(target_type, target_id),
+            idempotency_key=f"review-approved:{row['id']}",
+        )
+
+
+def _partition(requested: Sequence[int], resolved: Iterable[int]) -> Tuple[List[int], List[int]]:
+    done: Set[int] = set(resolved)
+    return sorted(done), sorted(set(requested) - done)
+
+
+def pending_reviews_statement(cursor: Optional[str], limit: int):
+    """Select one page of the review queue, oldest first, through the partial index."""
+    statement = select(Review).where(REVIEW_PENDING)
+    return keyset_page(statement, Review.created_at, Review.id, cursor, limit, descending=False)
+
+
+def pending_change_requests_statement(cursor: Optional[str], limit: int):
+    """Select one page of the change request queue, oldest first, through the partial index."""
+    statement = select(ChangeRequest).where(CHANGE_REQUEST_PENDING)
+    return keyset_page(
+        statement, ChangeRequest.created_at, ChangeRequest.id, cursor, limit, descending=False
+    )
+
+
+def list_pending_reviews(
+    session: Session, cursor: Optional[str], limit: int
+) -> Tuple[List[Review], Optional[str]]:
+    """Return a page of pending reviews and the cursor of the next page."""
+    rows = session.execute(pending_reviews_statement(cursor, limit)).scalars().all()
+    return split_page(rows, limit, lambda review: (review.created_at, review.id))
+
+
+def list_pending_change_requests(
+    session: Session, cursor: Optional[str], limit: int
+) -> Tuple[List[ChangeRequest], Optional[str]]:
+    """Return a page of pending change requests and the cursor of the next page."""
+    rows = session.execute(pending_change_requests_statement(cursor, limit)).scalars().all()
+    return split_page(rows, limit, lambda item: (item.created_at, item.id))
+
+
+def claim_reviews(
+    session: Session, moderator_id: int, limit: int, now: Optional[datetime] = None
+) -> List[Review]:
+    """Claim up to ``limit`` of the oldest available pending reviews."""
+    ids = _claim(session, _review_table, REVIEW_PENDING, moderator_id, limit, now)
+    statement = select(Review).where(Review.id.in_(ids)).order_by(Review.created_at, Review.id)
+    return list(session.execute(statement.execution_options(populate_existing=True)).scalars())
+
+
+def claim_change_requests(
+    session: Session, moderator_id: int, limit: int, now: Optional[datetime] = None
+) -> List[ChangeRequest]:
+    """Claim up to ``limit`` of the oldest available pending change requests."""
+    ids = _claim(session, _change_request_table, CHANGE_REQUEST_PENDING, moderator_id, limit, now)
+    statement = (
+        select(ChangeRequest)
+        .where(ChangeRequest.id.in_(ids))
+        .order_by(ChangeRequest.created_at, ChangeRequest.id)
+    )
+    return list(session.execute(statement.execution_options(populate_existing=True)).scalars())
+
+
+def resolve_reviews(
+    session: Session,
+    moderator_id: int,
+    ids: Sequence[int],
+    approve: bool,
+    now: Optional[datetime] = None,
+) -> Tuple[List[int], List[int]]:
+    """Approve or reject pending reviews in one UPDATE.
+
+    Returns the resolved ids and the ids skipped because they were already resolved,
+    missing, or claimed by another moderator. Rating aggregates and resource versions
+    are updated once for the whole batch; ranking refreshes and notifications are queued
+    as jobs that run after commit.
+    """
+    now = now or datetime.utcnow()
+    statement = (
+        update(_review_table)
+        .where(
+            _review_table.c.id.in_(ids),
+            REVIEW_PENDING,
+            _available_to(_review_table, moderator_id, now),
+        )
+        .values(
+            approved=approve,
+            resolved_by=moderator_id,
+            resolved_at=now,
+            claimed_by=None,
+            claimed_until=None,
+        )
+        .returning(_review_table.c.id)
+    )
+    resolved = list(session.execute(statement).scalars())
+    if approve and resolved:
+        rows = load_review_rows(session, resolved)
+        apply_review_rows(session, rows, sign=1)
+        targets = _targets(rows)
+        keys = {resource_key(*target) for target in targets}
+        bump_versions(session, keys | {review_key(review_id) for review_id in resolved})
+        _enqueue_approval_jobs(session, rows)
+    return _partition(ids, resolved)
+
+
+def resolve_change_requests(
+    session: Session,
+    moderator_id: int,
+    ids: Sequence[int],
+    approve: bool,
+    now: Optional[datetime] = None,
+) -> Tuple[List[int], List[int], Dict[int, str]]:
+    """Approve or reject pending change requests in one transaction.
+
+    Approval claims the requests, merges their suggestions through the apply engine
+    and writes them set-based; requests the engine refuses (invalid, stale, conflicting
+    or breaking a unique name) stay pending under the moderator's claim. Returns the
+    resolved ids, the ids skipped because they were already resolved, missing or
+    claimed by another moderator, and the refused ids with the reason. Changed targets
+    have their resource versions bumped and catalogue cache entries dropped once,
+    after commit.
+    """
+    now = now or datetime.utcnow()
+    table = _change_request_table
+    available = and_(
+        table.c.id.in_(ids), CHANGE_REQUEST_PENDING, _available_to(table, moderator_id, now)
+    )
+    resolution = {
+        "resolved_by": moderator_id,
+        "resolved_at": now,
+        "claimed_by": None,
+        "claimed_until": None,
+    }
+    if not approve:
+        statement = (
+            update(table)
+            .where(available)
+            .values(status=ChangeRequestStatus.REJECTED, **resolution)
+            .returning(table.c.id)
+        )
+        resolved, skipped = _partition(ids, session.execute(statement).scalars())
+        return resolved, skipped, {}
+
+    claim = (
+        update(table)
+        .where(available)
+        .values(
+            claimed_by=moderator_id,
+            claimed_until=now + timedelta(seconds=settings.moderation_claim_seconds),
+        )
+        .returning(
+            table.c.id,
+            table.c.target_type,
+            table.c.suggested_data,
+            table.c.base_version,
+            *(table.c[name] for name in REVIEW_TARGET_FIELDS.values()),
+        )
+    )
+    rows = session.execute(claim).mappings().all()
+    plan = plan_changes(session, rows)
+    apply_plan(session, plan)
+    if plan.applied:
+        session.execute(
+            update(table)
+            .where(table.c.id.in_(plan.applied))
+            .values(status=ChangeRequestStatus.APPROVED, **resolution)
+        )
+    if plan.targets:
+        bump_versions(session, catalogue_version_keys(session, plan.targets))
+        invalidate_catalogue_on_commit(session, plan.targets)
+    _, skipped = _partition(ids, (row["id"] for row in rows))
+    return sorted(plan.applied), skipped, plan.rejected
+
+
+__all__ = [
+    "CHANGE_REQUEST_PENDING",
+    "REVIEW_PENDING",
+    "claim_change_requests",
+    "claim_reviews",
+    "list_pending_change_requests",
+    "list_pending_reviews",
+    "pending_change_requests_statement",
+    "pending_reviews_statement",
+    "resolve_change_requests",
+    "resolve_reviews",
+]
@@ -0,0 +1,94 @@
+"""Notification jobs fanned out after reviews are approved and official replies posted.
+
+There is no delivery channel yet, so notifications are emitted as structured records on
+the ``opencampus.notifications`` logger for an external shipper to pick up.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Table, select
+from sqlmodel import Session
+
+from app.models import Comment, Course, Professor, Review, Subject
+from app.models.enums import ReviewTargetType
+from app.services.jobs import job_handlers
+
+logger = logging.getLogger("opencampus.notifications")
+
+REVIEW_APPROVED_JOB = "notifications.review_approved"
+OFFICIAL_COMMENT_JOB = "notifications.official_comment"
+
+_comment_table: Table = Comment.__table__
+_course_table: Table = Course.__table__
+_review_table: Table = Review.__table__
+
+
+def _emit(event: str, **fields: Any) -> None:
+    logger.info(json.dumps({"event": event, **fields}, default=str, sort_keys=True))
+
+
+def target_key(target_type: ReviewTargetType, target_id: int) -> str:
+    """Group notification jobs about the same catalogue entry."""
+    return f"{target_type.value}:{target_id}"
+
+
+def _institution_of(
+    session: Session, target_type: ReviewTargetType, target_id: int
+) -> Optional[int]:
+    if target_type == ReviewTargetType.INSTITUTION:
+        return target_id
+    if target_type == ReviewTargetType.COURSE:
+        course_id: Optional[int] = target_id
+    else:
+        table = (Professor if target_type == ReviewTargetType.PROFESSOR else Subject).__table__
+        course_id = session.execute(
+            select(table.c.course_id).where(table.c.id == target_id)
+        ).scalar_one_or_none()
+    return session.execute(
+        select(_course_table.c.institution_id).where(_course_table.c.id == course_id)
+    ).scalar_one_or_none()
+
+
+@job_handlers.register(REVIEW_APPROVED_JOB)
+def notify_reviews_approved(
+    session: Session, key: Optional[str], payloads: List[Dict[str, Any]]
+) -> None:
+    """Send the institution behind a target one digest for every review approved on it."""
+    type_name, _, raw_id = (key or "").partition(":")
+    target_type, target_id = ReviewTargetType(type_name), int(raw_id)
+    _emit(
+        "reviews_approved",
+        institution_id=_institution_of(session, target_type, target_id),
+        target_type=target_type.value,
+        target_id=target_id,
+        review_ids=sorted(payload["review_id"] for payload in payloads),
+    )
+
+
+@job_handlers.register(OFFICIAL_COMMENT_JOB)
+def notify_official_comments(
+    session: Session, key: Optional[str], payloads: List[Dict[str, Any]]
+) -> None:
+    """Tell a review's author that an institution or professor replied officially."""
+    comment_ids = [payload["comment_id"] for payload in payloads]
+    rows = session.execute(
+        select(_comment_table.c.id, _comment_table.c.review_id, _review_table.c.user_id)
+        .join(_review_table, _review_table.c.id == _comment_table.c.review_id)
+        .where(_comment_table.c.id.in_(comment_ids))
+        .order_by(_comment_table.c.id)
+    ).all()
+    for comment_id, review_id, author_id in rows:
+        _emit("official_comment", user_id=author_id, review_id=review_id, comment_id=comment_id)
+
+
+__all__ = [
+    "OFFICIAL_COMMENT_JOB",
+    "REVIEW_APPROVED_JOB",
+    "notify_official_comments",
+    "notify_reviews_approved",
+    "target_key",
+]
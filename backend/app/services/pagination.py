@@ -0,0 +1,77 @@
+"""Keyset pagination helpers based on opaque ``(created_at, id)`` cursors."""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import literal, tuple_
+from sqlalchemy.sql import ColumnElement, Select
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Serialize a keyset position into an opaque URL-safe token."""
+    payload = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Parse a token produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Malformed pagination cursor.") from exc
+
+
+def keyset_page(
+    statement: Select,
+    created_column: ColumnElement[Any],
+    id_column: ColumnElement[Any],
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = True,
+) -> Select:
+    """Restrict ``statement`` to the page after ``cursor``, fetching one extra row."""
+    if cursor is not None:
+        position = tuple_(created_column, id_column)
+        created_at, item_id = decode_cursor(cursor)
+        bound = tuple_(literal(created_at, created_column.type), literal(item_id, id_column.type))
+        statement = statement.where(position < bound if descending else position > bound)
+    if descending:
+        ordering = (created_column.desc(), id_column.desc())
+    else:
+        ordering = (created_column.asc(), id_column.asc())
+    return statement.order_by(*ordering).limit(limit + 1)
+
+
+def split_page(rows: Sequence[T], limit: int, key: Any) -> Tuple[List[T], Optional[str]]:
+    """Trim the look-ahead row and build the cursor of the following page."""
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    created_at, item_id = key(items[-1])
+    return items, encode_cursor(created_at, item_id)
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "InvalidCursorError",
+    "MAX_PAGE_SIZE",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_page",
+    "split_page",
+]
@@ -0,0 +1,279 @@
+"""Bayesian-shrunk leaderboards materialized from the rating aggregates."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import Table, func, null, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import Select
+from sqlmodel import Session
+
+from app.models import (
+    OVERALL_DIMENSION,
+    REVIEW_SCORE_FIELDS,
+    Course,
+    Professor,
+    RatingAggregate,
+    Subject,
+    TargetRanking,
+)
+from app.core.config import settings
+from app.models.enums import ReviewTargetType
+from app.services.jobs import job_handlers
+from app.services.submissions import TARGET_MODELS
+from app.services.versioning import bump_versions
+
+logger = logging.getLogger(__name__)
+
+_aggregate_table: Table = RatingAggregate.__table__
+_ranking_table: Table = TargetRanking.__table__
+_course_table: Table = Course.__table__
+
+RANKINGS_KEY = "rankings"
+RANKINGS_REFRESH_JOB = "rankings.refresh"
+RANKING_DIMENSIONS = (OVERALL_DIMENSION, *REVIEW_SCORE_FIELDS)
+
+Fingerprint = Tuple[int, int, int, int]
+
+
+def bayesian_scores(
+    counts: np.ndarray, totals: np.ndarray, groups: np.ndarray, prior_weight: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(mean, score)`` per row, shrinking each mean toward its group's mean.
+
+    ``score = (C * m + total) / (C + n)`` where ``m`` is the pooled mean of the row's
+    group and ``C`` is ``prior_weight``: a target needs about ``C`` reviews before its
+    own mean outweighs the prior.
+    """
+    group_counts = np.bincount(groups, weights=counts)
+    group_totals = np.bincount(groups, weights=totals)
+    prior = np.divide(
+        group_totals, group_counts, out=np.zeros_like(group_totals), where=group_counts > 0
+    )
+    mean = totals / counts
+    score = (prior_weight * prior[groups] + totals) / (prior_weight + counts)
+    return mean, score
+
+
+def _scopes(
+    connection: Connection, target_type: ReviewTargetType, target_ids: np.ndarray
+) -> Tuple[List[Optional[int]], List[Optional[int]]]:
+    """Return the parent course and institution of every target, aligned with ``target_ids``."""
+    if target_type in (ReviewTargetType.PROFESSOR, ReviewTargetType.SUBJECT):
+        table = (Professor if target_type == ReviewTargetType.PROFESSOR else Subject).__table__
+        statement = select(table.c.id, table.c.course_id, _course_table.c.institution_id).join(
+            _course_table, _course_table.c.id == table.c.course_id
+        )
+    elif target_type == ReviewTargetType.COURSE:
+        statement = select(_course_table.c.id, null(), _course_table.c.institution_id)
+    else:
+        return [None] * len(target_ids), [None] * len(target_ids)
+    parents = {row[0]: (row[1], row[2]) for row in connection.execute(statement)}
+    missing = (None, None)
+    pairs = [parents.get(target_id, missing) for target_id in target_ids.tolist()]
+    return [pair[0] for pair in pairs], [pair[1] for pair in pairs]
+
+
+def compute_rankings(
+    connection: Connection,
+    target_type: ReviewTargetType,
+    prior_weight: float,
+    now: Optional[datetime] = None,
+) -> int:
+    """Replace the materialized rankings of one target type and return the rows written."""
+    rows = connection.execute(
+        select(
+            _aggregate_table.c.target_id,
+            _aggregate_table.c.dimension,
+            _aggregate_table.c.count,
+            _aggregate_table.c.total,
+        ).where(_aggregate_table.c.target_type == target_type, _aggregate_table.c.count > 0)
+    ).all()
+    connection.execute(_ranking_table.delete().where(_ranking_table.c.target_type == target_type))
+    if not rows:
+        return 0
+
+    target_ids, dimensions, counts, totals = (np.asarray(column) for column in zip(*rows))
+    counts = counts.astype(np.float64)
+    totals = totals.astype(np.float64)
+    is_overall = dimensions == OVERALL_DIMENSION
+    review_counts = dict(zip(target_ids[is_overall].tolist(), counts[is_overall].tolist()))
+    target_ids, dimensions = target_ids[~is_overall], dimensions[~is_overall]
+    counts, totals = counts[~is_overall], totals[~is_overall]
+    dimension_names, dimension_codes = np.unique(dimensions, return_inverse=True)
+    mean, score = bayesian_scores(counts, totals, dimension_codes, prior_weight)
+
+    # The overall dimension averages every score a target received, but weighs that mean
+    # by how many reviews gave them: a review scoring three dimensions counts once.
+    unique_targets, target_codes = np.unique(target_ids, return_inverse=True)
+    pooled_mean = np.bincount(target_codes, weights=totals) / np.bincount(
+        target_codes, weights=counts
+    )
+    pooled_reviews = np.array(
+        [review_counts.get(target_id, 0.0) for target_id in unique_targets.tolist()]
+    )
+    _, pooled_score = bayesian_scores(
+        pooled_reviews,
+        pooled_reviews * pooled_mean,
+        np.zeros(len(unique_targets), dtype=np.intp),
+        prior_weight,
+    )
+
+    all_ids = np.concatenate([target_ids, unique_targets])
+    all_dimensions = np.concatenate(
+        [dimension_names[dimension_codes], np.full(len(unique_targets), OVERALL_DIMENSION)]
+    )
+    all_counts = np.concatenate([counts, pooled_reviews]).astype(np.int64)
+    all_means = np.concatenate([mean, pooled_mean])
+    all_scores = np.concatenate([score, pooled_score])
+    course_ids, institution_ids = _scopes(connection, target_type, all_ids)
+
+    columns = {
+        "target_id": all_ids.tolist(),
+        "dimension": all_dimensions.tolist(),
+        "course_id": course_ids,
+        "institution_id": institution_ids,
+        "review_count": all_counts.tolist(),
+        "mean": all_means.tolist(),
+        "score": all_scores.tolist(),
+    }
+    constants = {"target_type": target_type, "computed_at": now or datetime.utcnow()}
+    connection.execute(
+        _ranking_table.insert(),
+        [{**constants, **dict(zip(columns, values))} for values in zip(*columns.values())],
+    )
+    return len(all_ids)
+
+
+def aggregate_fingerprints(connection: Connection) -> Dict[ReviewTargetType, Fingerprint]:
+    """Summarise the aggregate table per target type; any rating change alters the tuple."""
+    statement = select(
+        _aggregate_table.c.target_type,
+        func.count(),
+        func.coalesce(func.sum(_aggregate_table.c.count), 0),
+        func.coalesce(func.sum(_aggregate_table.c.total), 0),
+        func.coalesce(func.sum(_aggregate_table.c.total_squares), 0),
+    ).group_by(_aggregate_table.c.target_type)
+    return {
+        ReviewTargetType(row[0]): tuple(row[1:]) for row in connection.execute(statement)
+    }
+
+
+@job_handlers.register(RANKINGS_REFRESH_JOB)
+def refresh_rankings_job(
+    session: Session, key: Optional[str], payloads: List[Dict[str, Any]]
+) -> None:
+    """Recompute one target type once, however many approvals queued a refresh for it."""
+    connection = session.connection()
+    compute_rankings(connection, ReviewTargetType(key), settings.ranking_prior_weight)
+    bump_versions(connection, [RANKINGS_KEY])
+
+
+class RankingRefresher:
+    """Recompute rankings of the target types whose aggregates changed since the last run."""
+
+    def __init__(self, engine: Engine, prior_weight: float) -> None:
+        self.engine = engine
+        self.prior_weight = prior_weight
+        self._fingerprints: Optional[Dict[ReviewTargetType, Fingerprint]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(
+        self, target_types: Optional[Iterable[ReviewTargetType]] = None
+    ) -> Dict[ReviewTargetType, int]:
+        """Recompute stale (or the given) target types; return rows written per type."""
+        with self._lock, self.engine.begin() as connection:
+            fingerprints = aggregate_fingerprints(connection)
+            previous = self._fingerprints
+            if target_types is None:
+                target_types = [
+                    target_type
+                    for target_type in ReviewTargetType
+                    if previous is None
+                    or fingerprints.get(target_type) != previous.get(target_type)
+                ]
+            written = {
+                target_type: compute_rankings(connection, target_type, self.prior_weight)
+                for target_type in target_types
+            }
+            if written:
+                bump_versions(connection, [RANKINGS_KEY])
+        self._fingerprints = fingerprints
+        return written
+
+    def start(self, interval_seconds: float) -> None:
+        """Refresh every ``interval_seconds`` on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval_seconds,), name="ranking-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, waiting for a refresh in progress."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                self.refresh()
+            except Exception:  # pragma: no cover - keep refreshing after transient errors
+                logger.exception("Ranking refresh failed")
+            if self._stop.wait(interval_seconds):
+                return
+
+
+def leaderboard_statement(
+    target_type: ReviewTargetType,
+    dimension: str,
+    limit: int,
+    course_id: Optional[int] = None,
+    institution_id: Optional[int] = None,
+    min_reviews: int = 1,
+) -> Select:
+    """Select the top ``limit`` rankings of a scope with target names.
+
+    The scope filter picks one of the ``score DESC`` indexes, so SQLite reads the first
+    ``limit`` entries in order instead of sorting the scope.
+    """
+    target_table = TARGET_MODELS[target_type].__table__
+    statement = (
+        select(_ranking_table, target_table.c.name)
+        .join(target_table, target_table.c.id == _ranking_table.c.target_id)
+        .where(
+            _ranking_table.c.target_type == target_type, _ranking_table.c.dimension == dimension
+        )
+    )
+    if course_id is not None:
+        statement = statement.where(_ranking_table.c.course_id == course_id)
+    elif institution_id is not None:
+        statement = statement.where(_ranking_table.c.institution_id == institution_id)
+    if min_reviews > 1:
+        statement = statement.where(_ranking_table.c.review_count >= min_reviews)
+    order = (_ranking_table.c.score.desc(), _ranking_table.c.target_id)
+    return statement.order_by(*order).limit(limit)
+
+
+__all__ = [
+    "RANKINGS_KEY",
+    "RANKINGS_REFRESH_JOB",
+    "RANKING_DIMENSIONS",
+    "RankingRefresher",
+    "aggregate_fingerprints",
+    "bayesian_scores",
+    "compute_rankings",
+    "leaderboard_statement",
+    "refresh_rankings_job",
+]
@@ -0,0 +1,157 @@
+"""Token-bucket rate limiting keyed by user and client address."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Protocol, Sequence, Tuple
+
+from app.core.config import Settings, settings
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3_600.0, "day": 86_400.0}
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A bucket holding up to ``capacity`` tokens, refilled evenly over ``period_seconds``."""
+
+    capacity: int
+    period_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimit":
+        """Parse ``"<count>/<second|minute|hour|day>"``, e.g. ``"10/hour"``."""
+        try:
+            count, period = spec.split("/")
+            limit = cls(int(count), PERIODS[period.strip().lower()])
+        except (KeyError, ValueError) as exc:
+            raise ValueError(f"Invalid rate limit {spec!r}; expected e.g. '10/hour'.") from exc
+        if limit.capacity < 1:
+            raise ValueError(f"Invalid rate limit {spec!r}; count must be positive.")
+        return limit
+
+
+class RateLimitStore(Protocol):
+    """Bucket state shared by every request the limiter sees."""
+
+    def consume(self, buckets: Sequence[Tuple[str, RateLimit]], now: float) -> float:
+        """Take one token from every bucket, or none if any is empty.
+
+        Returns ``0`` when the tokens were taken, otherwise the seconds until all
+        buckets could pay.
+        """
+
+    def clear(self) -> None:
+        """Forget all bucket state."""
+
+
+class MemoryRateLimitStore:
+    """Process-local buckets, evicting the least recently used key beyond ``max_keys``."""
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _level(self, key: str, limit: RateLimit, now: float) -> float:
+        tokens, updated = self._buckets.get(key, (float(limit.capacity), now))
+        return min(float(limit.capacity), tokens + (now - updated) * limit.refill_per_second)
+
+    def consume(self, buckets: Sequence[Tuple[str, RateLimit]], now: float) -> float:
+        with self._lock:
+            levels = [self._level(key, limit, now) for key, limit in buckets]
+            wait = max(
+                (1.0 - level) / limit.refill_per_second
+                for level, (_, limit) in zip(levels, buckets)
+            )
+            if wait > 0:
+                return wait
+            for level, (key, _) in zip(levels, buckets):
+                self._buckets[key] = (level - 1.0, now)
+                self._buckets.move_to_end(key)
+            # An evicted bucket comes back full; with a generous bound only idle keys go.
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _parse_limits(specs: Mapping[str, str]) -> Dict[str, RateLimit]:
+    return {route: RateLimit.parse(spec) for route, spec in specs.items()}
+
+
+class RateLimiter:
+    """Apply per-user and per-address limits configured for named routes."""
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        per_user: Mapping[str, RateLimit],
+        per_address: Mapping[str, RateLimit],
+        enabled: bool = True,
+    ) -> None:
+        self.store = store
+        self.per_user = dict(per_user)
+        self.per_address = dict(per_address)
+        self.enabled = enabled
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, store: Optional[RateLimitStore] = None
+    ) -> "RateLimiter":
+        return cls(
+            store or MemoryRateLimitStore(settings.rate_limit_max_keys),
+            _parse_limits(settings.rate_limits_per_user),
+            _parse_limits(settings.rate_limits_per_address),
+            enabled=settings.rate_limit_enabled,
+        )
+
+    def check(
+        self,
+        route: str,
+        user_id: Optional[int],
+        address: Optional[str],
+        now: Optional[float] = None,
+    ) -> float:
+        """Charge one request to ``route`` and return ``0`` or the seconds to wait."""
+        if not self.enabled:
+            return 0.0
+        buckets: List[Tuple[str, RateLimit]] = []
+        if user_id is not None and route in self.per_user:
+            buckets.append((f"{route}:user:{user_id}", self.per_user[route]))
+        if address and route in self.per_address:
+            buckets.append((f"{route}:addr:{address}", self.per_address[route]))
+        if not buckets:
+            return 0.0
+        return self.store.consume(buckets, time.monotonic() if now is None else now)
+
+
+def retry_after_header(seconds: float) -> str:
+    """Format a wait for the ``Retry-After`` header (whole seconds, at least 1)."""
+    return str(max(1, math.ceil(seconds)))
+
+
+rate_limiter = RateLimiter.from_settings(settings)
+
+
+__all__ = [
+    "MemoryRateLimitStore",
+    "RateLimit",
+    "RateLimitStore",
+    "RateLimiter",
+    "rate_limiter",
+    "retry_after_header",
+]
@@ -0,0 +1,251 @@
+"""Incremental maintenance of per-target review rating aggregates."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from sqlalchemy import event, func, literal, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+from sqlmodel import Session
+
+from app.models import (
+    OVERALL_DIMENSION,
+    REVIEW_SCORE_FIELDS,
+    REVIEW_TARGET_FIELDS,
+    RatingAggregate,
+    Review,
+)
+from app.models.enums import ReviewTargetType
+from app.services.trends import apply_rollup_contributions
+from app.services.versioning import bump_versions, table_target_keys
+
+_aggregate_table = RatingAggregate.__table__
+_review_table = Review.__table__
+
+CONTRIBUTION_COLUMNS = (
+    "id",
+    "target_type",
+    "approved",
+    "created_at",
+    *REVIEW_TARGET_FIELDS.values(),
+    *REVIEW_SCORE_FIELDS,
+)
+
+AggregateKey = Tuple[ReviewTargetType, int, str]
+
+# Besides one row per score dimension, each target has an ``overall`` row counting its
+# scored reviews, with the totals of every score those reviews gave.
+
+
+@dataclass(frozen=True)
+class ReviewContribution:
+    """Scores an approved review adds to (or removes from) its target."""
+
+    target_type: ReviewTargetType
+    target_id: int
+    created_at: datetime
+    scores: Dict[str, int]
+    sign: int = 1
+
+
+def review_contribution(values: Mapping[str, Any], sign: int = 1) -> Optional[ReviewContribution]:
+    """Build the contribution of a review snapshot, or ``None`` when it counts for nothing."""
+    if not values.get("approved"):
+        return None
+    target_type = ReviewTargetType(values["target_type"])
+    target_id = values.get(REVIEW_TARGET_FIELDS[target_type])
+    if target_id is None:
+        return None
+    scores = {
+        field: values[field] for field in REVIEW_SCORE_FIELDS if values.get(field) is not None
+    }
+    return ReviewContribution(
+        target_type=target_type,
+        target_id=target_id,
+        created_at=values.get("created_at") or datetime.utcnow(),
+        scores=scores,
+        sign=sign,
+    )
+
+
+def apply_contributions(session: Session, contributions: Iterable[ReviewContribution]) -> None:
+    """Fold review contributions into the aggregate and trend rollup tables."""
+    contributions = list(contributions)
+    _apply_aggregate_contributions(session, contributions)
+    apply_rollup_contributions(session, contributions)
+
+
+def _apply_aggregate_contributions(
+    session: Session, contributions: Iterable[ReviewContribution]
+) -> None:
+    deltas: Dict[AggregateKey, List[int]] = defaultdict(lambda: [0, 0, 0])
+    for contribution in contributions:
+        if not contribution.scores:
+            continue
+        target = (contribution.target_type, contribution.target_id)
+        overall = deltas[(*target, OVERALL_DIMENSION)]
+        overall[0] += contribution.sign
+        for dimension, score in contribution.scores.items():
+            delta = deltas[(*target, dimension)]
+            delta[0] += contribution.sign
+            for row in (delta, overall):
+                row[1] += contribution.sign * score
+                row[2] += contribution.sign * score * score
+
+    rows = [
+        {
+            "target_type": target_type,
+            "target_id": target_id,
+            "dimension": dimension,
+            "count": count,
+            "total": total,
+            "total_squares": total_squares,
+        }
+        for (target_type, target_id, dimension), (count, total, total_squares) in deltas.items()
+        if count or total or total_squares
+    ]
+    if not rows:
+        return
+
+    statement = sqlite_insert(_aggregate_table)
+    statement = statement.on_conflict_do_update(
+        index_elements=["target_type", "target_id", "dimension"],
+        set_={
+            "count": _aggregate_table.c.count + statement.excluded.count,
+            "total": _aggregate_table.c.total + statement.excluded.total,
+            "total_squares": _aggregate_table.c.total_squares + statement.excluded.total_squares,
+        },
+    )
+    session.execute(statement, rows)
+
+
+def apply_review_rows(session: Session, rows: Iterable[Mapping[str, Any]], sign: int) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) stored review rows from the aggregates."""
+    contributions = [review_contribution(row, sign) for row in rows]
+    apply_contributions(session, [item for item in contributions if item is not None])
+
+
+def load_review_rows(session: Session, review_ids: Iterable[int]) -> List[Mapping[str, Any]]:
+    """Fetch the columns that drive aggregates for the given reviews."""
+    ids = list(review_ids)
+    if not ids:
+        return []
+    columns = [_review_table.c[name] for name in CONTRIBUTION_COLUMNS]
+    result = session.execute(select(*columns).where(_review_table.c.id.in_(ids)))
+    return list(result.mappings())
+
+
+def _snapshot(review: Review) -> Dict[str, Any]:
+    return {name: getattr(review, name) for name in CONTRIBUTION_COLUMNS}
+
+
+def _sync_aggregates_before_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    """Translate pending Review inserts, updates and deletes into aggregate deltas."""
+    contributions: List[Optional[ReviewContribution]] = []
+    stale_ids: List[int] = []
+
+    for obj in session.new:
+        if isinstance(obj, Review):
+            contributions.append(review_contribution(_snapshot(obj)))
+    for obj in session.dirty:
+        if isinstance(obj, Review) and obj.id is not None and session.is_modified(obj):
+            stale_ids.append(obj.id)
+            contributions.append(review_contribution(_snapshot(obj)))
+    for obj in session.deleted:
+        if isinstance(obj, Review) and obj.id is not None:
+            stale_ids.append(obj.id)
+
+    # The database still holds the pre-flush state, which is what the aggregates reflect.
+    for row in load_review_rows(session, stale_ids):
+        contributions.append(review_contribution(row, sign=-1))
+
+    apply_contributions(session, [item for item in contributions if item is not None])
+
+
+event.listen(Session, "before_flush", _sync_aggregates_before_flush)
+
+
+def rating_aggregates_statement(target_type: ReviewTargetType, target_id: int) -> Select:
+    """Select the non-empty score dimensions of a target through its unique index."""
+    return (
+        select(RatingAggregate)
+        .where(
+            RatingAggregate.target_type == target_type,
+            RatingAggregate.target_id == target_id,
+            RatingAggregate.dimension != OVERALL_DIMENSION,
+            RatingAggregate.count > 0,
+        )
+        .order_by(RatingAggregate.dimension)
+    )
+
+
+def get_rating_aggregates(
+    session: Session, target_type: ReviewTargetType, target_id: int
+) -> List[RatingAggregate]:
+    """Return the non-empty aggregate rows of a target."""
+    return list(session.execute(rating_aggregates_statement(target_type, target_id)).scalars())
+
+
+def rebuild_rating_aggregates(session: Union[Session, Connection]) -> int:
+    """Recompute every aggregate from approved reviews and return the number of rows written.
+
+    Every target that had or now has aggregate rows gets its version bumped, so
+    validators and cached responses built on the old numbers go stale.
+    """
+    touched = table_target_keys(session, _aggregate_table)
+    session.execute(_aggregate_table.delete())
+    target_id = func.coalesce(*(_review_table.c[name] for name in REVIEW_TARGET_FIELDS.values()))
+    scores = [_review_table.c[dimension] for dimension in REVIEW_SCORE_FIELDS]
+    sources = [
+        (dimension, score.isnot(None), func.count(score), func.sum(score), func.sum(score * score))
+        for dimension, score in zip(REVIEW_SCORE_FIELDS, scores)
+    ]
+    sources.append(
+        (
+            OVERALL_DIMENSION,
+            or_(*(score.isnot(None) for score in scores)),
+            func.count(),
+            func.sum(sum(func.coalesce(score, 0) for score in scores)),
+            func.sum(sum(func.coalesce(score * score, 0) for score in scores)),
+        )
+    )
+    written = 0
+    for dimension, scored, count, total, total_squares in sources:
+        source = (
+            select(
+                _review_table.c.target_type,
+                target_id,
+                literal(dimension),
+                count,
+                total,
+                total_squares,
+            )
+            .where(_review_table.c.approved.is_(True), scored)
+            .group_by(_review_table.c.target_type, target_id)
+        )
+        result = session.execute(
+            _aggregate_table.insert().from_select(
+                ["target_type", "target_id", "dimension", "count", "total", "total_squares"],
+                source,
+            )
+        )
+        written += result.rowcount
+    bump_versions(session, touched | table_target_keys(session, _aggregate_table))
+    return written
+
+
+__all__ = [
+    "ReviewContribution",
+    "apply_contributions",
+    "apply_review_rows",
+    "get_rating_aggregates",
+    "load_review_rows",
+    "rating_aggregates_statement",
+    "rebuild_rating_aggregates",
+    "review_contribution",
+]
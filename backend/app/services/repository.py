@@ -0,0 +1,165 @@
+"""Repository loading entity graphs through named eager-loading profiles."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.sql import ColumnElement
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.database.instrumentation import query_budget
+from app.models import Comment, Course, Institution, Professor, Review, Subject, User
+from app.services.base import ServiceProtocol
+
+ModelT = TypeVar("ModelT")
+
+
+@dataclass(frozen=True)
+class LoadProfile(Generic[ModelT]):
+    """Loader strategies for one use case and the number of queries they may cost."""
+
+    name: str
+    model: Type[ModelT]
+    options: Tuple[LoaderOption, ...]
+    query_budget: int
+
+
+def _approved_reviews(relationship: Any) -> Any:
+    """Select-in approved reviews with their authors and comment threads."""
+    reviews = selectinload(relationship.and_(Review.approved == True))  # noqa: E712
+    return (
+        reviews.joinedload(Review.author),
+        reviews.selectinload(Review.comments).joinedload(Comment.author),
+    )
+
+
+LOAD_PROFILES: Dict[str, LoadProfile[Any]] = {
+    profile.name: profile
+    for profile in (
+        # institution + courses + reviews + comments (authors are joined in)
+        LoadProfile(
+            "institution_detail",
+            Institution,
+            (selectinload(Institution.courses), *_approved_reviews(Institution.reviews)),
+            query_budget=4,
+        ),
+        # course joined with institution + professors + subjects + reviews + comments
+        LoadProfile(
+            "course_detail",
+            Course,
+            (
+                joinedload(Course.institution),
+                selectinload(Course.professors),
+                selectinload(Course.subjects),
+                *_approved_reviews(Course.reviews),
+            ),
+            query_budget=5,
+        ),
+        LoadProfile(
+            "professor_detail",
+            Professor,
+            (joinedload(Professor.course), *_approved_reviews(Professor.reviews)),
+            query_budget=3,
+        ),
+        LoadProfile(
+            "subject_detail",
+            Subject,
+            (joinedload(Subject.course), *_approved_reviews(Subject.reviews)),
+            query_budget=3,
+        ),
+        # review joined with its author + comments joined with theirs
+        LoadProfile(
+            "review_thread",
+            Review,
+            (
+                joinedload(Review.author),
+                selectinload(Review.comments).joinedload(Comment.author),
+            ),
+            query_budget=2,
+        ),
+        LoadProfile(
+            "user_activity",
+            User,
+            (
+                joinedload(User.course),
+                selectinload(User.reviews),
+                selectinload(User.comments),
+            ),
+            query_budget=3,
+        ),
+    )
+}
+
+
+class UnknownLoadProfileError(KeyError):
+    """Raised when a load profile name is not registered."""
+
+
+def get_load_profile(name: str) -> LoadProfile[Any]:
+    """Return a registered load profile by name."""
+    try:
+        return LOAD_PROFILES[name]
+    except KeyError as exc:
+        raise UnknownLoadProfileError(name) from exc
+
+
+class Repository(ServiceProtocol):
+    """Load entities with every relationship a profile needs in a bounded number of queries.
+
+    With ``settings.enforce_query_budgets`` enabled (as in tests), a load that exceeds
+    its profile's budget raises :class:`~app.database.instrumentation.QueryBudgetExceeded`.
+    """
+
+    def __init__(self, session: Session, enforce_budgets: Optional[bool] = None) -> None:
+        self.session = session
+        self.enforce_budgets = (
+            settings.enforce_query_budgets if enforce_budgets is None else enforce_budgets
+        )
+
+    def __call__(self, profile: str, entity_id: int) -> Any:
+        return self.get(profile, entity_id)
+
+    def _run(self, load_profile: LoadProfile[Any], statement: Any) -> List[Any]:
+        statement = statement.options(*load_profile.options)
+        if not self.enforce_budgets:
+            return list(self.session.execute(statement).unique().scalars())
+        with query_budget(
+            self.session.connection(), load_profile.query_budget, load_profile.name
+        ):
+            return list(self.session.execute(statement).unique().scalars())
+
+    def get(self, profile: str, entity_id: int) -> Any:
+        """Load one entity and its profile graph, or ``None``."""
+        load_profile = get_load_profile(profile)
+        model = load_profile.model
+        rows = self._run(load_profile, select(model).where(model.id == entity_id))
+        return rows[0] if rows else None
+
+    def list(
+        self,
+        profile: str,
+        *criteria: ColumnElement[bool],
+        order_by: Sequence[Any] = (),
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """Load every entity matching ``criteria`` and their profile graphs together."""
+        load_profile = get_load_profile(profile)
+        model = load_profile.model
+        statement = select(model).where(*criteria).order_by(*(order_by or (model.id,)))
+        if limit is not None:
+            statement = statement.limit(limit)
+        return self._run(load_profile, statement)
+
+
+__all__ = [
+    "LOAD_PROFILES",
+    "LoadProfile",
+    "Repository",
+    "UnknownLoadProfileError",
+    "get_load_profile",
+]
@@ -0,0 +1,171 @@
+"""Byte-bounded LRU of serialized HTTP responses with single-flight misses."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.services.cache import CacheStats
+from app.services.versioning import on_versions_committed
+
+Headers = Tuple[Tuple[bytes, bytes], ...]
+
+# Rough per-entry bookkeeping cost (key, tuple, OrderedDict node) counted against the budget.
+ENTRY_OVERHEAD_BYTES = 256
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A complete response as sent by the application."""
+
+    status: int
+    headers: Headers
+    body: bytes
+    resources: FrozenSet[str] = frozenset()
+
+    @property
+    def size(self) -> int:
+        headers = sum(len(name) + len(value) for name, value in self.headers)
+        return len(self.body) + headers + ENTRY_OVERHEAD_BYTES
+
+
+@dataclass
+class ResponseCacheStats(CacheStats):
+    """Cache counters; ``coalesced`` counts the misses served by another request's miss."""
+
+    coalesced: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered without running the application."""
+        lookups = self.hits + self.misses
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """LRU bounded by total body and header bytes rather than entry count.
+
+    Entries are keyed by the caller (path, query and resource versions), so a version
+    bump makes old entries unreachable; :meth:`invalidate` frees them early.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int, ttl_seconds: float) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = ResponseCacheStats()
+        self.bytes = 0
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._by_resource: Dict[str, Set[str]] = {}
+        self._inflight: Dict[str, "asyncio.Future[Optional[CachedResponse]]"] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                self.stats.evictions += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, key: str, response: CachedResponse) -> bool:
+        """Store ``response`` unless it is larger than ``max_entry_bytes``."""
+        size = response.size
+        if size > self.max_entry_bytes or size > self.max_bytes:
+            return False
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+            self.bytes += size
+            for resource in response.resources:
+                self._by_resource.setdefault(resource, set()).add(key)
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+        return True
+
+    def invalidate(self, resources: Iterable[str]) -> int:
+        """Drop entries built from any of ``resources`` and return how many."""
+        with self._lock:
+            keys = set()
+            for resource in resources:
+                keys |= self._by_resource.get(resource, set())
+            for key in keys:
+                self._remove(key)
+            self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_resource.clear()
+            self.bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        response = entry[1]
+        self.bytes -= response.size
+        for resource in response.resources:
+            keys = self._by_resource.get(resource)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_resource[resource]
+
+    async def coalesce(
+        self, key: str, produce: Callable[[], Awaitable[Optional[CachedResponse]]]
+    ) -> Tuple[Optional[CachedResponse], bool]:
+        """Run ``produce`` once per key at a time; concurrent callers await its result.
+
+        Returns the response and whether this caller produced it. Waiters get ``None``
+        when the producer failed and should then run the request themselves.
+        """
+        waiting = self._inflight.get(key)
+        if waiting is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(waiting), False
+
+        future: "asyncio.Future[Optional[CachedResponse]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        response = None
+        try:
+            response = await produce()
+            return response, True
+        finally:
+            del self._inflight[key]
+            future.set_result(response)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+response_cache = ResponseCache(
+    settings.response_cache_max_bytes,
+    settings.response_cache_max_entry_bytes,
+    settings.response_cache_ttl_seconds,
+)
+on_versions_committed(response_cache.invalidate)
+
+
+__all__ = [
+    "CachedResponse",
+    "ResponseCache",
+    "ResponseCacheStats",
+    "response_cache",
+]
@@ -0,0 +1,156 @@
+"""Query builders for the approved review feed and comment threads."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Table
+from sqlalchemy.sql import Select
+from sqlmodel import Session, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.models import REVIEW_TARGET_FIELDS, Comment, Review
+from app.models.enums import ReviewTargetType
+from app.schemas.comment import CommentReadSlim
+from app.schemas.review import ReviewReadSlim, ReviewThreadRead
+from app.services.pagination import keyset_page, split_page
+from app.services.repository import Repository
+
+_review_table: Table = Review.__table__
+_comment_table: Table = Comment.__table__
+
+Page = Tuple[List[Dict[str, Any]], Optional[str]]
+
+
+def approved_reviews_statement(
+    target_type: ReviewTargetType, target_id: int, cursor: Optional[str], limit: int
+) -> SelectOfScalar[Review]:
+    """Select one page of approved reviews for a target, newest first."""
+    target_column = getattr(Review, REVIEW_TARGET_FIELDS[target_type])
+    statement = select(Review).where(target_column == target_id, Review.approved == True)  # noqa: E712
+    return keyset_page(statement, Review.created_at, Review.id, cursor, limit)
+
+
+def review_comments_statement(
+    review_id: int, cursor: Optional[str], limit: int
+) -> SelectOfScalar[Comment]:
+    """Select one page of a review's comment thread in chronological order."""
+    statement = select(Comment).where(Comment.review_id == review_id)
+    return keyset_page(statement, Comment.created_at, Comment.id, cursor, limit, descending=False)
+
+
+def list_approved_reviews(
+    session: Session,
+    target_type: ReviewTargetType,
+    target_id: int,
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[List[Review], Optional[str]]:
+    """Return a page of approved reviews and the cursor of the next page."""
+    rows = session.exec(approved_reviews_statement(target_type, target_id, cursor, limit)).all()
+    return split_page(rows, limit, lambda review: (review.created_at, review.id))
+
+
+def list_review_comments(
+    session: Session, review_id: int, cursor: Optional[str], limit: int
+) -> Tuple[List[Comment], Optional[str]]:
+    """Return a page of comments on a review and the cursor of the next page."""
+    rows = session.exec(review_comments_statement(review_id, cursor, limit)).all()
+    return split_page(rows, limit, lambda comment: (comment.created_at, comment.id))
+
+
+def approved_review_rows_statement(
+    target_type: ReviewTargetType, target_id: int, cursor: Optional[str], limit: int
+) -> Select:
+    """Select the same page as :func:`approved_reviews_statement` as plain ``ReviewRead`` rows."""
+    target_column = _review_table.c[REVIEW_TARGET_FIELDS[target_type]]
+    statement = ReviewReadSlim.select(_review_table).where(
+        target_column == target_id, _review_table.c.approved == True  # noqa: E712
+    )
+    return keyset_page(
+        statement, _review_table.c.created_at, _review_table.c.id, cursor, limit
+    )
+
+
+def review_comment_rows_statement(review_id: int, cursor: Optional[str], limit: int) -> Select:
+    """Select the same page as :func:`review_comments_statement` as plain ``CommentRead`` rows."""
+    statement = CommentReadSlim.select(_comment_table).where(
+        _comment_table.c.review_id == review_id
+    )
+    return keyset_page(
+        statement,
+        _comment_table.c.created_at,
+        _comment_table.c.id,
+        cursor,
+        limit,
+        descending=False,
+    )
+
+
+def review_page(rows: List[Any], limit: int) -> Page:
+    """Turn fetched review rows into response dicts and the next cursor."""
+    items, next_cursor = split_page(rows, limit, lambda row: (row.created_at, row.id))
+    return ReviewReadSlim.dicts(items), next_cursor
+
+
+def comment_page(rows: List[Any], limit: int) -> Page:
+    """Turn fetched comment rows into response dicts and the next cursor."""
+    items, next_cursor = split_page(rows, limit, lambda row: (row.created_at, row.id))
+    return CommentReadSlim.dicts(items), next_cursor
+
+
+def list_approved_review_rows(
+    session: Session,
+    target_type: ReviewTargetType,
+    target_id: int,
+    cursor: Optional[str],
+    limit: int,
+) -> Page:
+    """Return a page of approved reviews as dicts without building ORM objects."""
+    statement = approved_review_rows_statement(target_type, target_id, cursor, limit)
+    return review_page(session.execute(statement).all(), limit)
+
+
+def list_review_comment_rows(
+    session: Session, review_id: int, cursor: Optional[str], limit: int
+) -> Page:
+    """Return a page of a review's comments as dicts without building ORM objects."""
+    statement = review_comment_rows_statement(review_id, cursor, limit)
+    return comment_page(session.execute(statement).all(), limit)
+
+
+def get_approved_review(session: Session, review_id: int) -> Optional[Review]:
+    """Fetch a review by primary key if it has passed moderation."""
+    review = session.get(Review, review_id)
+    if review is None or not review.approved:
+        return None
+    return review
+
+
+def get_review_thread(session: Session, review_id: int) -> Optional[Dict[str, Any]]:
+    """Return an approved review with its comments, oldest first, or ``None``.
+
+    The ``review_thread`` load profile fetches the review and the thread in two queries.
+    """
+    review = Repository(session).get("review_thread", review_id)
+    if review is None or not review.approved:
+        return None
+    thread = ReviewThreadRead.from_orm(review)
+    thread.comments.sort(key=lambda comment: (comment.created_at, comment.id))
+    return thread.dict()
+
+
+__all__ = [
+    "approved_review_rows_statement",
+    "approved_reviews_statement",
+    "comment_page",
+    "get_approved_review",
+    "get_review_thread",
+    "list_approved_review_rows",
+    "list_approved_reviews",
+    "list_review_comment_rows",
+    "list_review_comments",
+    "review_comment_rows_statement",
+    "review_comments_statement",
+    "review_page",
+]
@@ -0,0 +1,184 @@
+"""Ranked full-text search across the catalogue and review text."""
+
+from __future__ import annotations
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.database.search_index import (
+    CATALOGUE_KEY_BITS,
+    CATALOGUE_SEARCH_TABLE,
+    CATALOGUE_SLOT_TYPES,
+    CATALOGUE_SLOTS,
+    CATALOGUE_TYPE_SLOTS,
+    COMMENT_SLOT,
+    REVIEW_SEARCH_SLOTS,
+    REVIEW_SEARCH_TABLE,
+)
+from app.models.enums import ReviewTargetType
+
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Prefix expansion below this length is not covered by the FTS prefix indexes.
+MIN_PREFIX_LENGTH = 2
+MAX_QUERY_TERMS = 8
+# Catalogue matches scored per query. Rowids put names with fewer words first, so the
+# window holds the best BM25 matches of names containing each query term once.
+MAX_RANKED_CANDIDATES = 2_000
+SNIPPET_TOKENS = 16
+HIGHLIGHT_OPEN = "<mark>"
+HIGHLIGHT_CLOSE = "</mark>"
+# Private-use characters bracket matches inside snippet() so the user's text can be
+# escaped before the highlight tags go in.
+_SNIPPET_OPEN = "\ue000"
+_SNIPPET_CLOSE = "\ue001"
+_SNIPPET_HIGHLIGHT = re.compile("\ue000([^\ue000\ue001]*)\ue001")
+
+
+@dataclass(frozen=True)
+class CatalogueHit:
+    """A catalogue entity matching a search query."""
+
+    entity_type: ReviewTargetType
+    entity_id: int
+    name: str
+    score: float
+
+
+@dataclass(frozen=True)
+class ReviewTextHit:
+    """An approved review or comment whose text matches a search query."""
+
+    review_id: int
+    comment_id: Optional[int]
+    target_type: ReviewTargetType
+    target_id: int
+    snippet: str
+    score: float
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """Turn free text into an FTS5 expression requiring every term as a prefix."""
+    terms = _TERM_PATTERN.findall(query)[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+    return " ".join(
+        f'"{term}"*' if len(term) >= MIN_PREFIX_LENGTH else f'"{term}"' for term in terms
+    )
+
+
+def render_snippet(raw: str) -> str:
+    """Return an FTS snippet as HTML: the text escaped, matches wrapped in ``<mark>``."""
+    escaped = _SNIPPET_HIGHLIGHT.sub(
+        lambda match: f"{HIGHLIGHT_OPEN}{match.group(1)}{HIGHLIGHT_CLOSE}", html.escape(raw)
+    )
+    return escaped.replace(_SNIPPET_OPEN, "").replace(_SNIPPET_CLOSE, "")
+
+
+def search_catalogue(
+    session: Session,
+    query: str,
+    types: Optional[Iterable[ReviewTargetType]] = None,
+    limit: int = 20,
+) -> List[CatalogueHit]:
+    """Return catalogue entities ranked by BM25 relevance to ``query``."""
+    match = build_match_query(query)
+    if match is None:
+        return []
+
+    parameters = {"match": match, "limit": limit, "candidates": MAX_RANKED_CANDIDATES}
+    type_filter = ""
+    if types:
+        slots = ", ".join(str(CATALOGUE_TYPE_SLOTS[target_type]) for target_type in set(types))
+        type_filter = f"AND rowid % {CATALOGUE_SLOTS} IN ({slots})"
+
+    # A broad term can match a large share of the catalogue, and BM25 costs a docsize
+    # lookup per match. The shortest matching names come first in rowid order and outrank
+    # longer ones, so scoring that window bounds the cost without losing the best hits.
+    rows = session.execute(
+        text(
+            "SELECT rowid, name, score FROM ("
+            f"SELECT rowid, name, bm25({CATALOGUE_SEARCH_TABLE}) AS score "
+            f"FROM {CATALOGUE_SEARCH_TABLE} "
+            f"WHERE {CATALOGUE_SEARCH_TABLE} MATCH :match {type_filter} "
+            "ORDER BY rowid LIMIT :candidates"
+            ") ORDER BY score, rowid LIMIT :limit"
+        ),
+        parameters,
+    )
+    key_mask = (1 << CATALOGUE_KEY_BITS) - 1
+    return [
+        CatalogueHit(
+            entity_type=CATALOGUE_SLOT_TYPES[rowid % CATALOGUE_SLOTS],
+            entity_id=(rowid & key_mask) // CATALOGUE_SLOTS,
+            name=name,
+            score=-score,
+        )
+        for rowid, name, score in rows
+    ]
+
+
+def search_review_text(
+    session: Session,
+    query: str,
+    target_type: Optional[ReviewTargetType] = None,
+    target_id: Optional[int] = None,
+    limit: int = 20,
+) -> List[ReviewTextHit]:
+    """Return approved review and comment text ranked by BM25 with highlighted snippets.
+
+    Every match is ranked, so the cost grows with how many reviews contain the terms.
+    """
+    match = build_match_query(query)
+    if match is None:
+        return []
+
+    parameters = {"match": match, "limit": limit}
+    filters = ""
+    if target_type is not None:
+        filters += " AND target_type = :target_type"
+        parameters["target_type"] = target_type.value
+    if target_id is not None:
+        filters += " AND target_id = :target_id"
+        parameters["target_id"] = target_id
+
+    rows = session.execute(
+        text(
+            "SELECT rowid, review_id, target_type, target_id, "
+            f"snippet({REVIEW_SEARCH_TABLE}, 0, '{_SNIPPET_OPEN}', '{_SNIPPET_CLOSE}', "
+            f"'…', {SNIPPET_TOKENS}), rank "
+            f"FROM {REVIEW_SEARCH_TABLE} WHERE {REVIEW_SEARCH_TABLE} MATCH :match{filters} "
+            "ORDER BY rank LIMIT :limit"
+        ),
+        parameters,
+    )
+    return [
+        ReviewTextHit(
+            review_id=review_id,
+            comment_id=(
+                rowid // REVIEW_SEARCH_SLOTS
+                if rowid % REVIEW_SEARCH_SLOTS == COMMENT_SLOT
+                else None
+            ),
+            target_type=ReviewTargetType(row_target_type),
+            target_id=row_target_id,
+            snippet=render_snippet(snippet),
+            score=-score,
+        )
+        for rowid, review_id, row_target_type, row_target_id, snippet, score in rows
+    ]
+
+
+__all__ = [
+    "CatalogueHit",
+    "ReviewTextHit",
+    "build_match_query",
+    "render_snippet",
+    "search_catalogue",
+    "search_review_text",
+]
@@ -0,0 +1,137 @@
+"""Creation of reviews, comments and change requests submitted by users."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from app.models import (
+    REVIEW_TARGET_FIELDS,
+    ChangeRequest,
+    Comment,
+    Course,
+    Institution,
+    Professor,
+    Review,
+    Subject,
+)
+from app.models.enums import ReviewTargetType, UserRole
+from app.services.change_requests import validate_suggestion
+from app.services.jobs import enqueue
+from app.services.notifications import OFFICIAL_COMMENT_JOB
+from app.services.reviews import get_approved_review
+
+TARGET_MODELS = {
+    ReviewTargetType.INSTITUTION: Institution,
+    ReviewTargetType.COURSE: Course,
+    ReviewTargetType.PROFESSOR: Professor,
+    ReviewTargetType.SUBJECT: Subject,
+}
+
+OFFICIAL_ROLES = frozenset({UserRole.PROFESSOR, UserRole.INSTITUTION})
+
+
+class TargetNotFoundError(LookupError):
+    """Raised when a submission points at a missing catalogue entry or review."""
+
+
+class DuplicateReviewError(ValueError):
+    """Raised when a user reviews the same target twice."""
+
+
+def _require_target(session: Session, target_type: ReviewTargetType, target_id: int) -> Any:
+    target = session.get(TARGET_MODELS[target_type], target_id)
+    if target is None:
+        raise TargetNotFoundError(f"{target_type.value.title()} not found.")
+    return target
+
+
+def create_review(
+    session: Session,
+    user_id: int,
+    target_type: ReviewTargetType,
+    target_id: int,
+    values: Dict[str, Any],
+) -> Review:
+    """Insert a review pending moderation."""
+    _require_target(session, target_type, target_id)
+    review = Review(
+        user_id=user_id,
+        target_type=target_type,
+        **{REVIEW_TARGET_FIELDS[target_type]: target_id},
+        **values,
+    )
+    session.add(review)
+    try:
+        session.flush()
+    except IntegrityError as exc:
+        session.rollback()
+        raise DuplicateReviewError("You have already reviewed this target.") from exc
+    return review
+
+
+def create_comment(
+    session: Session, user_id: int, role: UserRole, review_id: int, text: str
+) -> Comment:
+    """Append a comment to an approved review's thread.
+
+    Official comments queue a notification to the review's author.
+    """
+    if get_approved_review(session, review_id) is None:
+        raise TargetNotFoundError("Review not found.")
+    comment = Comment(
+        user_id=user_id, review_id=review_id, text=text, is_official=role in OFFICIAL_ROLES
+    )
+    session.add(comment)
+    session.flush()
+    if comment.is_official:
+        enqueue(
+            session,
+            OFFICIAL_COMMENT_JOB,
+            {"comment_id": comment.id},
+            target_key=f"review:{review_id}",
+            idempotency_key=f"official-comment:{comment.id}",
+        )
+    return comment
+
+
+def create_change_request(
+    session: Session,
+    user_id: int,
+    target_type: ReviewTargetType,
+    target_id: int,
+    suggested_data: Dict[str, Any],
+    from_official_source: Optional[bool] = None,
+    base_version: Optional[int] = None,
+) -> ChangeRequest:
+    """Queue a validated catalogue correction for moderation.
+
+    ``base_version`` is the target version the suggestion was made against; it
+    defaults to the current one and lets moderation detect stale suggestions.
+    """
+    values = validate_suggestion(target_type, suggested_data)
+    target = _require_target(session, target_type, target_id)
+    change_request = ChangeRequest(
+        target_type=target_type,
+        suggested_data=values,
+        base_version=target.version if base_version is None else base_version,
+        created_by=user_id,
+        from_official_source=bool(from_official_source),
+        **{REVIEW_TARGET_FIELDS[target_type]: target_id},
+    )
+    session.add(change_request)
+    session.flush()
+    return change_request
+
+
+__all__ = [
+    "DuplicateReviewError",
+    "OFFICIAL_ROLES",
+    "TARGET_MODELS",
+    "TargetNotFoundError",
+    "create_change_request",
+    "create_comment",
+    "create_review",
+]
@@ -0,0 +1,197 @@
+"""Time-bucketed rollups of approved review scores behind rating trends."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import Integer, case, cast, func, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import ColumnElement, Select
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models import REVIEW_SCORE_FIELDS, REVIEW_TARGET_FIELDS, RatingRollup, Review
+from app.models.enums import ReviewTargetType, TrendGranularity
+from app.services.versioning import bump_versions, table_target_keys
+
+if TYPE_CHECKING:  # pragma: no cover - typing only imports
+    from app.services.ratings import ReviewContribution
+
+_rollup_table = RatingRollup.__table__
+_review_table = Review.__table__
+
+ROLLUP_KEY_COLUMNS = ("target_type", "target_id", "granularity", "dimension", "bucket_start")
+
+RollupKey = Tuple[ReviewTargetType, int, TrendGranularity, str, date]
+
+
+def semester_starts(months: Optional[Sequence[int]] = None) -> List[int]:
+    """Return the configured semester start months, validated and sorted."""
+    starts = sorted(set(settings.trend_semester_start_months if months is None else months))
+    if not starts or starts[0] < 1 or starts[-1] > 12:
+        raise ValueError(f"Semester start months must lie within 1..12, got {starts}.")
+    return starts
+
+
+def bucket_start(
+    moment: Union[date, datetime],
+    granularity: TrendGranularity,
+    months: Optional[Sequence[int]] = None,
+) -> date:
+    """Return the first day of the bucket containing ``moment``."""
+    day = moment.date() if isinstance(moment, datetime) else moment
+    if granularity == TrendGranularity.DAY:
+        return day
+    if granularity == TrendGranularity.MONTH:
+        return day.replace(day=1)
+    starts = semester_starts(months)
+    opened = [month for month in starts if month <= day.month]
+    if opened:
+        return date(day.year, opened[-1], 1)
+    return date(day.year - 1, starts[-1], 1)
+
+
+def _bucket_expression(
+    created_at: ColumnElement, granularity: TrendGranularity, months: Sequence[int]
+) -> ColumnElement:
+    """SQLite expression computing :func:`bucket_start` as ``YYYY-MM-DD`` text."""
+    if granularity == TrendGranularity.DAY:
+        return func.date(created_at)
+    if granularity == TrendGranularity.MONTH:
+        return func.date(created_at, "start of month")
+    starts = semester_starts(months)
+    month = cast(func.strftime("%m", created_at), Integer)
+    months_back = case(
+        *((month >= start, month - start) for start in reversed(starts)),
+        else_=month + 12 - starts[-1],
+    )
+    return func.date(created_at, "start of month", func.printf("-%d months", months_back))
+
+
+def apply_rollup_contributions(
+    session: Union[Session, Connection], contributions: Iterable["ReviewContribution"]
+) -> None:
+    """Fold review contributions into every granularity's buckets with one upsert batch."""
+    months = semester_starts()
+    deltas: Dict[RollupKey, List[int]] = defaultdict(lambda: [0, 0, 0])
+    for contribution in contributions:
+        for granularity in TrendGranularity:
+            bucket = bucket_start(contribution.created_at, granularity, months)
+            target = (contribution.target_type, contribution.target_id, granularity)
+            for dimension, score in contribution.scores.items():
+                delta = deltas[(*target, dimension, bucket)]
+                delta[0] += contribution.sign
+                delta[1] += contribution.sign * score
+                delta[2] += contribution.sign * score * score
+
+    rows = [
+        dict(zip(ROLLUP_KEY_COLUMNS, key), count=count, total=total, total_squares=total_squares)
+        for key, (count, total, total_squares) in deltas.items()
+        if count or total or total_squares
+    ]
+    if not rows:
+        return
+
+    statement = sqlite_insert(_rollup_table)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(ROLLUP_KEY_COLUMNS),
+        set_={
+            "count": _rollup_table.c.count + statement.excluded.count,
+            "total": _rollup_table.c.total + statement.excluded.total,
+            "total_squares": _rollup_table.c.total_squares + statement.excluded.total_squares,
+        },
+    )
+    session.execute(statement, rows)
+
+
+def rebuild_rating_rollups(session: Union[Session, Connection]) -> int:
+    """Recompute every rollup bucket from approved reviews and return the rows written.
+
+    Run it after changing ``trend_semester_start_months``; existing semester buckets
+    keep the boundaries they were written with until then. Every target that had or
+    now has rollups gets its version bumped, so cached trends go stale.
+    """
+    months = semester_starts()
+    touched = table_target_keys(session, _rollup_table)
+    session.execute(_rollup_table.delete())
+    target_id = func.coalesce(*(_review_table.c[name] for name in REVIEW_TARGET_FIELDS.values()))
+    written = 0
+    for granularity in TrendGranularity:
+        bucket = _bucket_expression(_review_table.c.created_at, granularity, months)
+        for dimension in REVIEW_SCORE_FIELDS:
+            score = _review_table.c[dimension]
+            source = (
+                select(
+                    _review_table.c.target_type,
+                    target_id,
+                    literal(granularity.value),
+                    literal(dimension),
+                    bucket,
+                    func.count(score),
+                    func.sum(score),
+                    func.sum(score * score),
+                )
+                .where(_review_table.c.approved.is_(True), score.isnot(None))
+                .group_by(_review_table.c.target_type, target_id, bucket)
+            )
+            result = session.execute(
+                _rollup_table.insert().from_select(
+                    [*ROLLUP_KEY_COLUMNS, "count", "total", "total_squares"], source
+                )
+            )
+            written += result.rowcount
+    bump_versions(session, touched | table_target_keys(session, _rollup_table))
+    return written
+
+
+def rating_trend_statement(
+    target_type: ReviewTargetType,
+    target_id: int,
+    granularity: TrendGranularity,
+    dimension: Optional[str] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+) -> Select:
+    """Select a target's non-empty buckets as one range scan of the rollup unique index."""
+    statement = select(RatingRollup).where(
+        RatingRollup.target_type == target_type,
+        RatingRollup.target_id == target_id,
+        RatingRollup.granularity == granularity,
+        RatingRollup.count > 0,
+    )
+    if dimension is not None:
+        statement = statement.where(RatingRollup.dimension == dimension)
+    if since is not None:
+        statement = statement.where(RatingRollup.bucket_start >= bucket_start(since, granularity))
+    if until is not None:
+        statement = statement.where(RatingRollup.bucket_start <= until)
+    return statement.order_by(RatingRollup.dimension, RatingRollup.bucket_start)
+
+
+def get_rating_trend(
+    session: Session,
+    target_type: ReviewTargetType,
+    target_id: int,
+    granularity: TrendGranularity,
+    dimension: Optional[str] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+) -> List[RatingRollup]:
+    """Return a target's non-empty buckets ordered by dimension, then time."""
+    statement = rating_trend_statement(
+        target_type, target_id, granularity, dimension, since, until
+    )
+    return list(session.execute(statement).scalars())
+
+
+__all__ = [
+    "apply_rollup_contributions",
+    "bucket_start",
+    "get_rating_trend",
+    "rating_trend_statement",
+    "rebuild_rating_rollups",
+    "semester_starts",
+]
@@ -0,0 +1,188 @@
+"""Resource version counters backing HTTP validators and cache keys."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple, Union
+
+from sqlalchemy import Table, event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import attributes
+from sqlmodel import Session
+
+from app.models import (
+    REVIEW_TARGET_FIELDS,
+    ChangeRequest,
+    Comment,
+    Course,
+    Institution,
+    Professor,
+    ResourceVersion,
+    Review,
+    Subject,
+)
+from app.models.enums import ChangeRequestStatus, ReviewTargetType
+from app.services.catalogue import change_request_target
+
+_version_table = ResourceVersion.__table__
+
+_PARENTS = {
+    ReviewTargetType.COURSE: (Course, ReviewTargetType.INSTITUTION, "institution_id"),
+    ReviewTargetType.PROFESSOR: (Professor, ReviewTargetType.COURSE, "course_id"),
+    ReviewTargetType.SUBJECT: (Subject, ReviewTargetType.COURSE, "course_id"),
+}
+
+INSTITUTION_LIST_KEY = "institutions"
+
+_BUMPED_KEYS = "bumped_version_keys"
+_commit_listeners: List[Callable[[Set[str]], None]] = []
+
+
+def resource_key(target_type: ReviewTargetType, target_id: int) -> str:
+    """Return the version key of a catalogue entity."""
+    return f"{target_type.value.lower()}:{target_id}"
+
+
+def review_key(review_id: int) -> str:
+    """Return the version key of a review's comment thread."""
+    return f"review:{review_id}"
+
+
+def bump_versions(session: Union[Session, Connection], keys: Iterable[str]) -> None:
+    """Increment the version of every key in one upsert batch."""
+    now = datetime.utcnow()
+    rows = [{"key": key, "version": 1, "updated_at": now} for key in sorted(set(keys))]
+    if not rows:
+        return
+    if isinstance(session, Session):
+        session.info.setdefault(_BUMPED_KEYS, set()).update(row["key"] for row in rows)
+    statement = sqlite_insert(_version_table)
+    statement = statement.on_conflict_do_update(
+        index_elements=["key"],
+        set_={"version": _version_table.c.version + 1, "updated_at": statement.excluded.updated_at},
+    )
+    session.execute(statement, rows)
+
+
+def catalogue_version_keys(
+    session: Union[Session, Connection], targets: Iterable[Tuple[ReviewTargetType, int]]
+) -> Set[str]:
+    """Return the version keys of catalogue ``targets`` and of the lists that show them."""
+    keys: Set[str] = set()
+    children: Dict[ReviewTargetType, Set[int]] = {}
+    for target_type, target_id in targets:
+        keys.add(resource_key(target_type, target_id))
+        if target_type is ReviewTargetType.INSTITUTION:
+            keys.add(INSTITUTION_LIST_KEY)
+        else:
+            children.setdefault(target_type, set()).add(target_id)
+    for target_type, ids in children.items():
+        model, parent_type, parent = _PARENTS[target_type]
+        table = model.__table__
+        parents = session.execute(select(table.c[parent]).where(table.c.id.in_(ids))).scalars()
+        keys.update(resource_key(parent_type, parent_id) for parent_id in parents)
+    return keys
+
+
+def table_target_keys(session: Union[Session, Connection], table: Table) -> Set[str]:
+    """Return the resource keys of every target with a row in a per-target ``table``."""
+    statement = select(table.c.target_type, table.c.target_id).distinct()
+    return {
+        resource_key(ReviewTargetType(target_type), target_id)
+        for target_type, target_id in session.execute(statement)
+    }
+
+
+def on_versions_committed(listener: Callable[[Set[str]], None]) -> None:
+    """Call ``listener`` with the keys a session bumped, once that session commits."""
+    _commit_listeners.append(listener)
+
+
+def load_versions(session: Session, keys: Iterable[str]) -> Dict[str, Tuple[int, datetime]]:
+    """Return ``(version, updated_at)`` for the keys that have ever changed."""
+    statement = select(
+        _version_table.c.key, _version_table.c.version, _version_table.c.updated_at
+    ).where(_version_table.c.key.in_(list(keys)))
+    return {key: (version, updated_at) for key, version, updated_at in session.execute(statement)}
+
+
+def _values(obj: Any, name: str) -> Set[Any]:
+    """Return the current and previously persisted values of an attribute."""
+    history = attributes.get_history(obj, name)
+    return {value for value in (*history.added, *history.unchanged, *history.deleted)}
+
+
+def _review_target_keys(review: Review) -> Set[str]:
+    keys = set()
+    for target_type, field in REVIEW_TARGET_FIELDS.items():
+        keys.update(resource_key(target_type, value) for value in _values(review, field) if value)
+    return keys
+
+
+def _changed_keys(obj: Any) -> Set[str]:
+    """Return the version keys a pending change to ``obj`` invalidates."""
+    if isinstance(obj, Review):
+        if True not in _values(obj, "approved"):
+            return set()
+        return _review_target_keys(obj) | {review_key(obj.id)}
+    if isinstance(obj, Comment):
+        return {review_key(review_id) for review_id in _values(obj, "review_id") if review_id}
+    if isinstance(obj, Institution):
+        return {resource_key(ReviewTargetType.INSTITUTION, obj.id), INSTITUTION_LIST_KEY}
+    if isinstance(obj, Course):
+        return {resource_key(ReviewTargetType.COURSE, obj.id)} | {
+            resource_key(ReviewTargetType.INSTITUTION, parent)
+            for parent in _values(obj, "institution_id")
+        }
+    if isinstance(obj, (Professor, Subject)):
+        target_type = (
+            ReviewTargetType.PROFESSOR if isinstance(obj, Professor) else ReviewTargetType.SUBJECT
+        )
+        return {resource_key(target_type, obj.id)} | {
+            resource_key(ReviewTargetType.COURSE, parent) for parent in _values(obj, "course_id")
+        }
+    if isinstance(obj, ChangeRequest):
+        if ChangeRequestStatus.APPROVED not in attributes.get_history(obj, "status").added:
+            return set()
+        target = change_request_target(obj)
+        return set() if target is None else {resource_key(*target)}
+    return set()
+
+
+def _bump_after_flush(session: Session, flush_context: Any) -> None:
+    """Bump versions of resources touched by the objects just flushed."""
+    keys: Set[str] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        keys |= _changed_keys(obj)
+    bump_versions(session, keys)
+
+
+def _notify_after_commit(session: Session) -> None:
+    keys = session.info.pop(_BUMPED_KEYS, None)
+    if keys:
+        for listener in _commit_listeners:
+            listener(keys)
+
+
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_BUMPED_KEYS, None)
+
+
+event.listen(Session, "after_flush", _bump_after_flush)
+event.listen(Session, "after_commit", _notify_after_commit)
+event.listen(Session, "after_rollback", _discard_after_rollback)
+
+
+__all__ = [
+    "INSTITUTION_LIST_KEY",
+    "bump_versions",
+    "catalogue_version_keys",
+    "load_versions",
+    "on_versions_committed",
+    "resource_key",
+    "review_key",
+    "table_target_keys",
+]
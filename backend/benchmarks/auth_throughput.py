@@ -0,0 +1,95 @@
+"""Compare authenticated request throughput with token claims against DB-backed lookup.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.auth_throughput --users 200 --requests 3000 --concurrency 10
+
+The ``token`` mode trusts signed access token claims (falling back to the principal
+cache only for users changed since their token was issued); the ``db`` mode sets
+``auth_resolve_from_db`` and loads the user row on every request.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import drive, seed_review_feed, use_database
+
+MODES = {"token": "false", "db": "true"}
+
+
+def _worker(args: argparse.Namespace) -> None:
+    use_database(args.database)
+    os.environ["auth_resolve_from_db"] = MODES[args.worker]
+    from app.auth.tokens import ACCESS_TOKEN, Principal, issue_token
+    from app.core.config import settings
+    from app.main import create_app
+    from app.models.enums import UserRole
+
+    headers = [
+        {
+            "Authorization": "Bearer "
+            + issue_token(Principal(user_id, UserRole.STUDENT, True), ACCESS_TOKEN, settings)
+        }
+        for user_id in range(1, args.users + 1)
+    ]
+    result = asyncio.run(
+        drive(create_app(), ["/api/v1/auth/me"], args.requests, args.concurrency, headers)
+    )
+    print(json.dumps(result))
+
+
+def _seed(database: Path, users: int) -> None:
+    use_database(database)
+    from app.database.session import engine, init_db
+
+    init_db()
+    seed_review_feed(engine, courses=1, reviews_per_course=users)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--worker", choices=sorted(MODES), help=argparse.SUPPRESS)
+    parser.add_argument("--database", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker(args)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "bench.db"
+        _seed(database, args.users)
+        print(f"{'mode':<6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+        for mode in ("db", "token"):
+            # Each mode runs in a fresh interpreter so settings are read at import.
+            output = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.auth_throughput",
+                    "--worker", mode,
+                    "--database", str(database),
+                    "--users", str(args.users),
+                    "--requests", str(args.requests),
+                    "--concurrency", str(args.concurrency),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{mode:<6} {result['rps']:>9.1f} {result['p50_ms']:>8.2f} "
+                f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['errors']:>6.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Micro-benchmarks of single requests through the full ASGI stack."""
+
+import pytest
+
+PATHS = {
+    "feed": "/api/v1/reviews?target_type=PROFESSOR&target_id=1&limit=20",
+    "review": "/api/v1/reviews/1",
+    "thread": "/api/v1/reviews/1/comments",
+    "course_professors": "/api/v1/courses/1/professors",
+    "ratings": "/api/v1/ratings/COURSE/1",
+    "leaderboard": "/api/v1/rankings/PROFESSOR?limit=20",
+    "search": "/api/v1/search?q=algorithms",
+    "health": "/api/v1/health",
+}
+
+
+@pytest.mark.parametrize("name", sorted(PATHS))
+def bench_get(benchmark, client, name):
+    path = PATHS[name]
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    benchmark(client.get, path)
@@ -0,0 +1,63 @@
+"""Repository load profiles rendered within their query budgets, and how long they take."""
+
+from typing import Any, Iterable, Iterator, List
+
+import pytest
+from sqlmodel import Session
+
+from app.database.instrumentation import query_budget
+from app.services.repository import LOAD_PROFILES, Repository
+
+# The relationship paths a page built from each profile touches. Walking them inside the
+# budget counts any lazy load a missing loader option would cause.
+RENDERED_PATHS = {
+    "institution_detail": ("courses", "reviews.author", "reviews.comments.author"),
+    "course_detail": (
+        "institution",
+        "professors",
+        "subjects",
+        "reviews.author",
+        "reviews.comments.author",
+    ),
+    "professor_detail": ("course", "reviews.author", "reviews.comments.author"),
+    "subject_detail": ("course", "reviews.author", "reviews.comments.author"),
+    "review_thread": ("author", "comments.author"),
+    "user_activity": ("course", "reviews", "comments"),
+}
+PAGE_SIZE = 20
+
+
+def _follow(entities: Iterable[Any], attribute: str) -> Iterator[Any]:
+    for entity in entities:
+        value = getattr(entity, attribute)
+        if isinstance(value, list):
+            yield from value
+        elif value is not None:
+            yield value
+
+
+def walk(entities: List[Any], paths: Iterable[str]) -> int:
+    """Touch every object along ``paths`` and return how many were reached."""
+    reached = 0
+    for path in paths:
+        level = entities
+        for attribute in path.split("."):
+            level = list(_follow(level, attribute))
+            reached += len(level)
+    return reached
+
+
+@pytest.mark.parametrize("name", sorted(LOAD_PROFILES))
+def bench_load_profile(benchmark, engine, name):
+    profile = LOAD_PROFILES[name]
+    paths = RENDERED_PATHS[name]
+
+    def render() -> int:
+        with Session(engine) as session:
+            repository = Repository(session, enforce_budgets=False)
+            with query_budget(session.connection(), profile.query_budget, name):
+                entities = repository.list(name, limit=PAGE_SIZE)
+                return walk(entities, paths)
+
+    assert render() > 0, f"{name} rendered nothing; the dataset does not exercise it"
+    benchmark(render)
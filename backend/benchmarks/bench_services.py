@@ -0,0 +1,84 @@
+"""Micro-benchmarks of service-layer hot paths against a generated dataset."""
+
+import numpy as np
+
+from app.auth.tokens import ACCESS_TOKEN, Principal, decode_token, issue_token
+from app.core.config import settings
+from app.models.enums import ReviewTargetType, UserRole
+from app.services import catalogue
+from app.services.export import iter_review_batches, jsonl_chunks
+from app.services.rankings import bayesian_scores, compute_rankings
+from app.services.rate_limit import MemoryRateLimitStore, RateLimiter
+from app.services.ratings import get_rating_aggregates
+from app.services.reviews import list_approved_review_rows, list_review_comment_rows
+from app.services.search import search_catalogue, search_review_text
+
+
+def bench_bayesian_scores(benchmark):
+    rng = np.random.default_rng(0)
+    counts = rng.integers(1, 200, 100_000).astype(np.float64)
+    totals = counts * rng.uniform(1, 5, 100_000)
+    groups = rng.integers(0, 12, 100_000)
+    benchmark(bayesian_scores, counts, totals, groups, 10.0)
+
+
+def bench_review_feed_page(benchmark, session):
+    benchmark(list_approved_review_rows, session, ReviewTargetType.COURSE, 1, None, 20)
+
+
+def bench_comment_thread_page(benchmark, session):
+    benchmark(list_review_comment_rows, session, 1, None, 50)
+
+
+def bench_rating_summary(benchmark, session):
+    benchmark(get_rating_aggregates, session, ReviewTargetType.PROFESSOR, 1)
+
+
+def bench_catalogue_children_uncached(benchmark, session):
+    def load():
+        catalogue.catalogue_cache.clear()
+        return catalogue.list_course_professors(session, 1)
+
+    benchmark(load)
+
+
+def bench_catalogue_children_cached(benchmark, session):
+    catalogue.list_course_professors(session, 1)
+    benchmark(catalogue.list_course_professors, session, 1)
+
+
+def bench_search_catalogue(benchmark, session):
+    benchmark(search_catalogue, session, "algorithms", None, 20)
+
+
+def bench_search_review_text(benchmark, session):
+    benchmark(search_review_text, session, "feedback grading", None, None, 20)
+
+
+def bench_compute_rankings(benchmark, engine):
+    def compute():
+        with engine.begin() as connection:
+            return compute_rankings(connection, ReviewTargetType.PROFESSOR, 10.0)
+
+    benchmark(compute)
+
+
+def bench_export_jsonl(benchmark, engine):
+    def export():
+        return sum(len(chunk) for chunk in jsonl_chunks(iter_review_batches(engine, 5_000)))
+
+    benchmark.pedantic(export, rounds=5, iterations=1)
+
+
+def bench_token_round_trip(benchmark):
+    principal = Principal(1, UserRole.STUDENT, True)
+    benchmark(
+        lambda: decode_token(issue_token(principal, ACCESS_TOKEN, settings), ACCESS_TOKEN, settings)
+    )
+
+
+def bench_rate_limiter_check(benchmark):
+    limiter = RateLimiter.from_settings(settings, MemoryRateLimitStore(100_000))
+    limiter.enabled = True
+    user_ids = iter(range(10**9))
+    benchmark(lambda: limiter.check("comments.create", next(user_ids) % 50_000, "10.0.0.1"))
@@ -0,0 +1,67 @@
+"""Measure catalogue bulk-import throughput from a generated CSV or JSON Lines file.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.bulk_import --records 500000 --target-rows-per-second 100000
+
+Exits with status 1 when the measured throughput is below the target.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import use_database
+
+
+def _write_input(path: Path, records: int, file_format: str) -> None:
+    """Write ``records`` denormalised rows: 20 courses per institution, alternating kinds."""
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle) if file_format == "csv" else None
+        if writer:
+            writer.writerow(["institution", "course", "professor", "subject"])
+        for index in range(records):
+            course = index // 200
+            row = {
+                "institution": f"Universidade {course // 20}",
+                "course": f"Curso {course}",
+                "professor": f"Professor {index}" if index % 2 == 0 else "",
+                "subject": f"Disciplina {index}" if index % 2 else "",
+            }
+            if writer:
+                writer.writerow(row.values())
+            else:
+                handle.write(json.dumps(row) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=500_000)
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--batch-size", type=int, default=25_000)
+    parser.add_argument("--target-rows-per-second", type=float, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        use_database(Path(directory) / "import.db")
+        from app.database.import_catalogue import import_catalogue, read_records
+        from app.database.session import engine, init_db
+
+        source = Path(directory) / f"catalogue.{args.format}"
+        _write_input(source, args.records, args.format)
+        init_db()
+        stats = import_catalogue(engine, read_records(source), args.batch_size)
+        engine.dispose()
+
+    print(stats.summary())
+    if stats.rate < args.target_rows_per_second:
+        print(f"FAIL: {stats.rate:,.0f} rows/s below target {args.target_rows_per_second:,.0f}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Shared helpers for benchmark scripts."""
+
+import asyncio
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+
+def use_database(path: Path) -> None:
+    """Point application settings at ``path``; call before importing ``app``."""
+    os.environ["sqlite_file"] = str(path)
+    os.environ.setdefault("auth_ephemeral_secret", "true")
+
+
+def seed_review_feed(engine: Any, courses: int, reviews_per_course: int) -> List[int]:
+    """Insert one institution with approved course reviews and return the course ids."""
+    from app.models import Course, Institution, Review, User
+
+    started = datetime(2024, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(Institution.__table__.insert(), [{"id": 1, "name": "Benchmark U"}])
+        connection.execute(
+            Course.__table__.insert(),
+            [{"id": index + 1, "name": f"Course {index}", "institution_id": 1} for index in range(courses)],
+        )
+        connection.execute(
+            User.__table__.insert(),
+            [
+                {
+                    "id": index + 1,
+                    "cpf": f"{index:011d}",
+                    "email": f"user{index}@example.com",
+                    "password_hash": "-",
+                    "role": "STUDENT",
+                    "validated": True,
+                    "created_at": started,
+                }
+                for index in range(reviews_per_course)
+            ],
+        )
+        for course_id in range(1, courses + 1):
+            connection.execute(
+                Review.__table__.insert(),
+                [
+                    {
+                        "user_id": user_id,
+                        "target_type": "COURSE",
+                        "course_id": course_id,
+                        "curriculum_score": 1 + user_id % 5,
+                        "workload_score": 1 + (user_id * 3) % 5,
+                        "employability_score": 1 + (user_id * 7) % 5,
+                        "text": f"Review {user_id} of course {course_id}",
+                        "approved": True,
+                        "created_at": started + timedelta(minutes=user_id),
+                    }
+                    for user_id in range(1, reviews_per_course + 1)
+                ],
+            )
+    return list(range(1, courses + 1))
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def drive(
+    app: Any,
+    paths: Sequence[str],
+    requests: int,
+    concurrency: int,
+    headers: Optional[Sequence[Dict[str, str]]] = None,
+) -> Dict[str, float]:
+    """Issue ``requests`` GETs over ``paths`` in-process and summarise latency.
+
+    ``headers``, when given, is cycled alongside ``paths`` (e.g. one token per user).
+    """
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            for index in counter:
+                path = paths[index % len(paths)]
+                began = time.perf_counter()
+                extra = headers[index % len(headers)] if headers else None
+                response = await client.get(path, headers=extra)
+                latencies.append(time.perf_counter() - began)
+                if response.status_code >= 400:
+                    errors += 1
+
+        began = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - began
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "seconds": elapsed,
+        "rps": requests / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
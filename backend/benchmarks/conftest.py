@@ -0,0 +1,65 @@
+"""Fixtures for the pytest-benchmark micro-benchmarks (see ``pytest.ini``)."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from benchmarks.datagen import SCALES, Dataset, generate
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--bench-scale", choices=sorted(SCALES), default="tiny")
+    parser.addoption("--bench-seed", type=int, default=0)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Settings are read when ``app`` is first imported, so point them at the benchmark
+    # database before any benchmark module is collected.
+    directory = Path(tempfile.mkdtemp(prefix="opencampus-bench-"))
+    os.environ["sqlite_file"] = str(directory / "bench.db")
+    os.environ["sql_instrumentation"] = "false"
+    os.environ["job_workers"] = "0"
+    os.environ["ranking_refresh_seconds"] = "0"
+    os.environ["rate_limit_enabled"] = "false"
+    os.environ.setdefault("auth_ephemeral_secret", "true")
+
+
+@pytest.fixture(scope="session")
+def dataset(pytestconfig: pytest.Config) -> Dataset:
+    """Migrate the benchmark database and fill it once per session."""
+    from app.database.session import get_engine, init_db
+
+    init_db()
+    return generate(
+        get_engine(),
+        SCALES[pytestconfig.getoption("--bench-scale")],
+        seed=pytestconfig.getoption("--bench-seed"),
+    )
+
+
+@pytest.fixture(scope="session")
+def engine(dataset: Dataset):
+    from app.database.session import get_engine
+
+    return get_engine()
+
+
+@pytest.fixture
+def session(engine):
+    from sqlmodel import Session
+
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def client(dataset: Dataset):
+    """A TestClient over ``create_app()`` with its lifespan running."""
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+
+    with TestClient(create_app()) as client:
+        yield client
@@ -0,0 +1,362 @@
+"""Generate a deterministic synthetic OpenCampus dataset at a configurable scale.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.datagen --database /tmp/bench.db --scale small --seed 1
+
+The hierarchy is institutions -> courses -> professors and subjects, then users,
+reviews (with the score columns of their target type), comments and change requests.
+Ids are assigned densely from 1 so benchmarks can derive valid paths from a
+:class:`Dataset` alone. Every unique and check constraint in ``app.models`` holds:
+names are unique per parent, each review references exactly its target column, and no
+user reviews a target twice.
+
+Rows are bulk inserted through Core, so the ORM aggregate hooks do not run; rating
+aggregates and rankings are rebuilt once at the end.
+"""
+
+import argparse
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from benchmarks.common import use_database
+
+TARGET_SCORES = {
+    "INSTITUTION": ("governance_score", "infrastructure_score", "support_score"),
+    "COURSE": ("curriculum_score", "workload_score", "employability_score"),
+    "PROFESSOR": ("didactics_score", "availability_score", "fairness_score"),
+    "SUBJECT": ("content_relevance_score", "assessment_fairness_score", "workload_balance_score"),
+}
+TARGET_COLUMNS = {
+    "INSTITUTION": "institution_id",
+    "COURSE": "course_id",
+    "PROFESSOR": "professor_id",
+    "SUBJECT": "subject_id",
+}
+# Share of reviews per target type; professors and subjects dominate real traffic.
+TARGET_WEIGHTS = {"INSTITUTION": 0.1, "COURSE": 0.2, "PROFESSOR": 0.4, "SUBJECT": 0.3}
+# (role, share of users)
+ROLE_WEIGHTS = (("STUDENT", 0.94), ("PROFESSOR", 0.04), ("INSTITUTION", 0.01), ("MODERATOR", 0.01))
+OFFICIAL_ROLES = frozenset({"PROFESSOR", "INSTITUTION"})
+
+WORDS = (
+    "aula prova professor didatica conteudo material lista exercicios projeto laboratorio "
+    "biblioteca campus horario monitoria avaliacao trabalho seminario pesquisa estagio "
+    "lecture exam syllabus workload feedback grading office hours assignment clear fair "
+    "organized demanding helpful engaging confusing practical theory excellent poor great"
+).split()
+DEPARTMENTS = (
+    "Computer Science", "Mathematics", "Physics", "Chemistry", "Biology", "Economics",
+    "History", "Law", "Medicine", "Architecture", "Philosophy", "Statistics",
+)
+SUBJECT_TOPICS = (
+    "Algorithms", "Calculus", "Linear Algebra", "Databases", "Networks", "Thermodynamics",
+    "Genetics", "Microeconomics", "Ethics", "Probability", "Compilers", "Optics",
+)
+GIVEN_NAMES = ("Ana", "Bruno", "Carla", "Diego", "Elisa", "Fabio", "Gabriela", "Heitor", "Iara")
+FAMILY_NAMES = ("Silva", "Souza", "Costa", "Oliveira", "Pereira", "Lima", "Almeida", "Rocha")
+
+EPOCH = datetime(2024, 1, 1)
+SPAN_SECONDS = 365 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Entity counts of a generated dataset."""
+
+    institutions: int
+    courses_per_institution: int
+    professors_per_course: int
+    subjects_per_course: int
+    users: int
+    reviews_per_user: int
+    comments_per_review: float
+    change_requests: int
+    approved_share: float = 0.85
+
+
+SCALES: Dict[str, Scale] = {
+    "tiny": Scale(2, 3, 4, 5, 200, 3, 0.5, 20),
+    "small": Scale(10, 8, 10, 12, 5_000, 4, 0.8, 500),
+    "medium": Scale(40, 15, 15, 20, 50_000, 5, 1.0, 5_000),
+    "large": Scale(150, 25, 20, 25, 400_000, 6, 1.2, 40_000),
+}
+
+
+@dataclass
+class Dataset:
+    """What was generated; ids of every entity run from 1 to its count."""
+
+    scale: Scale
+    seed: int
+    counts: Dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def course_of_professor(self, professor_id: int) -> int:
+        return (professor_id - 1) // self.scale.professors_per_course + 1
+
+    def course_of_subject(self, subject_id: int) -> int:
+        return (subject_id - 1) // self.scale.subjects_per_course + 1
+
+    def institution_of_course(self, course_id: int) -> int:
+        return (course_id - 1) // self.scale.courses_per_institution + 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"scale": asdict(self.scale), "seed": self.seed, "counts": self.counts}
+
+
+def _timestamp(rng: random.Random) -> datetime:
+    return EPOCH + timedelta(seconds=rng.randrange(SPAN_SECONDS))
+
+
+def _sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high))).capitalize() + "."
+
+
+def _person(rng: random.Random, index: int) -> str:
+    return f"{rng.choice(GIVEN_NAMES)} {rng.choice(FAMILY_NAMES)} {index}"
+
+
+def _batched(rows: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class _Generator:
+    def __init__(self, scale: Scale, seed: int) -> None:
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.courses = scale.institutions * scale.courses_per_institution
+        self.professors = self.courses * scale.professors_per_course
+        self.subjects = self.courses * scale.subjects_per_course
+        self.target_counts = {
+            "INSTITUTION": scale.institutions,
+            "COURSE": self.courses,
+            "PROFESSOR": self.professors,
+            "SUBJECT": self.subjects,
+        }
+        self.roles: List[str] = []
+        self.approved_reviews: List[Tuple[int, datetime]] = []
+
+    def institutions(self) -> Iterator[Dict[str, Any]]:
+        for index in range(1, self.scale.institutions + 1):
+            yield {"id": index, "name": f"Universidade Sintetica {index}"}
+
+    def courses_rows(self) -> Iterator[Dict[str, Any]]:
+        per = self.scale.courses_per_institution
+        for index in range(1, self.courses + 1):
+            department = DEPARTMENTS[(index - 1) % len(DEPARTMENTS)]
+            yield {
+                "id": index,
+                "name": f"{department} {(index - 1) // len(DEPARTMENTS) + 1}",
+                "institution_id": (index - 1) // per + 1,
+            }
+
+    def professors_rows(self) -> Iterator[Dict[str, Any]]:
+        per = self.scale.professors_per_course
+        for index in range(1, self.professors + 1):
+            name = _person(self.rng, index)
+            yield {"id": index, "name": name, "course_id": (index - 1) // per + 1}
+
+    def subjects_rows(self) -> Iterator[Dict[str, Any]]:
+        per = self.scale.subjects_per_course
+        for index in range(1, self.subjects + 1):
+            topic = SUBJECT_TOPICS[(index - 1) % len(SUBJECT_TOPICS)]
+            yield {"id": index, "name": f"{topic} {index}", "course_id": (index - 1) // per + 1}
+
+    def users(self, password_hash: str) -> Iterator[Dict[str, Any]]:
+        roles, weights = zip(*ROLE_WEIGHTS)
+        for index in range(1, self.scale.users + 1):
+            role = self.rng.choices(roles, weights)[0]
+            self.roles.append(role)
+            yield {
+                "id": index,
+                "cpf": f"{index:011d}",
+                "email": f"user{index}@example.edu",
+                "password_hash": password_hash,
+                "course_id": self.rng.randint(1, self.courses),
+                "role": role,
+                "validated": self.rng.random() < 0.9,
+                "created_at": _timestamp(self.rng),
+            }
+
+    def _moderators(self) -> List[int]:
+        return [index + 1 for index, role in enumerate(self.roles) if role == "MODERATOR"] or [1]
+
+    def reviews(self) -> Iterator[Dict[str, Any]]:
+        types, weights = zip(*TARGET_WEIGHTS.items())
+        moderators = self._moderators()
+        review_id = 0
+        for user_id in range(1, self.scale.users + 1):
+            seen = set()
+            for _ in range(self.scale.reviews_per_user):
+                target_type = self.rng.choices(types, weights)[0]
+                target = (target_type, self.rng.randint(1, self.target_counts[target_type]))
+                if target in seen:
+                    continue
+                seen.add(target)
+                review_id += 1
+                created_at = _timestamp(self.rng)
+                # Skew scores per target so leaderboards have a spread to rank.
+                bias = (target[1] * 7919) % 5 - 2
+                row: Dict[str, Any] = {
+                    "id": review_id,
+                    "user_id": user_id,
+                    "target_type": target_type,
+                    "text": _sentence(self.rng, 8, 60),
+                    "approved": False,
+                    "created_at": created_at,
+                    "resolved_by": None,
+                    "resolved_at": None,
+                    **{column: None for column in TARGET_COLUMNS.values()},
+                    **{name: None for names in TARGET_SCORES.values() for name in names},
+                }
+                row[TARGET_COLUMNS[target_type]] = target[1]
+                for name in TARGET_SCORES[target_type]:
+                    row[name] = min(5, max(1, round(self.rng.gauss(3.2 + bias * 0.4, 1.0))))
+                outcome = self.rng.random()
+                if outcome < self.scale.approved_share:
+                    row.update(approved=True, resolved_by=self.rng.choice(moderators))
+                    row["resolved_at"] = created_at + timedelta(hours=self.rng.randint(1, 72))
+                    self.approved_reviews.append((review_id, created_at))
+                elif outcome < (1 + self.scale.approved_share) / 2:
+                    row.update(resolved_by=self.rng.choice(moderators))
+                    row["resolved_at"] = created_at + timedelta(hours=self.rng.randint(1, 72))
+                yield row
+
+    def comments(self) -> Iterator[Dict[str, Any]]:
+        rate = self.scale.comments_per_review
+        for review_id, created_at in self.approved_reviews:
+            for _ in range(int(self.rng.expovariate(1 / rate)) if rate > 0 else 0):
+                user_id = self.rng.randint(1, self.scale.users)
+                yield {
+                    "user_id": user_id,
+                    "review_id": review_id,
+                    "text": _sentence(self.rng, 4, 30),
+                    "is_official": self.roles[user_id - 1] in OFFICIAL_ROLES,
+                    "created_at": created_at + timedelta(hours=self.rng.randint(1, 500)),
+                }
+
+    def change_requests(self) -> Iterator[Dict[str, Any]]:
+        types, weights = zip(*TARGET_WEIGHTS.items())
+        moderators = self._moderators()
+        for index in range(1, self.scale.change_requests + 1):
+            target_type = self.rng.choices(types, weights)[0]
+            status = self.rng.choices(("PENDING", "APPROVED", "REJECTED"), (0.5, 0.3, 0.2))[0]
+            created_at = _timestamp(self.rng)
+            row: Dict[str, Any] = {
+                "target_type": target_type,
+                "suggested_data": {"name": f"Corrected name {index}"},
+                "status": status,
+                "created_by": self.rng.randint(1, self.scale.users),
+                "created_at": created_at,
+                "resolved_by": None if status == "PENDING" else self.rng.choice(moderators),
+                "resolved_at": None if status == "PENDING" else created_at + timedelta(days=1),
+                "from_official_source": self.rng.random() < 0.1,
+                **{column: None for column in TARGET_COLUMNS.values()},
+            }
+            row[TARGET_COLUMNS[target_type]] = self.rng.randint(
+                1, self.target_counts[target_type]
+            )
+            yield row
+
+
+def generate(
+    engine: Any,
+    scale: Scale,
+    seed: int = 0,
+    batch_size: int = 10_000,
+    password: str = "benchmark-password",
+) -> Dataset:
+    """Fill an empty, migrated database at ``engine`` and return what was generated."""
+    from passlib.hash import bcrypt
+    from sqlmodel import Session
+
+    from app.database.search_index import deferred_catalogue_search
+    from app.core.config import settings
+    from app.models import (
+        ChangeRequest,
+        Comment,
+        Course,
+        Institution,
+        Professor,
+        Review,
+        Subject,
+        User,
+    )
+    from app.services.rankings import RankingRefresher
+    from app.services.ratings import rebuild_rating_aggregates
+    from app.services.trends import rebuild_rating_rollups
+
+    started = time.perf_counter()
+    generator = _Generator(scale, seed)
+    # One cheap hash shared by every user keeps generation fast and logins possible.
+    password_hash = bcrypt.using(rounds=4).hash(password)
+    plan = [
+        ("institution", Institution, generator.institutions()),
+        ("course", Course, generator.courses_rows()),
+        ("professor", Professor, generator.professors_rows()),
+        ("subject", Subject, generator.subjects_rows()),
+        ("user", User, generator.users(password_hash)),
+        ("review", Review, generator.reviews()),
+        ("comment", Comment, generator.comments()),
+        ("change_request", ChangeRequest, generator.change_requests()),
+    ]
+    dataset = Dataset(scale=scale, seed=seed)
+    for name, model, rows in plan:
+        count = 0
+        for batch in _batched(rows, batch_size):
+            with engine.begin() as connection:
+                if model in (Institution, Course, Professor, Subject):
+                    with deferred_catalogue_search(connection):
+                        connection.execute(model.__table__.insert(), batch)
+                else:
+                    connection.execute(model.__table__.insert(), batch)
+            count += len(batch)
+        dataset.counts[name] = count
+
+    with Session(engine) as session:
+        rebuild_rating_aggregates(session)
+        rebuild_rating_rollups(session)
+        session.commit()
+    RankingRefresher(engine, settings.ranking_prior_weight).refresh()
+    dataset.seconds = time.perf_counter() - started
+    return dataset
+
+
+def build_database(path: Path, scale: Scale, seed: int = 0) -> Dataset:
+    """Create ``path`` from scratch, migrate it and fill it; call before importing ``app``."""
+    for stale in path.parent.glob(path.name + "*"):
+        stale.unlink()
+    use_database(path)
+    from app.database.session import get_engine, init_db
+
+    init_db()
+    return generate(get_engine(), scale, seed)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", type=Path, required=True)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    dataset = build_database(args.database, SCALES[args.scale], args.seed)
+    for name, count in dataset.counts.items():
+        print(f"{name:<16} {count:>10,}")
+    print(f"generated in {dataset.seconds:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
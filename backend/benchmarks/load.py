@@ -0,0 +1,318 @@
+"""In-process ASGI load driver with per-endpoint latency percentiles and JSON results.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.load --scale small --requests 5000 --concurrency 16 \
+        --output results/head.json
+    python -m benchmarks.load --scale small --requests 5000 --compare results/head.json
+
+A synthetic dataset (see ``benchmarks.datagen``) is generated into a temporary
+database unless ``--database`` points at an existing one. Requests follow a weighted
+mix of browse and search endpoints with ids drawn from the dataset; ``--write-share``
+adds authenticated comment submissions. ``--set name=value`` overrides settings
+(e.g. ``--set fast_serialization=true``) so modes can be compared on one commit, and
+``--output`` / ``--compare`` record and diff results between commits.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.common import percentile, use_database
+from benchmarks.datagen import SCALES, Dataset, Scale, build_database
+
+QUIET_ENV = {
+    "sql_instrumentation": "false",
+    "job_workers": "0",
+    "ranking_refresh_seconds": "0",
+    "auth_ephemeral_secret": "true",
+    "rate_limit_enabled": "false",
+}
+
+Request = Tuple[str, str, str, Optional[Dict[str, Any]]]  # endpoint, method, path, json
+
+
+def read_mix(dataset: Dataset, rng: random.Random) -> List[Tuple[float, Callable[[], Request]]]:
+    """Weighted request factories for anonymous browsing traffic."""
+    counts = dataset.counts
+    types = ("INSTITUTION", "COURSE", "PROFESSOR", "SUBJECT")
+    sizes = dict(zip(types, (counts["institution"], counts["course"], counts["professor"],
+                             counts["subject"])))
+    queries = ("algorithms", "calculus", "silva", "databases", "universidade", "physics")
+    text_queries = ("feedback", "exam fair", "workload", "didatica", "projeto laboratorio")
+
+    def target() -> Tuple[str, int]:
+        target_type = rng.choices(types, (1, 2, 4, 3))[0]
+        return target_type, rng.randint(1, sizes[target_type])
+
+    def feed() -> Request:
+        target_type, target_id = target()
+        path = f"/api/v1/reviews?target_type={target_type}&target_id={target_id}&limit=20"
+        return "reviews.feed", "GET", path, None
+
+    def thread() -> Request:
+        path = f"/api/v1/reviews/{rng.randint(1, counts['review'])}/comments"
+        return "reviews.thread", "GET", path, None
+
+    def ratings() -> Request:
+        target_type, target_id = target()
+        return "ratings", "GET", f"/api/v1/ratings/{target_type}/{target_id}", None
+
+    def course() -> Request:
+        return "catalogue.course", "GET", f"/api/v1/courses/{rng.randint(1, sizes['COURSE'])}", None
+
+    def children() -> Request:
+        kind = rng.choice(("professors", "subjects"))
+        path = f"/api/v1/courses/{rng.randint(1, sizes['COURSE'])}/{kind}"
+        return "catalogue.children", "GET", path, None
+
+    def leaderboard() -> Request:
+        target_type = rng.choice(("PROFESSOR", "SUBJECT", "COURSE"))
+        return "rankings", "GET", f"/api/v1/rankings/{target_type}?limit=20", None
+
+    def search() -> Request:
+        return "search.catalogue", "GET", f"/api/v1/search?q={rng.choice(queries)}", None
+
+    def search_text() -> Request:
+        path = f"/api/v1/search/reviews?q={rng.choice(text_queries)}"
+        return "search.reviews", "GET", path, None
+
+    return [
+        (30, feed),
+        (10, thread),
+        (15, ratings),
+        (10, course),
+        (15, children),
+        (5, leaderboard),
+        (10, search),
+        (5, search_text),
+    ]
+
+
+def _tokens(dataset: Dataset, count: int) -> List[Dict[str, str]]:
+    from app.auth.tokens import ACCESS_TOKEN, Principal, issue_token
+    from app.core.config import settings
+    from app.models.enums import UserRole
+
+    users = range(1, min(count, dataset.counts["user"]) + 1)
+    return [
+        {
+            "Authorization": "Bearer "
+            + issue_token(Principal(user_id, UserRole.STUDENT, True), ACCESS_TOKEN, settings)
+        }
+        for user_id in users
+    ]
+
+
+def summarize(
+    latencies: List[float], errors: int, seconds: Optional[float] = None
+) -> Dict[str, float]:
+    """Latency percentiles in milliseconds (and throughput when ``seconds`` is given)."""
+    summary = {
+        "requests": len(latencies),
+        "errors": errors,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p90_ms": percentile(latencies, 0.90) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies, default=0.0) * 1000,
+    }
+    if seconds is not None:
+        summary["seconds"] = seconds
+        summary["rps"] = len(latencies) / seconds if seconds else 0.0
+    return summary
+
+
+async def run_load(
+    application: Any,
+    dataset: Dataset,
+    requests: int,
+    concurrency: int,
+    write_share: float = 0.0,
+    warmup: int = 200,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Drive ``application`` in-process and return overall and per-endpoint statistics."""
+    rng = random.Random(seed)
+    mix = read_mix(dataset, rng)
+    weights = [weight for weight, _ in mix]
+    factories = [factory for _, factory in mix]
+    headers = _tokens(dataset, 500) if write_share > 0 else []
+
+    def next_request() -> Tuple[Request, Optional[Dict[str, str]]]:
+        if write_share > 0 and rng.random() < write_share:
+            review_id = rng.randint(1, dataset.counts["review"])
+            body = {"text": "Load test comment"}
+            request = ("comments.create", "POST", f"/api/v1/reviews/{review_id}/comments", body)
+            return request, rng.choice(headers)
+        return rng.choices(factories, weights)[0](), None
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    statuses: Dict[int, int] = defaultdict(int)
+
+    transport = httpx.ASGITransport(app=application)
+    async with application.router.lifespan_context(application):
+        async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+            for _ in range(warmup):
+                (_, method, path, body), extra = next_request()
+                await client.request(method, path, json=body, headers=extra)
+
+            remaining = iter(range(requests))
+
+            async def worker() -> None:
+                for _ in remaining:
+                    (endpoint, method, path, body), extra = next_request()
+                    began = time.perf_counter()
+                    response = await client.request(method, path, json=body, headers=extra)
+                    latencies[endpoint].append(time.perf_counter() - began)
+                    statuses[response.status_code] += 1
+                    # 404s are expected for the few drawn reviews that are not approved.
+                    if response.status_code >= 400 and response.status_code != 404:
+                        errors[endpoint] += 1
+
+            began = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - began
+
+    everything = [value for values in latencies.values() for value in values]
+    return {
+        "overall": summarize(everything, sum(errors.values()), elapsed),
+        "endpoints": {
+            endpoint: summarize(values, errors[endpoint])
+            for endpoint, values in sorted(latencies.items())
+        },
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+def _git_revision() -> Dict[str, Any]:
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=False
+        ).stdout.strip()
+
+    return {"commit": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain"))}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print per-endpoint percentile changes of ``current`` against ``baseline``."""
+
+    def change(new: float, old: float) -> str:
+        return f"{(new - old) / old * 100:+7.1f}%" if old else "    n/a"
+
+    print(f"\nvs {baseline['meta'].get('git', {}).get('commit') or 'baseline'}")
+    print(f"{'endpoint':<20} {'p50 ms':>9} {'Δp50':>8} {'p95 ms':>9} {'Δp95':>8}")
+    rows = [("overall", current["overall"], baseline["overall"])] + [
+        (name, stats, baseline["endpoints"][name])
+        for name, stats in current["endpoints"].items()
+        if name in baseline["endpoints"]
+    ]
+    for name, new, old in rows:
+        print(
+            f"{name:<20} {new['p50_ms']:>9.2f} {change(new['p50_ms'], old['p50_ms'])} "
+            f"{new['p95_ms']:>9.2f} {change(new['p95_ms'], old['p95_ms'])}"
+        )
+    old_rps, new_rps = baseline["overall"]["rps"], current["overall"]["rps"]
+    print(f"throughput {new_rps:.1f} req/s ({change(new_rps, old_rps).strip()})")
+
+
+def _print(result: Dict[str, Any]) -> None:
+    print(f"{'endpoint':<20} {'count':>7} {'err':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    rows = list(result["endpoints"].items()) + [("overall", result["overall"])]
+    for name, stats in rows:
+        print(
+            f"{name:<20} {stats['requests']:>7} {stats['errors']:>5} {stats['p50_ms']:>8.2f} "
+            f"{stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+        )
+    print(f"throughput {result['overall']['rps']:.1f} req/s, statuses {result['statuses']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database", type=Path, help="reuse a database generated by datagen")
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--write-share", type=float, default=0.0)
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results to compare against")
+    args = parser.parse_args()
+
+    overrides = dict(item.split("=", 1) for item in args.set)
+    os.environ.update({**QUIET_ENV, **overrides})
+    with tempfile.TemporaryDirectory() as directory:
+        scale: Scale = SCALES[args.scale]
+        if args.database is not None and args.database.exists():
+            use_database(args.database)
+            from app.database.session import get_engine
+            from sqlalchemy import func, select
+
+            from app.models import Comment, Course, Institution, Professor, Review, Subject, User
+
+            with get_engine().connect() as connection:
+                counts = {
+                    model.__table__.name: connection.execute(
+                        select(func.count()).select_from(model.__table__)
+                    ).scalar()
+                    for model in (Institution, Course, Professor, Subject, User, Review, Comment)
+                }
+            dataset = Dataset(scale=scale, seed=args.seed, counts=counts)
+        else:
+            database = args.database or Path(directory) / "load.db"
+            dataset = build_database(database, scale, args.seed)
+
+        from app.main import create_app
+
+        result = asyncio.run(
+            run_load(
+                create_app(),
+                dataset,
+                args.requests,
+                args.concurrency,
+                write_share=args.write_share,
+                warmup=args.warmup,
+                seed=args.seed,
+            )
+        )
+
+    result["meta"] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "dataset": dataset.as_dict(),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "write_share": args.write_share,
+        "settings": overrides,
+    }
+    _print(result)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2, sort_keys=True))
+    if args.compare:
+        compare(result, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
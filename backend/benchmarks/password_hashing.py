@@ -0,0 +1,91 @@
+"""Measure login throughput of the password hashing pool and event-loop responsiveness.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.password_hashing --logins 200 --concurrency 32 --rounds 12
+
+Reports logins per second overall and per worker, the worst event-loop stall while
+the pool is saturated, and how many submissions admission control turned away.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+PASSWORD = "correct horse battery staple"
+
+
+async def _ticker(stop: asyncio.Event, interval: float, lags: list) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from app.auth.passwords import PasswordHasher, PasswordHasherBusy
+    from app.core.config import Settings
+
+    settings = Settings(
+        password_bcrypt_rounds=args.rounds,
+        password_hash_workers=args.workers,
+        password_hash_executor=args.executor,
+        password_hash_queue_limit=args.queue_limit,
+    )
+    hasher = PasswordHasher(settings)
+    stored = await hasher.hash(PASSWORD)
+
+    outdated = PasswordHasher(Settings(password_bcrypt_rounds=max(4, args.rounds - 2)))
+    old_hash = await outdated.hash(PASSWORD)
+    valid, replacement = await hasher.verify(PASSWORD, old_hash)
+    outdated.shutdown()
+    print(f"rehash on login: valid={valid} rehashed={replacement is not None}")
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    rejected = 0
+
+    async def login(index: int) -> None:
+        nonlocal rejected
+        async with semaphore:
+            try:
+                attempt = "wrong" if index % 5 == 0 else PASSWORD
+                await hasher.verify(attempt, stored)
+            except PasswordHasherBusy:
+                rejected += 1
+
+    stop = asyncio.Event()
+    lags: list = []
+    ticker = asyncio.create_task(_ticker(stop, 0.005, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(login(index) for index in range(args.logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    hasher.shutdown()
+
+    completed = args.logins - rejected
+    print(
+        f"executor={args.executor} workers={hasher.workers} rounds={args.rounds} "
+        f"cores={os.cpu_count()}"
+    )
+    print(
+        f"logins={completed} in {elapsed:.2f}s -> {completed / elapsed:.1f}/s, "
+        f"{completed / elapsed / hasher.workers:.1f}/s per worker; rejected={rejected}"
+    )
+    print(f"max event-loop stall {max(lags, default=0) * 1000:.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--queue-limit", type=int, default=64)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
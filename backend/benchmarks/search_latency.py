@@ -0,0 +1,135 @@
+"""Check catalogue search latency against a large synthetic catalogue.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.search_latency --rows 1000000 --target-p99-ms 20
+
+Exits with status 1 when the measured p99 exceeds the target.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import percentile, use_database
+
+FIRST_NAMES = [
+    "João", "José", "Antônio", "Francisco", "Luís", "Sebastião", "Gonçalo", "Mário",
+    "Maria", "Ana", "Márcia", "Cecília", "Conceição", "Inês", "Lúcia", "Fátima",
+]
+SURNAMES = [
+    "Silva", "Souza", "Araújo", "Gonçalves", "Magalhães", "Assunção", "Patrício", "Simões",
+    "Conceição", "Estêvão", "Brandão", "Romão", "Falcão", "Guimarães", "Cortês", "Nóbrega",
+]
+SUBJECTS = [
+    "Cálculo", "Álgebra Linear", "Física Experimental", "Química Orgânica", "Programação",
+    "Estatística", "Economia Política", "Introdução à Computação", "Genética", "Anatomia",
+    "Didática", "História do Brasil", "Geometria Analítica", "Métodos Numéricos",
+]
+COURSES = [
+    "Ciência da Computação", "Engenharia Elétrica", "Medicina", "Direito", "Administração",
+    "Pedagogia", "Física", "Matemática", "Química", "Ciências Econômicas", "Psicologia",
+]
+QUERIES = [
+    "joao silva", "conceicao", "calc", "algebra lin", "magalhaes", "engenharia", "fisica exp",
+    "sebastiao", "medic", "ines", "gonçalves", "universidade federal", "program", "estatis",
+]
+
+
+def _person(index: int) -> str:
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    middle = SURNAMES[(index // len(FIRST_NAMES)) % len(SURNAMES)]
+    last = SURNAMES[(index // (len(FIRST_NAMES) * len(SURNAMES))) % len(SURNAMES)]
+    return f"{first} {middle} {last} {index}"
+
+
+def _seed(engine, rows: int) -> None:
+    from app.models import Course, Institution, Professor, Subject
+
+    institutions = max(1, rows // 1000)
+    courses_per_institution = 10
+    courses = institutions * courses_per_institution
+    remaining = max(0, rows - institutions - courses)
+    per_course = max(1, remaining // (2 * courses))
+
+    with engine.begin() as connection:
+        connection.execute(
+            Institution.__table__.insert(),
+            [{"id": i + 1, "name": f"Universidade Federal {i + 1}"} for i in range(institutions)],
+        )
+        connection.execute(
+            Course.__table__.insert(),
+            [
+                {
+                    "id": c + 1,
+                    "name": f"{COURSES[c % len(COURSES)]} {c + 1}",
+                    "institution_id": c // courses_per_institution + 1,
+                }
+                for c in range(courses)
+            ],
+        )
+    counter = itertools.count()
+    for first_course in range(0, courses, 500):
+        batch = range(first_course + 1, min(courses, first_course + 500) + 1)
+        with engine.begin() as connection:
+            connection.execute(
+                Professor.__table__.insert(),
+                [
+                    {"name": _person(next(counter)), "course_id": course_id}
+                    for course_id in batch
+                    for _ in range(per_course)
+                ],
+            )
+            connection.execute(
+                Subject.__table__.insert(),
+                [
+                    {"name": f"{SUBJECTS[k % len(SUBJECTS)]} {k}", "course_id": course_id}
+                    for course_id in batch
+                    for k in range(per_course)
+                ],
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--target-p99-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        use_database(Path(directory) / "search.db")
+        from sqlmodel import Session
+
+        from app.database.session import engine, init_db
+        from app.services.search import search_catalogue
+
+        init_db()
+        began = time.perf_counter()
+        _seed(engine, args.rows)
+        print(f"seeded ~{args.rows} catalogue rows in {time.perf_counter() - began:.1f}s")
+
+        randomizer = random.Random(7)
+        latencies = []
+        with Session(engine) as session:
+            for _ in range(args.queries):
+                query = randomizer.choice(QUERIES)
+                began = time.perf_counter()
+                search_catalogue(session, query, limit=20)
+                latencies.append((time.perf_counter() - began) * 1000)
+        engine.dispose()
+
+    p50, p95, p99 = (percentile(latencies, q) for q in (0.50, 0.95, 0.99))
+    print(f"queries={args.queries} p50={p50:.2f}ms p95={p95:.2f}ms p99={p99:.2f}ms")
+    if p99 > args.target_p99_ms:
+        print(f"FAIL: p99 {p99:.2f}ms exceeds target {args.target_p99_ms:.2f}ms")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Track per-item cost of turning database rows into JSON response bodies.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.serialization --items 500 --repeat 20
+
+For reviews, comments and courses it times three paths, in microseconds per item:
+
+* ``orm``: ORM entities -> ``from_orm`` -> ``jsonable_encoder`` -> ``json.dumps``
+  (the default FastAPI path before slim schemas);
+* ``rows``: tuple rows -> slim dicts -> ``response_model`` validation ->
+  ``jsonable_encoder`` -> ``json.dumps`` (slim fetch, default rendering);
+* ``fast``: tuple rows -> slim dicts -> ``orjson.dumps`` (``fast_serialization``).
+
+``--http`` also drives the review feed end to end with ``fast_serialization`` off and on.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import drive, seed_review_feed, use_database
+
+
+def _best(function: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _seed_comments(engine: Any, review_id: int, count: int) -> None:
+    from app.models import Comment
+
+    started = datetime(2024, 6, 1)
+    with engine.begin() as connection:
+        connection.execute(
+            Comment.__table__.insert(),
+            [
+                {
+                    "user_id": 1 + index % 10,
+                    "review_id": review_id,
+                    "text": f"Comment {index} on the review thread",
+                    "is_official": index % 7 == 0,
+                    "created_at": started + timedelta(seconds=index),
+                }
+                for index in range(count)
+            ],
+        )
+
+
+def _micro(args: argparse.Namespace) -> None:
+    import orjson
+    from fastapi.encoders import jsonable_encoder
+    from pydantic import parse_obj_as
+    from sqlmodel import Session, select
+
+    from app.database.session import engine
+    from app.models import Comment, Course, Review
+    from app.schemas.comment import CommentRead, CommentReadSlim
+    from app.schemas.course import CourseRead, CourseReadSlim
+    from app.schemas.review import ReviewRead, ReviewReadSlim
+
+    cases = [
+        ("review", Review, ReviewRead, ReviewReadSlim),
+        ("comment", Comment, CommentRead, CommentReadSlim),
+        ("course", Course, CourseRead, CourseReadSlim),
+    ]
+    print(f"{'entity':<8} {'path':<5} {'fetch us':>9} {'encode us':>10} {'total us':>9}")
+    for label, model, schema, slim in cases:
+        table = model.__table__
+        orm_statement = select(model).order_by(table.c.id).limit(args.items)
+        row_statement = slim.select(table).order_by(table.c.id).limit(args.items)
+
+        def fetch_orm() -> List[Any]:
+            with Session(engine) as session:
+                return list(session.execute(orm_statement).scalars())
+
+        def fetch_rows() -> List[Dict[str, Any]]:
+            with engine.connect() as connection:
+                return slim.dicts(connection.execute(row_statement))
+
+        entities, dicts = fetch_orm(), fetch_rows()
+        count = len(dicts)
+        model_type = List[schema]
+        paths = {
+            "orm": (
+                fetch_orm,
+                lambda: json.dumps(jsonable_encoder([schema.from_orm(e) for e in entities])),
+            ),
+            "rows": (
+                fetch_rows,
+                lambda: json.dumps(jsonable_encoder(parse_obj_as(model_type, dicts))),
+            ),
+            "fast": (fetch_rows, lambda: orjson.dumps(dicts)),
+        }
+        for path, (fetch, encode) in paths.items():
+            fetch_us = _best(fetch, args.repeat) / count * 1e6
+            encode_us = _best(encode, args.repeat) / count * 1e6
+            print(
+                f"{label:<8} {path:<5} {fetch_us:>9.2f} {encode_us:>10.2f} "
+                f"{fetch_us + encode_us:>9.2f}"
+            )
+
+
+def _worker(args: argparse.Namespace) -> None:
+    use_database(args.database)
+    os.environ["fast_serialization"] = "true" if args.worker == "fast" else "false"
+    os.environ["sql_instrumentation"] = "false"
+    from app.main import create_app
+
+    path = f"/api/v1/reviews?target_type=COURSE&target_id=1&limit={min(args.items, 100)}"
+    result = asyncio.run(drive(create_app(), [path], args.requests, args.concurrency))
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--http", action="store_true", help="also benchmark the review feed")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--worker", choices=["default", "fast"], help=argparse.SUPPRESS)
+    parser.add_argument("--database", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker(args)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "bench.db"
+        use_database(database)
+        os.environ["sql_instrumentation"] = "false"
+        from app.database.session import engine, init_db
+
+        init_db()
+        seed_review_feed(engine, courses=max(1, args.items // 10), reviews_per_course=args.items)
+        _seed_comments(engine, review_id=1, count=args.items)
+        _micro(args)
+        if not args.http:
+            return
+
+        print(f"\n{'feed':<8} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+        for mode in ("default", "fast"):
+            # Each mode runs in a fresh interpreter so settings are read at import.
+            output = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.serialization",
+                    "--worker", mode,
+                    "--database", str(database),
+                    "--items", str(args.items),
+                    "--requests", str(args.requests),
+                    "--concurrency", str(args.concurrency),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{mode:<8} {result['rps']:>9.1f} {result['p50_ms']:>8.2f} "
+                f"{result['p95_ms']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
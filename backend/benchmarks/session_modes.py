@@ -0,0 +1,93 @@
+"""Compare request throughput of sync and async database sessions.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.session_modes --requests 2000 --concurrency 10
+
+Keep ``--concurrency`` within the sync engine's connection pool, otherwise the
+sync run stalls waiting for connections held by queued threadpool work.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import drive, seed_review_feed, use_database
+
+ROUTERS = ["ratings", "reviews"]
+
+
+def _paths(courses: int) -> list:
+    paths = []
+    for course_id in range(1, courses + 1):
+        paths.append(f"/api/v1/reviews?target_type=COURSE&target_id={course_id}&limit=20")
+        paths.append(f"/api/v1/ratings/COURSE/{course_id}")
+    return paths
+
+
+def _worker(args: argparse.Namespace) -> None:
+    use_database(args.database)
+    os.environ["async_session_routers"] = json.dumps(ROUTERS if args.worker == "async" else [])
+    from app.main import create_app
+
+    result = asyncio.run(drive(create_app(), _paths(args.courses), args.requests, args.concurrency))
+    print(json.dumps(result))
+
+
+def _seed(database: Path, courses: int, reviews: int) -> None:
+    use_database(database)
+    from app.database.rebuild_ratings import run as rebuild_ratings
+    from app.database.session import engine, init_db
+
+    init_db()
+    seed_review_feed(engine, courses, reviews)
+    rebuild_ratings()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courses", type=int, default=20)
+    parser.add_argument("--reviews", type=int, default=500, help="reviews per course")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--worker", choices=["sync", "async"], help=argparse.SUPPRESS)
+    parser.add_argument("--database", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker(args)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "bench.db"
+        _seed(database, args.courses, args.reviews)
+        print(f"{'mode':<6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+        for mode in ("sync", "async"):
+            # Each mode runs in a fresh interpreter so router selection happens at import.
+            output = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.session_modes",
+                    "--worker", mode,
+                    "--database", str(database),
+                    "--courses", str(args.courses),
+                    "--requests", str(args.requests),
+                    "--concurrency", str(args.concurrency),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{mode:<6} {result['rps']:>9.1f} {result['p50_ms']:>8.2f} "
+                f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['errors']:>6.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Measure mixed read/write throughput of the default and production SQLite profiles.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --writers 2 --seconds 5
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+from sqlalchemy import create_engine, exc
+from sqlmodel import SQLModel
+
+from app.core.config import Settings
+from app.database.sqlite import configure_engine, engine_options
+from app.models import Comment, ReviewTargetType
+from app.services.reviews import approved_reviews_statement
+from benchmarks.common import seed_review_feed
+
+
+def _run_profile(directory: Path, production: bool, args: argparse.Namespace) -> Dict[str, float]:
+    path = directory / ("production.db" if production else "default.db")
+    url = f"sqlite:///{path}"
+    settings = Settings(sqlite_file=path, sqlite_production_profile=production)
+    engine = configure_engine(create_engine(url, **engine_options(url, settings)), url, settings)
+    SQLModel.metadata.create_all(engine)
+    course_ids = seed_review_feed(engine, args.courses, args.reviews)
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+
+    def record(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def reader(offset: int) -> None:
+        index = offset
+        while time.perf_counter() < deadline:
+            course_id = course_ids[index % len(course_ids)]
+            statement = approved_reviews_statement(ReviewTargetType.COURSE, course_id, None, 20)
+            try:
+                with engine.connect() as connection:
+                    connection.execute(statement).fetchall()
+                record("reads")
+            except exc.OperationalError:
+                record("errors")
+            index += 1
+
+    def writer(offset: int) -> None:
+        index = offset
+        while time.perf_counter() < deadline:
+            try:
+                with engine.begin() as connection:
+                    connection.execute(
+                        Comment.__table__.insert(),
+                        {
+                            "user_id": 1,
+                            "review_id": 1 + index % args.reviews,
+                            "text": "bench",
+                            "is_official": False,
+                            "created_at": datetime.utcnow(),
+                        },
+                    )
+                record("writes")
+            except exc.OperationalError:
+                record("errors")
+            index += 1
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(args.readers)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(args.writers)]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    engine.dispose()
+    return {
+        "reads_per_s": counts["reads"] / elapsed,
+        "writes_per_s": counts["writes"] / elapsed,
+        "errors": counts["errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--courses", type=int, default=20)
+    parser.add_argument("--reviews", type=int, default=500, help="reviews per course")
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:.0f}s per profile")
+    print(f"{'profile':<11} {'reads/s':>9} {'writes/s':>9} {'errors':>7}")
+    with tempfile.TemporaryDirectory() as directory:
+        for production in (False, True):
+            result = _run_profile(Path(directory), production, args)
+            name = "production" if production else "default"
+            print(
+                f"{name:<11} {result['reads_per_s']:>9.1f} "
+                f"{result['writes_per_s']:>9.1f} {result['errors']:>7.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Track cold-start cost: module import time and time to the first HTTP response.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.startup --runs 5
+
+Each run starts a fresh interpreter. ``import`` reports ``python -X importtime -c
+"import app.main"`` summed per top-level package; ``first response`` times a worker
+from interpreter start through app import, lifespan startup and one ``GET /health``,
+against a fresh database (migrations applied) and an already migrated one (a single
+version-table read).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchmarks.common import use_database
+
+QUIET_ENV = {
+    "sql_instrumentation": "false",
+    "job_workers": "0",
+    "ranking_refresh_seconds": "0",
+    "auth_ephemeral_secret": "true",
+}
+
+
+def _environment(database: Path) -> Dict[str, str]:
+    return {**os.environ, **QUIET_ENV, "sqlite_file": str(database)}
+
+
+def _import_profile(database: Path) -> Tuple[float, Dict[str, float]]:
+    """Return total import milliseconds and self time per top-level package."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        env=_environment(database),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    packages: Dict[str, float] = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        packages[name.strip().split(".")[0]] += int(self_us) / 1000
+    return sum(packages.values()), packages
+
+
+def _worker(args: argparse.Namespace) -> None:
+    started = args.started
+    use_database(args.database)
+    os.environ.update(QUIET_ENV)
+    import httpx
+
+    from app.main import create_app
+
+    application = create_app()
+    imported = time.time()
+
+    async def first_response() -> Tuple[float, float]:
+        async with application.router.lifespan_context(application):
+            ready = time.time()
+            async with httpx.AsyncClient(app=application, base_url="http://bench") as client:
+                response = await client.get("/api/v1/health")
+                response.raise_for_status()
+            return ready, time.time()
+
+    ready, answered = asyncio.run(first_response())
+    print(
+        json.dumps(
+            {
+                "import_ms": (imported - started) * 1000,
+                "startup_ms": (ready - imported) * 1000,
+                "first_response_ms": (answered - started) * 1000,
+            }
+        )
+    )
+
+
+def _first_response(database: Path) -> Dict[str, float]:
+    output = subprocess.run(
+        [
+            sys.executable, "-m", "benchmarks.startup",
+            "--worker",
+            "--database", str(database),
+            "--started", repr(time.time()),
+        ],
+        env=_environment(database),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12, help="packages listed by import time")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--database", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--started", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker(args)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "bench.db"
+        totals: List[float] = []
+        packages: Dict[str, List[float]] = defaultdict(list)
+        for _ in range(args.runs):
+            total, profile = _import_profile(database)
+            totals.append(total)
+            for name, milliseconds in profile.items():
+                packages[name].append(milliseconds)
+        print(f"import app.main: median {statistics.median(totals):.1f} ms over {args.runs} runs")
+        ranked = sorted(packages.items(), key=lambda item: -statistics.median(item[1]))
+        for name, timings in ranked[: args.top]:
+            print(f"  {name:<24} {statistics.median(timings):>8.1f} ms")
+
+        print(f"\n{'database':<10} {'import ms':>10} {'startup ms':>11} {'first resp ms':>14}")
+        for label in ("fresh", "migrated"):
+            results = []
+            for _ in range(args.runs):
+                if label == "fresh":
+                    for path in Path(directory).glob("bench.db*"):
+                        path.unlink()
+                results.append(_first_response(database))
+            medians = {
+                key: statistics.median(result[key] for result in results) for key in results[0]
+            }
+            print(
+                f"{label:<10} {medians['import_ms']:>10.1f} {medians['startup_ms']:>11.1f} "
+                f"{medians['first_response_ms']:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()